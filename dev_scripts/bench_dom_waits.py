@@ -0,0 +1,73 @@
+"""
+Benchmark: WebDriverWait polling vs event-driven (MutationObserver) waits.
+
+Loads dev_scripts/fixtures/dom_waits/page.html, where the target becomes
+ready after a random delay, and measures how long after the change each
+wait returns (in-page clock, so both sides pay the same final round trip).
+
+PYTHONPATH=. python dev_scripts/bench_dom_waits.py --trials 30 [--headed]
+"""
+import argparse
+import pathlib
+import random
+import statistics
+import time
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+from jobpilot.browser.engine import build_driver
+from jobpilot.utils.waits import wait_for, wait_url_contains
+
+FIXTURE = pathlib.Path(__file__).parent / "fixtures" / "dom_waits" / "page.html"
+TARGET = (By.CSS_SELECTOR, "#target")
+CASES = {
+    # mode: (polling wait, event wait)
+    "insert": (lambda d: WebDriverWait(d, 10).until(EC.presence_of_element_located(TARGET)),
+               lambda d: wait_for(d, TARGET, "present", 10)),
+    "reveal": (lambda d: WebDriverWait(d, 10).until(EC.visibility_of_element_located(TARGET)),
+               lambda d: wait_for(d, TARGET, "visible", 10)),
+    "enable": (lambda d: WebDriverWait(d, 10).until(EC.element_to_be_clickable(TARGET)),
+               lambda d: wait_for(d, TARGET, "clickable", 10)),
+    "route": (lambda d: WebDriverWait(d, 10).until(EC.url_contains("#ready")),
+              lambda d: wait_url_contains(d, "#ready", 10)),
+}
+
+
+def lag_ms(driver, wait) -> float:
+    """ms between the page change and the wait returning."""
+    wait(driver)
+    return driver.execute_script("return performance.now() - window.__readyAt;")
+
+
+def main() -> None:
+    p = argparse.ArgumentParser()
+    p.add_argument("--trials", type=int, default=30)
+    p.add_argument("--headed", action="store_true")
+    args = p.parse_args()
+
+    rng = random.Random(3)
+    driver = build_driver(headless=not args.headed)
+    try:
+        for mode, (polling, event) in CASES.items():
+            lags = {"polling": [], "event": []}
+            start = time.perf_counter()
+            for _ in range(args.trials):
+                delay = rng.randint(50, 600)
+                for name, wait in (("polling", polling), ("event", event)):
+                    driver.get(f"{FIXTURE.as_uri()}?mode={mode}&delay={delay}")
+                    lags[name].append(lag_ms(driver, wait))
+            print(f"{mode:7s} ({args.trials} trials, {time.perf_counter() - start:.1f}s)")
+            for name, values in lags.items():
+                print(
+                    f"  {name:8s} median {statistics.median(values):6.1f} ms   "
+                    f"p90 {sorted(values)[int(0.9 * (len(values) - 1))]:6.1f} ms   "
+                    f"max {max(values):6.1f} ms"
+                )
+    finally:
+        driver.quit()
+
+
+if __name__ == "__main__":
+    main()
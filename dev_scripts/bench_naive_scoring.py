@@ -0,0 +1,72 @@
+"""
+Benchmark: per-job _score_naive loop vs batched JobMatcher.score_many.
+
+PYTHONPATH=. python dev_scripts/bench_naive_scoring.py --jobs 10000
+"""
+import argparse
+import random
+import time
+
+from jobpilot.models.job import JobPosting
+from jobpilot.services.matcher import JobMatcher
+
+SKILLS = [
+    "python", "selenium", "pytest", "sql", "aws", "docker", "kubernetes", "java",
+    "playwright", "api", "rest", "ci/cd", "jenkins", "git", "linux", "agile",
+    "automation", "testing", "qa", "sdet", "react", "typescript", "postgres", "etl",
+]
+FILLER = [
+    "the", "and", "with", "team", "experience", "years", "ability", "strong",
+    "work", "build", "our", "you", "will", "we", "to", "of", "in", "for",
+    "benefits", "company", "equal", "opportunity", "employer", "remote",
+]
+
+
+def synthetic_corpus(n: int, seed: int = 7) -> list[str]:
+    rng = random.Random(seed)
+    vocab = SKILLS + FILLER + [f"term{i}" for i in range(5000)]
+    return [" ".join(rng.choices(vocab, k=rng.randint(150, 600))) for _ in range(n)]
+
+
+def main() -> None:
+    p = argparse.ArgumentParser()
+    p.add_argument("--jobs", type=int, default=10_000)
+    args = p.parse_args()
+
+    descriptions = synthetic_corpus(args.jobs)
+    jobs = [
+        JobPosting(id=f"job{i}", title="QA", company="Acme", location="", url="",
+                   provider="dice", easy_apply=True, metadata={})
+        for i in range(args.jobs)
+    ]
+    rng = random.Random(11)
+    resume = " ".join(SKILLS + rng.choices(FILLER + [f"term{i}" for i in range(800)], k=700))
+    matcher = JobMatcher(resume_text=resume, use_llm=False)
+
+    # What _score_naive used to do: re-lowercase and re-split the resume per job
+    t0 = time.perf_counter()
+    for desc in descriptions:
+        resume_tokens = set(resume.lower().split())
+        len(resume_tokens & set(desc.lower().split()))
+    legacy_s = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    loop_results = [matcher._score_naive(job, desc) for job, desc in zip(jobs, descriptions)]
+    loop_s = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    batch_results = matcher.score_many(jobs, descriptions)
+    batch_s = time.perf_counter() - t0
+
+    mismatches = sum(
+        a.match_percent != b.match_percent for a, b in zip(loop_results, batch_results)
+    )
+    print(f"jobs={args.jobs} resume_terms={len(matcher._resume_split)}")
+    print(f"legacy loop       : {legacy_s * 1000:8.1f} ms")
+    print(f"per-job loop      : {loop_s * 1000:8.1f} ms")
+    print(f"score_many        : {batch_s * 1000:8.1f} ms  ({loop_s / batch_s:.2f}x)")
+    print(f"mismatched scores : {mismatches}")
+
+
+if __name__ == "__main__":
+    main()
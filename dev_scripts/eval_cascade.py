@@ -0,0 +1,110 @@
+"""
+Offline harness: how often does the scoring cascade agree with
+"always call the LLM" on a labelled fixture set?
+
+Each fixture line carries the LLM's verdict for that posting
+(llm_match_percent / llm_recommended), so no API calls are made. Jobs the
+cascade can't decide get the LLM verdict, exactly as at runtime.
+
+PYTHONPATH=. python dev_scripts/eval_cascade.py
+PYTHONPATH=. python dev_scripts/eval_cascade.py --reject 10 --accept 75 --strategy bm25
+PYTHONPATH=. python dev_scripts/eval_cascade.py --sweep
+"""
+import argparse
+import json
+import os
+
+from jobpilot.models.job import JobPosting
+from jobpilot.services.lexical import CorpusIndex
+from jobpilot.services.matcher import JobMatcher
+from jobpilot.services.skills import SkillExtractor
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def load_fixtures(path: str) -> list[dict]:
+    with open(path, "r", encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def evaluate(fixtures: list[dict], resume: str, strategy: str, reject: float, accept: float) -> dict:
+    index = CorpusIndex() if strategy == "bm25" else None
+    if index is not None:
+        # Warm the corpus stats with the whole set, like a matcher mid-season
+        for fx in fixtures:
+            index.add(fx["description"])
+
+    matcher = JobMatcher(
+        resume,
+        use_llm=False,
+        cheap_strategy=strategy,
+        corpus_index=index,
+        skill_extractor=SkillExtractor.load() if strategy == "skills" else None,
+        cascade={"reject_below": reject, "accept_above": accept},
+    )
+
+    agree = skipped = false_accept = false_reject = 0
+    for fx in fixtures:
+        job = JobPosting(id=fx["id"], title=fx["title"], company="", location="", url="",
+                         provider="fixture", easy_apply=True, metadata={})
+        cheap = matcher.score_cheap(job, fx["description"])
+        decided = matcher.cascade_decision(cheap)
+
+        if decided is None:
+            # Ambiguous band: the LLM runs, so the outcome is its label
+            recommended = fx["llm_recommended"]
+        else:
+            skipped += 1
+            recommended = decided.recommended
+            if recommended and not fx["llm_recommended"]:
+                false_accept += 1
+            if not recommended and fx["llm_recommended"]:
+                false_reject += 1
+
+        agree += recommended == fx["llm_recommended"]
+
+    n = len(fixtures)
+    return {
+        "reject_below": reject,
+        "accept_above": accept,
+        "jobs": n,
+        "llm_skipped": skipped,
+        "skip_rate": round(skipped / n, 3) if n else 0.0,
+        "agreement": round(agree / n, 3) if n else 0.0,
+        "false_accepts": false_accept,
+        "false_rejects": false_reject,
+    }
+
+
+def main() -> None:
+    p = argparse.ArgumentParser()
+    p.add_argument("--fixtures", default=os.path.join(HERE, "fixtures", "cascade_labels.jsonl"))
+    p.add_argument("--resume", default=os.path.join(HERE, "fixtures", "cascade_resume.txt"))
+    p.add_argument("--strategy", default="naive", choices=["naive", "bm25", "skills"])
+    p.add_argument("--reject", type=float, default=10.0)
+    p.add_argument("--accept", type=float, default=75.0)
+    p.add_argument("--sweep", action="store_true", help="grid over reject/accept bands")
+    args = p.parse_args()
+
+    fixtures = load_fixtures(args.fixtures)
+    with open(args.resume, "r", encoding="utf-8") as f:
+        resume = f.read()
+
+    if not args.sweep:
+        print(json.dumps(evaluate(fixtures, resume, args.strategy, args.reject, args.accept), indent=2))
+        return
+
+    print("reject accept  skip_rate agreement false_acc false_rej")
+    for reject in (0, 5, 10, 15, 20, 25):
+        for accept in (40, 50, 60, 75, 90, 101):
+            if reject > accept:
+                continue
+            r = evaluate(fixtures, resume, args.strategy, reject, accept)
+            print(
+                f"{reject:6.0f} {accept:6.0f} {r['skip_rate']:10.3f} {r['agreement']:9.3f} "
+                f"{r['false_accepts']:9d} {r['false_rejects']:9d}"
+            )
+
+
+if __name__ == "__main__":
+    main()
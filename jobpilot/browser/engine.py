@@ -1,9 +1,23 @@
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
+
+from jobpilot.browser.instrument import instrument as instrument_driver
 # from selenium.webdriver.chrome.service import Service
 # from webdriver_manager.chrome import ChromeDriverManager
 
-def build_driver(headless: bool = False):
+def build_driver(headless: bool = False, event_waits: bool | None = None, latency=None, instrument: bool = False):
+    """
+    Chrome WebDriver with the project defaults.
+
+    event_waits: page objects on this driver wait through DOM-mutation
+    scripts (jobpilot.utils.waits) instead of WebDriverWait polling;
+    None leaves it to JOBPILOT_EVENT_WAITS.
+    latency: a LatencyRecorder; page-object waits are timed into it and
+    take their timeouts from it.
+    instrument: count and time every WebDriver command per calling
+    page-object method (jobpilot.browser.instrument); the recorder is
+    `driver.jobpilot_commands`.
+    """
     opts = Options()
     if headless:
         opts.add_argument("--headless=new")
@@ -25,4 +39,10 @@ def build_driver(headless: bool = False):
     driver = webdriver.Chrome(options=opts)
     
     driver.implicitly_wait(0)
+    if event_waits is not None:
+        driver.jobpilot_event_waits = bool(event_waits)
+    if latency is not None:
+        driver.jobpilot_latency = latency
+    if instrument:
+        instrument_driver(driver)
     return driver
\ No newline at end of file
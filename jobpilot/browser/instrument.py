@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import re, sys, time
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+
+from jobpilot.utils.metrics import metrics
+
+# Frames skipped when attributing a command: Selenium itself, this module
+# and the shared wait helpers, so a command lands on the page-object
+# method that asked for it
+_PLUMBING = (
+    "selenium.",
+    "jobpilot.browser.instrument",
+    "jobpilot.utils.waits",
+    "jobpilot.providers.dice.pages.base_page",
+    "contextlib",
+    "functools",
+)
+
+# Selenium runs get_attribute / is_displayed as tagged scripts
+_SCRIPT_TAG = re.compile(r"^/\* (\w+) \*/")
+
+
+def command_name(command: str, params: Optional[dict]) -> str:
+    """The wire command, or the helper behind a tagged executeScript."""
+    if command in ("executeScript", "executeAsyncScript") and params:
+        tag = _SCRIPT_TAG.match(str(params.get("script", "")))
+        if tag:
+            return tag.group(1)
+    return command
+
+
+def call_site(depth: int = 2) -> str:
+    """
+    "ResultsPage._safe_text" for the nearest caller outside the plumbing
+    (module.function for plain functions).
+    """
+    frame = sys._getframe(depth)
+    while frame is not None:
+        module = frame.f_globals.get("__name__", "")
+        name = frame.f_code.co_name
+        if not module.startswith(_PLUMBING) and not name.startswith("<"):
+            owner = frame.f_locals.get("self") if frame.f_code.co_argcount else None
+            if owner is not None:
+                return f"{type(owner).__name__}.{name}"
+            return f"{module.rsplit('.', 1)[-1]}.{name}"
+        frame = frame.f_back
+    return "unknown"
+
+
+class CommandRecorder:
+    """
+    Every WebDriver command sent by one driver, counted and timed per
+    (call site, command). Element commands (text, click, ...) go through
+    the driver too, so they are included.
+    """
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        # (site, command) -> [count, seconds]
+        self.stats: Dict[Tuple[str, str], List[float]] = defaultdict(lambda: [0, 0.0])
+
+    def record(self, site: str, command: str, seconds: float) -> None:
+        entry = self.stats[(site, command)]
+        entry[0] += 1
+        entry[1] += seconds
+
+    def total(self) -> Tuple[int, float]:
+        return (
+            int(sum(count for count, _ in self.stats.values())),
+            sum(seconds for _, seconds in self.stats.values()),
+        )
+
+    def call_sites(self) -> List[dict]:
+        """Per call site: commands, seconds and the per-command split, slowest first."""
+        sites: Dict[str, dict] = {}
+        for (site, command), (count, seconds) in self.stats.items():
+            entry = sites.setdefault(site, {"site": site, "commands": 0, "seconds": 0.0, "by_command": {}})
+            entry["commands"] += int(count)
+            entry["seconds"] += seconds
+            entry["by_command"][command] = int(count)
+        return sorted(sites.values(), key=lambda e: (-e["seconds"], -e["commands"]))
+
+    def report(self, top: int = 15) -> str:
+        count, seconds = self.total()
+        lines = [f"[WebDriver] {count} commands, {seconds:.1f}s in round trips; top call sites:"]
+        for entry in self.call_sites()[:top]:
+            split = ", ".join(
+                f"{command} {n}" for command, n in sorted(entry["by_command"].items(), key=lambda kv: -kv[1])
+            )
+            lines.append(
+                f"  {entry['commands']:6d} cmds {entry['seconds']:8.2f}s  {entry['site']}  ({split})"
+            )
+        return "\n".join(lines)
+
+
+def instrument(driver, recorder: Optional[CommandRecorder] = None) -> CommandRecorder:
+    """
+    Route the driver's commands through a CommandRecorder. The driver's own
+    `execute` is wrapped in place rather than proxied, so isinstance checks,
+    WebDriverWait and WebElements keep working unchanged. The recorder is
+    also kept on the driver as `jobpilot_commands`.
+    """
+    existing = getattr(driver, "jobpilot_commands", None)
+    if existing is not None:
+        return existing
+    recorder = recorder or CommandRecorder()
+    send = driver.execute
+
+    def execute(command, params=None):
+        started = time.perf_counter()
+        try:
+            return send(command, params)
+        finally:
+            elapsed = time.perf_counter() - started
+            name = command_name(command, params)
+            recorder.record(call_site(), name, elapsed)
+            metrics.observe("webdriver_command", elapsed, command=name)
+
+    driver.execute = execute
+    driver.jobpilot_commands = recorder
+    return recorder
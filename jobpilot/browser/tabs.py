@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import time
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.support.ui import WebDriverWait
+
+
+class TabManager:
+    """
+    Long-lived worker tabs, grouped by role ("apply", "describe").
+
+    load(role, url) hands out an idle tab of that role and navigates it in
+    place; a new tab (window.open) is only created when every tab of the
+    role is busy, or the one we had was closed or crashed. release() makes
+    the tab available again. With reuse=False every load opens a new tab
+    and release closes it (the old open/close per job).
+
+    focus() skips switch_to.window when the driver is already on that tab,
+    so steps that re-focus their tab don't cost a round trip each.
+
+    Counts and timings are kept for summary(): tabs created vs reused,
+    recoveries, and the time saved by reusing instead of creating.
+    """
+
+    def __init__(self, driver, reuse: bool = True, open_timeout: float = 10) -> None:
+        self.driver = driver
+        self.reuse = bool(reuse)
+        self.open_timeout = float(open_timeout)
+        self.home: Optional[str] = None
+        self.current: Optional[str] = None
+        self.idle: Dict[str, List[str]] = defaultdict(list)
+        self.busy: Dict[str, str] = {}              # handle -> role
+        self.last_url: Dict[str, str] = {}          # handle -> url it was last sent to
+        self.leaving: Dict[str, str] = {}           # handle -> url a background load is replacing
+        self.counts: Dict[str, int] = defaultdict(int)
+        self.timings: Dict[str, List[float]] = defaultdict(list)
+
+    def _ensure_home(self) -> None:
+        if self.home is None:
+            self.home = self.current = self.driver.current_window_handle
+
+    def focus(self, handle: str) -> None:
+        """Make `handle` the driver's window (no round trip if it already is)."""
+        self._ensure_home()
+        if handle == self.current:
+            self.counts["switches_skipped"] += 1
+            return
+        self.driver.switch_to.window(handle)
+        self.current = handle
+        self.counts["switches"] += 1
+
+    def focus_home(self) -> None:
+        """Back to the window the manager started on (login/search live there)."""
+        self._ensure_home()
+        self.focus(self.home)
+
+    def load(self, role: str, url: str, background: bool = True) -> str:
+        """
+        A tab of `role` on its way to `url`; returns its handle.
+
+        background=True starts the navigation and returns (pair with
+        wait_navigated() before reading the page); False waits for the load
+        like driver.get(). A reused tab ends up focused, a new one only
+        when background=False.
+        """
+        self._ensure_home()
+        handle = self.idle[role].pop() if self.reuse and self.idle[role] else None
+        if handle is not None:
+            started = time.perf_counter()
+            try:
+                self.focus(handle)
+                if background:
+                    previous = self.last_url.get(handle)
+                    if previous and previous != url:
+                        self.leaving[handle] = previous
+                    self.driver.execute_script("window.location.href = arguments[0];", url)
+                else:
+                    self.driver.get(url)
+                self.timings["reuse"].append(time.perf_counter() - started)
+                self.counts["reused"] += 1
+            except WebDriverException as e:
+                # Closed, detached or crashed: drop it and start a fresh tab
+                print(f"[Tabs] Replacing broken {role} tab: {str(e).splitlines()[0] if str(e) else e!r}")
+                self._discard(handle)
+                self.counts["recovered"] += 1
+                handle = None
+        if handle is None:
+            handle = self._create(url if background else "about:blank")
+            if not background:
+                self.focus(handle)
+                self.driver.get(url)
+        self.busy[handle] = role
+        self.last_url[handle] = url
+        return handle
+
+    def _create(self, url: str) -> str:
+        started = time.perf_counter()
+        if self.current is None:
+            self.focus(self.home)
+        before = set(self.driver.window_handles)
+        self.driver.execute_script("window.open(arguments[0], '_blank');", url)
+        WebDriverWait(self.driver, self.open_timeout).until(lambda d: len(set(d.window_handles) - before) == 1)
+        handle = list(set(self.driver.window_handles) - before)[0]
+        self.timings["create"].append(time.perf_counter() - started)
+        self.counts["created"] += 1
+        return handle
+
+    def _discard(self, handle: str) -> None:
+        try:
+            if handle in self.driver.window_handles:
+                self.driver.switch_to.window(handle)
+                self.driver.close()
+                self.counts["closed"] += 1
+        except WebDriverException:
+            pass
+        self.busy.pop(handle, None)
+        self.last_url.pop(handle, None)
+        self.leaving.pop(handle, None)
+        self.current = None
+        try:
+            self.focus(self.home)
+        except WebDriverException:
+            pass
+
+    def wait_navigated(self, handle: str, timeout: float = 10) -> None:
+        """
+        After a background load into a reused tab: wait until the tab has
+        left the page it showed before, so page objects don't read the
+        previous job's DOM. Focuses the tab.
+        """
+        self.focus(handle)
+        previous = self.leaving.pop(handle, None)
+        if previous is None:
+            return
+        WebDriverWait(self.driver, timeout, poll_frequency=0.1).until(
+            lambda d: d.current_url.rstrip("/") != previous.rstrip("/")
+        )
+
+    def release(self, handle: str) -> None:
+        """Done with a tab: keep it for the next load of its role (or close it)."""
+        role = self.busy.pop(handle, None)
+        if self.reuse and role is not None:
+            self.idle[role].append(handle)
+            return
+        self.last_url.pop(handle, None)
+        self.leaving.pop(handle, None)
+        try:
+            if handle in self.driver.window_handles:
+                self.focus(handle)
+                self.driver.close()
+                self.counts["closed"] += 1
+            self.current = None
+            if self.home in self.driver.window_handles:
+                self.focus(self.home)
+        except WebDriverException:
+            self.current = None
+
+    def summary(self) -> Dict[str, float]:
+        """Tab churn for the run log, with the estimated time saved by reuse."""
+        out: Dict[str, float] = {k: self.counts[k] for k in (
+            "created", "reused", "recovered", "closed", "switches", "switches_skipped"
+        )}
+        for step in ("create", "reuse"):
+            if self.timings.get(step):
+                out[f"{step}_mean_s"] = round(sum(self.timings[step]) / len(self.timings[step]), 3)
+        if "create_mean_s" in out and "reuse_mean_s" in out:
+            out["saved_s"] = round(self.counts["reused"] * (out["create_mean_s"] - out["reuse_mean_s"]), 2)
+        return out
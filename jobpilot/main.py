@@ -4,10 +4,16 @@ from jobpilot.utils.config import load_configs
 
 def cli():
     p = argparse.ArgumentParser(prog="jobpilot")
-    p.add_argument("cmd", choices=["run", "check"])
+    p.add_argument("cmd", choices=["run", "daemon", "check", "similar", "refresh", "apply-worker"])
     p.add_argument("--provider", default="dice")
     p.add_argument("--profile", default="configs/profile.yaml")
     p.add_argument("--search", default="configs/searches.yaml")
+    p.add_argument("--job", help="similar: stored posting key, e.g. dice:<job id>")
+    p.add_argument("--k", type=int, default=10, help="similar: number of neighbours")
+    p.add_argument("--max-jobs", type=int, default=None, help="refresh: newest N saved jobs only")
+    p.add_argument("--limit", type=int, default=None, help="apply-worker: apply to at most N queued jobs")
+    p.add_argument("--max-results", type=int, default=None, help="run: cap on scraped jobs (default dice.max_results)")
+    p.add_argument("--ticks", type=int, default=None, help="daemon: stop after N ticks")
     args = p.parse_args()
 
     cfg = load_configs(args.profile, args.search)
@@ -15,9 +21,39 @@ def cli():
         print("Loaded config OK for provider:", args.provider)
         print(cfg.keys())
     elif args.cmd == "run":
-        # placeholder – wired in Step 8/Runner
-        print(f"Runner not wired yet. Provider={args.provider}")
-        print("Next: implement DiceProvider and Orchestrator.")
+        from jobpilot.orchestrator.runner import JobPilotRunner
+        max_results = args.max_results or int((cfg.get("dice") or {}).get("max_results", 100))
+        JobPilotRunner(provider_name=args.provider, cfg=cfg).run_once(max_results=max_results)
+    elif args.cmd == "daemon":
+        from jobpilot.orchestrator.daemon import JobPilotDaemon
+        from jobpilot.orchestrator.runner import JobPilotRunner
+        JobPilotDaemon(JobPilotRunner(provider_name=args.provider, cfg=cfg)).run(max_ticks=args.ticks)
+    elif args.cmd == "similar":
+        similar(cfg, args.job, args.k)
+    elif args.cmd == "refresh":
+        from jobpilot.orchestrator.runner import JobPilotRunner
+        JobPilotRunner(provider_name=args.provider, cfg=cfg).refresh(max_jobs=args.max_jobs)
+    elif args.cmd == "apply-worker":
+        from jobpilot.orchestrator.runner import JobPilotRunner
+        JobPilotRunner(provider_name=args.provider, cfg=cfg).apply_worker(limit=args.limit)
+
+
+def similar(cfg: dict, key: str, k: int) -> None:
+    """
+    Print the stored postings closest to `key` in the semantic index.
+    """
+    from jobpilot.services.semantic_index import HashedEmbedder, SemanticIndex
+    from jobpilot.utils.paths import data_dir
+
+    if not key:
+        raise SystemExit("similar needs --job <provider>:<job id>")
+    semantic_cfg = (cfg.get("matching") or {}).get("semantic") or {}
+    index = SemanticIndex(
+        semantic_cfg.get("dir") or data_dir("semantic"),
+        HashedEmbedder(dim=int(semantic_cfg.get("dim", 512))),
+    )
+    for neighbour, score, meta in index.similar_to(key, k=k):
+        print(f"{score:6.3f}  {neighbour}  {meta.get('title', '')} @ {meta.get('company', '')}  {meta.get('url', '')}")
 
 if __name__ == "__main__":
     cli()
@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import time
+from collections import defaultdict, deque
+from typing import Callable, Dict, List, Optional, Tuple
+
+from jobpilot.models.job import JobPosting, ApplyResult
+from jobpilot.utils.metrics import metrics
+
+
+class ApplyPipeline:
+    """
+    Runs Easy Apply for a list of jobs with their page loads overlapped.
+
+    The provider exposes apply as steps (open_apply_tab, precheck_apply,
+    open_step1, open_step2, click_submit, confirm_apply, close_apply_tab),
+    the same ones apply_queue.drain() walks. Up to `depth` job tabs
+    are open at once: the next jobs' detail pages load in background tabs
+    while the current one is filled in, and after submitting job N the
+    pipeline pre-checks job N+1 (page loaded, not already applied) before
+    going back to wait for N's confirmation. depth=1 is the plain
+    one-at-a-time loop.
+
+    One WebDriver, so steps never run at the same time; only the browser's
+    own page loading overlaps. Results are reported in job order. Per-step
+    wall times are kept in `timings` (see summary()).
+    """
+
+    STEPS = ("open", "precheck", "step1", "step2", "submit", "confirm", "close", "total")
+
+    def __init__(self, provider, depth: int = 2) -> None:
+        if depth < 1:
+            raise ValueError("pipeline depth must be >= 1")
+        self.provider = provider
+        self.depth = int(depth)
+        self.timings: Dict[str, List[float]] = defaultdict(list)
+
+    def _timed(self, step: str, fn, *args):
+        start = time.perf_counter()
+        try:
+            return fn(*args)
+        finally:
+            elapsed = time.perf_counter() - start
+            self.timings[step].append(elapsed)
+            metrics.observe("apply_step", elapsed, step=step)
+
+    def run(
+            self,
+            jobs: List[JobPosting],
+            resume_for: Optional[Callable[[JobPosting], Optional[str]]] = None,
+            before_apply: Optional[Callable[[JobPosting], Optional[str]]] = None,
+            on_result: Optional[Callable[[JobPosting, ApplyResult], None]] = None,
+            stop: Optional[Callable[[], Optional[str]]] = None,
+            on_step: Optional[Callable[[JobPosting, str], None]] = None,
+    ) -> List[Tuple[JobPosting, ApplyResult]]:
+        """
+        Apply to `jobs` in order.
+
+        - resume_for(job): resume file to attach (None keeps the provider's)
+        - before_apply(job): a skip reason, checked when the job's turn
+          comes (after every earlier result was handled), or None
+        - on_result(job, result): called as each job finishes
+        - stop(): checked at the same point; a reason ends the run there,
+          closing tabs opened ahead. Jobs not reached get no result.
+        - on_step(job, step): called as each of "open", "step1", "step2"
+          and "submit" completes (the run records queue states with it).
+          A job opened ahead may get "open" and then no result if stopped.
+        """
+        def step_done(job: JobPosting, step: str) -> None:
+            if on_step is not None:
+                on_step(job, step)
+
+        opened: deque = deque()    # (job, session or the exception that prevented it)
+        remaining = deque(jobs)
+        results: List[Tuple[JobPosting, ApplyResult]] = []
+
+        def top_up(in_flight: int) -> None:
+            while remaining and len(opened) + in_flight < self.depth:
+                job = remaining.popleft()
+                try:
+                    opened.append((job, self._timed("open", self.provider.open_apply_tab, job)))
+                except Exception as e:
+                    opened.append((job, e))
+                else:
+                    step_done(job, "open")
+
+        while opened or remaining:
+            reason = stop() if stop is not None else None
+            if reason:
+                print(f"[ApplyPipeline] Stopping with {len(opened) + len(remaining)} jobs left: {reason}")
+                for _, session in opened:
+                    if not isinstance(session, Exception):
+                        self.provider.close_apply_tab(session)
+                break
+            top_up(in_flight=0)
+            job, session = opened.popleft()
+            start = time.perf_counter()
+            if isinstance(session, Exception):
+                result = ApplyResult(status="ERROR", app_id=None, notes=f"Could not open job tab: {session}")
+            else:
+                result = self._apply_one(job, session, resume_for, before_apply, top_up, opened, step_done)
+            self.timings["total"].append(time.perf_counter() - start)
+            metrics.inc("apply_results", status=result.status)
+
+            results.append((job, result))
+            if on_result is not None:
+                on_result(job, result)
+        return results
+
+    def _apply_one(self, job, session, resume_for, before_apply, top_up, opened, step_done) -> ApplyResult:
+        try:
+            reason = before_apply(job) if before_apply is not None else None
+            if reason:
+                return ApplyResult(status="SKIPPED", app_id=None, notes=reason)
+
+            result = self._timed("precheck", self.provider.precheck_apply, session)
+            if result is not None:
+                return result
+
+            resume_path = resume_for(job) if resume_for is not None else None
+            self._timed("step1", self.provider.open_step1, session)
+            step_done(job, "step1")
+            self._timed("step2", self.provider.open_step2, session, resume_path)
+            step_done(job, "step2")
+            self._timed("submit", self.provider.click_submit, session)
+            step_done(job, "submit")
+
+            # While this submission confirms: open the next tab(s) and
+            # pre-check the next job
+            top_up(in_flight=1)
+            if opened and not isinstance(opened[0][1], Exception):
+                try:
+                    self._timed("precheck", self.provider.precheck_apply, opened[0][1])
+                except Exception as e:
+                    # Retried when that job's turn comes
+                    print(f"[ApplyPipeline] Early pre-check failed for {opened[0][0].id}: {e}")
+
+            return self._timed("confirm", self.provider.confirm_apply, session)
+
+        except Exception as e:
+            return ApplyResult(status="ERROR", app_id=None, notes=f"Exception during Easy apply: {e}")
+
+        finally:
+            self._timed("close", self.provider.close_apply_tab, session)
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Per step: count, mean and max seconds."""
+        return {
+            step: {
+                "n": len(self.timings[step]),
+                "mean_s": round(sum(self.timings[step]) / len(self.timings[step]), 3),
+                "max_s": round(max(self.timings[step]), 3),
+            }
+            for step in self.STEPS if self.timings.get(step)
+        }
@@ -0,0 +1,310 @@
+from __future__ import annotations
+
+import json, os, sqlite3, time
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, List, Optional
+
+from jobpilot.models.job import JobPosting, ApplyResult
+from jobpilot.utils.metrics import metrics
+
+QUEUED, OPENED, STEP1, STEP2 = "queued", "opened", "step1", "step2"
+SUBMITTED, CONFIRMED, FAILED, SKIPPED = "submitted", "confirmed", "failed", "skipped"
+
+ACTIVE = (OPENED, STEP1, STEP2, SUBMITTED)
+
+# Allowed moves. Any active state can also go back to queued (retry) or to
+# failed; confirmed is reachable early when the job turns out to be
+# applied already (idempotency check on the detail page).
+TRANSITIONS: Dict[str, tuple] = {
+    QUEUED: (OPENED, CONFIRMED, SKIPPED, FAILED),
+    OPENED: (STEP1, CONFIRMED, SKIPPED, QUEUED, FAILED),
+    STEP1: (STEP2, QUEUED, FAILED),
+    STEP2: (SUBMITTED, QUEUED, FAILED),
+    SUBMITTED: (CONFIRMED, QUEUED, FAILED),
+    FAILED: (QUEUED,),
+    CONFIRMED: (),
+    SKIPPED: (),
+}
+
+
+class InvalidTransition(ValueError):
+    pass
+
+
+@dataclass
+class QueueItem:
+    key: str
+    job: JobPosting
+    state: str
+    attempts: int
+    resume_path: Optional[str] = None
+    row_idx: Optional[int] = None
+    priority: float = 0.0
+    last_error: Optional[str] = None
+    created_at: float = 0.0
+
+
+class ApplyQueue:
+    """
+    Durable Easy Apply queue (SQLite in the data dir).
+
+    Jobs move queued -> opened -> step1 -> step2 -> submitted -> confirmed,
+    or end up failed/skipped. Every move is checked against TRANSITIONS and
+    logged in `apply_events`. A failure sends the job back to queued until
+    it has used max_attempts. Work left in an active state by a crash or
+    Ctrl-C is recovered on the next start once its lease expires; a job
+    left in `submitted` is retried too, and the detail-page "Applied" check
+    turns that retry into a confirmation instead of a second application.
+    """
+
+    def __init__(self, path: str, max_attempts: int = 3, lease_s: float = 600.0) -> None:
+        self.path = path
+        self.max_attempts = int(max_attempts)
+        self.lease_s = float(lease_s)
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        with self.conn:
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS apply_queue ("
+                " key TEXT PRIMARY KEY, job TEXT NOT NULL, state TEXT NOT NULL,"
+                " attempts INTEGER NOT NULL DEFAULT 0, resume_path TEXT, row_idx INTEGER,"
+                " priority REAL NOT NULL DEFAULT 0, last_error TEXT,"
+                " created_at REAL NOT NULL, updated_at REAL NOT NULL, lease_until REAL)"
+            )
+            self.conn.execute("CREATE INDEX IF NOT EXISTS apply_queue_state ON apply_queue (state, priority)")
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS apply_events ("
+                " key TEXT NOT NULL, from_state TEXT, to_state TEXT NOT NULL, note TEXT, at REAL NOT NULL)"
+            )
+
+    @staticmethod
+    def key(job: JobPosting) -> str:
+        return f"{job.provider}:{job.id}"
+
+    def enqueue(
+            self,
+            job: JobPosting,
+            resume_path: Optional[str] = None,
+            row_idx: Optional[int] = None,
+            priority: float = 0.0,
+    ) -> bool:
+        """Add a job (no-op if it is already in the queue, in any state)."""
+        now = time.time()
+        with self.conn:
+            cur = self.conn.execute(
+                "INSERT OR IGNORE INTO apply_queue"
+                " (key, job, state, resume_path, row_idx, priority, created_at, updated_at)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (self.key(job), json.dumps(asdict(job)), QUEUED, resume_path, row_idx, float(priority), now, now),
+            )
+            if cur.rowcount:
+                self._log(self.key(job), None, QUEUED, "enqueued")
+        return bool(cur.rowcount)
+
+    def _log(self, key: str, from_state: Optional[str], to_state: str, note: Optional[str]) -> None:
+        self.conn.execute(
+            "INSERT INTO apply_events (key, from_state, to_state, note, at) VALUES (?, ?, ?, ?, ?)",
+            (key, from_state, to_state, note, time.time()),
+        )
+
+    def state(self, key: str) -> Optional[str]:
+        row = self.conn.execute("SELECT state FROM apply_queue WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def transition(self, key: str, to_state: str, note: Optional[str] = None) -> None:
+        """Move one job; raises InvalidTransition for moves outside TRANSITIONS."""
+        with self.conn:
+            from_state = self.state(key)
+            if from_state is None:
+                raise KeyError(f"{key} is not in the apply queue")
+            if to_state not in TRANSITIONS[from_state]:
+                raise InvalidTransition(f"{key}: {from_state} -> {to_state} is not allowed")
+            lease = time.time() + self.lease_s if to_state in ACTIVE else None
+            self.conn.execute(
+                "UPDATE apply_queue SET state = ?, updated_at = ?, lease_until = ?,"
+                " last_error = CASE WHEN ? = 'failed' THEN ? ELSE last_error END WHERE key = ?",
+                (to_state, time.time(), lease, to_state, note, key),
+            )
+            self._log(key, from_state, to_state, note)
+
+    def fail(self, key: str, error: str) -> str:
+        """
+        Count a failed attempt: back to queued while attempts remain, else
+        failed. Returns the new state.
+        """
+        with self.conn:
+            self.conn.execute(
+                "UPDATE apply_queue SET attempts = attempts + 1, last_error = ? WHERE key = ?", (error, key)
+            )
+        (attempts,) = self.conn.execute("SELECT attempts FROM apply_queue WHERE key = ?", (key,)).fetchone()
+        to_state = QUEUED if attempts < self.max_attempts else FAILED
+        note = f"attempt {attempts}/{self.max_attempts}: {error}"
+        if self.state(key) == to_state:
+            # Failed before leaving the queue (e.g. the tab never opened)
+            with self.conn:
+                self._log(key, to_state, to_state, note)
+        else:
+            self.transition(key, to_state, note)
+        return to_state
+
+    def record_result(self, key: str, result: ApplyResult) -> str:
+        """
+        Settle a job applied outside drain() (the run's apply pipeline):
+        confirmed/skipped are final; errors and unconfirmed submissions are
+        retried by the apply worker. Returns the new state.
+        """
+        to_state = result_state(result)
+        if to_state in (CONFIRMED, SKIPPED):
+            self.transition(key, to_state, result.notes)
+            return to_state
+        return self.fail(key, result.notes or f"Apply status: {result.status}")
+
+    def _item(self, row) -> QueueItem:
+        key, job, state, attempts, resume_path, row_idx, priority, last_error, created_at = row
+        return QueueItem(
+            key=key,
+            job=JobPosting(**json.loads(job)),
+            state=state,
+            attempts=attempts,
+            resume_path=resume_path,
+            row_idx=row_idx,
+            priority=priority,
+            last_error=last_error,
+            created_at=created_at,
+        )
+
+    def pending(self, limit: Optional[int] = None) -> List[QueueItem]:
+        """Queued jobs, best first (priority, then oldest)."""
+        sql = (
+            "SELECT key, job, state, attempts, resume_path, row_idx, priority, last_error, created_at"
+            " FROM apply_queue"
+            " WHERE state = ? ORDER BY priority DESC, created_at"
+        )
+        params: tuple = (QUEUED,)
+        if limit:
+            sql += " LIMIT ?"
+            params += (int(limit),)
+        return [self._item(row) for row in self.conn.execute(sql, params)]
+
+    def recover(self, now: Optional[float] = None) -> int:
+        """
+        Requeue jobs stuck in an active state past their lease (a crashed or
+        killed worker). Counts as an attempt. Returns how many were recovered.
+        """
+        now = time.time() if now is None else now
+        stuck = self.conn.execute(
+            f"SELECT key, state FROM apply_queue WHERE state IN ({','.join('?' * len(ACTIVE))})"
+            " AND (lease_until IS NULL OR lease_until < ?)",
+            (*ACTIVE, now),
+        ).fetchall()
+        for key, state in stuck:
+            self.fail(key, f"interrupted in state {state}")
+        return len(stuck)
+
+    def counts(self) -> Dict[str, int]:
+        return dict(self.conn.execute("SELECT state, COUNT(*) FROM apply_queue GROUP BY state").fetchall())
+
+    def history(self, key: str) -> List[str]:
+        return [row[0] for row in self.conn.execute(
+            "SELECT to_state FROM apply_events WHERE key = ? ORDER BY rowid", (key,)
+        )]
+
+    def close(self) -> None:
+        self.conn.close()
+
+
+def result_state(result: ApplyResult) -> str:
+    """Terminal queue state for an apply result (SUBMITTED: outcome unknown)."""
+    status = (result.status or "").upper()
+    notes = (result.notes or "").lower()
+    if status == "APPLIED" or (status == "SKIPPED" and "already applied" in notes):
+        return CONFIRMED
+    if status == "SKIPPED":
+        return SKIPPED
+    if status == "ERROR" and "confirmation was not detected" in notes:
+        return SUBMITTED
+    return FAILED
+
+
+def applied_value(result: ApplyResult) -> str:
+    """
+    Sheet "applied" column for a result: Yes when applied (now or before),
+    blank when submitted but unconfirmed, No otherwise.
+    """
+    return {CONFIRMED: "Yes", SUBMITTED: ""}.get(result_state(result), "No")
+
+
+def drain(
+        queue: ApplyQueue,
+        provider,
+        limit: Optional[int] = None,
+        before_apply: Optional[Callable[[JobPosting], Optional[str]]] = None,
+        on_result: Optional[Callable[[QueueItem, ApplyResult], None]] = None,
+        items: Optional[List[QueueItem]] = None,
+        stop: Optional[Callable[[], Optional[str]]] = None,
+) -> Dict[str, int]:
+    """
+    Work through queued jobs one at a time with the provider's apply steps,
+    recording every state change. Returns the final state counts.
+
+    - items: the jobs to work on, in order (default: queue.pending(limit))
+    - before_apply(job): a skip reason (e.g. a duplicate applied meanwhile)
+    - on_result(item, result): called once per finished attempt
+    - stop(): a reason to stop before the next job; the rest stays queued
+    """
+    for item in (items if items is not None else queue.pending(limit=limit)):
+        if stop is not None:
+            reason = stop()
+            if reason:
+                print(f"[ApplyQueue] Stopping: {reason}")
+                break
+        key, job = item.key, item.job
+        print(f"[ApplyQueue] {key} attempt {item.attempts + 1}/{queue.max_attempts}")
+        result: Optional[ApplyResult] = None
+        session = None
+        try:
+            reason = before_apply(job) if before_apply is not None else None
+            if reason:
+                result = ApplyResult(status="SKIPPED", app_id=None, notes=reason)
+                queue.transition(key, SKIPPED, reason)
+                continue
+
+            with metrics.timer("apply_step", step="open"):
+                session = provider.open_apply_tab(job)
+            queue.transition(key, OPENED)
+
+            # Idempotency: a job that already shows "Applied" is confirmed, not re-applied
+            with metrics.timer("apply_step", step="precheck"):
+                result = provider.precheck_apply(session)
+            if result is not None:
+                queue.record_result(key, result)
+                continue
+
+            with metrics.timer("apply_step", step="step1"):
+                provider.open_step1(session)
+            queue.transition(key, STEP1)
+            with metrics.timer("apply_step", step="step2"):
+                provider.open_step2(session, item.resume_path)
+            queue.transition(key, STEP2)
+            with metrics.timer("apply_step", step="submit"):
+                provider.click_submit(session)
+            queue.transition(key, SUBMITTED)
+
+            # Unconfirmed submissions are retried; the "Applied" check settles them
+            with metrics.timer("apply_step", step="confirm"):
+                result = provider.confirm_apply(session)
+            queue.record_result(key, result)
+
+        except Exception as e:
+            result = ApplyResult(status="ERROR", app_id=None, notes=f"Exception during Easy apply: {e}")
+            queue.fail(key, str(e))
+
+        finally:
+            if session is not None:
+                with metrics.timer("apply_step", step="close"):
+                    provider.close_apply_tab(session)
+            if result is not None:
+                metrics.inc("apply_results", status=result.status)
+            if result is not None and on_result is not None:
+                on_result(item, result)
+    return queue.counts()
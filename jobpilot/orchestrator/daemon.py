@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import random, signal, threading, time
+from datetime import datetime, timedelta
+from typing import Callable, Optional, Tuple
+
+from jobpilot.utils.metrics import metrics
+
+
+def parse_quiet_hours(spec: Optional[str]) -> Optional[Tuple[int, int]]:
+    """
+    "23:00-07:00" -> (start, end) in minutes after midnight; None if unset.
+    A window may wrap past midnight.
+    """
+    if not spec:
+        return None
+    try:
+        start, end = (part.strip() for part in str(spec).split("-"))
+        minutes = []
+        for hhmm in (start, end):
+            hours, _, mins = hhmm.partition(":")
+            minutes.append((int(hours) * 60 + int(mins or 0)) % 1440)
+        return minutes[0], minutes[1]
+    except ValueError:
+        raise ValueError(f"quiet_hours must look like '23:00-07:00', got {spec!r}")
+
+
+def quiet_seconds_left(window: Optional[Tuple[int, int]], now: datetime) -> float:
+    """Seconds until the quiet window ends (0 when outside it)."""
+    if window is None:
+        return 0.0
+    start, end = window
+    minute = now.hour * 60 + now.minute
+    inside = start <= minute < end if start <= end else (minute >= start or minute < end)
+    if not inside or start == end:
+        return 0.0
+    end_at = now.replace(hour=end // 60, minute=end % 60, second=0, microsecond=0)
+    if end_at <= now:
+        end_at += timedelta(days=1)
+    return (end_at - now).total_seconds()
+
+
+class JobPilotDaemon:
+    """
+    `jobpilot daemon`: keeps one logged-in browser and the loaded configs,
+    and runs a search -> score -> save -> apply cycle every `interval_min`
+    (+/- jitter_pct), outside quiet hours.
+
+    The first tick sweeps with the configured dice.date_posted; later ticks
+    only look at the newest window (`incremental_date_posted`, e.g. "today")
+    since older postings were seen already. Already-saved jobs are skipped
+    by the cycle itself, so each tick only processes new jobs.
+
+    SIGINT/SIGTERM ask for a graceful stop: the tick in progress finishes
+    its current stage, saves what it scraped and stops applying after the
+    job in flight (the rest stays queued). A second SIGINT aborts.
+    A tick that fails (e.g. the browser died) reconnects on the next one.
+    """
+
+    def __init__(
+            self,
+            runner,
+            connect: Optional[Callable[[], Tuple[object, Callable[[], None]]]] = None,
+            rng: Optional[random.Random] = None,
+            clock: Callable[[], datetime] = datetime.now,
+    ) -> None:
+        self.runner = runner
+        cfg = runner.cfg.get("daemon") or {}
+        self.interval_s = float(cfg.get("interval_min", 30)) * 60.0
+        self.jitter_pct = float(cfg.get("jitter_pct", 20)) / 100.0
+        self.quiet_hours = parse_quiet_hours(cfg.get("quiet_hours"))
+        self.incremental_date_posted = cfg.get("incremental_date_posted", "today")
+        self.sweep_date_posted = (runner.cfg.get("dice") or {}).get("date_posted")
+        self.max_results = int(cfg.get("max_results") or (runner.cfg.get("dice") or {}).get("max_results", 100))
+        self.connect = connect or runner.connect
+        self.rng = rng or random.Random()
+        self.clock = clock
+        self.stopping = threading.Event()
+        self.stop_reason: Optional[str] = None
+        self.ticks = 0
+        self.swept = False   # a full (configured date_posted) sweep has completed
+
+    # --- shutdown ----
+    def request_stop(self, reason: str = "stop requested") -> None:
+        if not self.stopping.is_set():
+            print(f"[Daemon] {reason}: finishing in-flight work, then exiting")
+        self.stop_reason = reason
+        self.stopping.set()
+
+    def _on_signal(self, signum, frame) -> None:
+        if self.stopping.is_set() and signum == signal.SIGINT:
+            raise KeyboardInterrupt
+        self.request_stop(f"received {signal.Signals(signum).name}")
+
+    def install_signal_handlers(self) -> None:
+        if threading.current_thread() is not threading.main_thread():
+            return
+        signal.signal(signal.SIGINT, self._on_signal)
+        signal.signal(signal.SIGTERM, self._on_signal)
+
+    def should_stop(self) -> Optional[str]:
+        return self.stop_reason if self.stopping.is_set() else None
+
+    # --- cadence ----
+    def next_delay(self) -> float:
+        jitter = self.rng.uniform(-self.jitter_pct, self.jitter_pct) if self.jitter_pct else 0.0
+        return max(0.0, self.interval_s * (1.0 + jitter))
+
+    def _sleep(self, seconds: float) -> bool:
+        """Sleep, waking early on a stop request; True if we should stop."""
+        return self.stopping.wait(timeout=seconds)
+
+    def run(self, max_ticks: Optional[int] = None) -> int:
+        """Tick until stopped (or max_ticks); returns the number of ticks run."""
+        self.install_signal_handlers()
+        provider, close = None, None
+        try:
+            while not self.stopping.is_set() and (max_ticks is None or self.ticks < max_ticks):
+                quiet = quiet_seconds_left(self.quiet_hours, self.clock())
+                if quiet > 0:
+                    print(f"[Daemon] Quiet hours: sleeping {quiet / 60:.0f} min")
+                    if self._sleep(quiet):
+                        break
+                    continue
+
+                date_posted = self.incremental_date_posted if self.swept else self.sweep_date_posted
+                self.ticks += 1
+                started = time.monotonic()
+                print(f"[Daemon] Tick {self.ticks} (date_posted={date_posted or 'any'})")
+                # Each tick reports its own metrics (a reconnect's login included)
+                metrics.reset()
+                try:
+                    if provider is None:
+                        provider, close = self.connect()
+                    jobs = self.runner.run_cycle(
+                        provider, max_results=self.max_results, date_posted=date_posted, stop=self.should_stop
+                    )
+                    self.swept = True
+                    print(f"[Daemon] Tick {self.ticks} done in {time.monotonic() - started:.0f}s: {len(jobs)} new jobs")
+                except Exception as e:
+                    # Start the next tick from a fresh browser
+                    print(f"[Daemon] Tick {self.ticks} failed: {e!r}; reconnecting next tick")
+                    if close is not None:
+                        close()
+                    provider, close = None, None
+
+                if max_ticks is not None and self.ticks >= max_ticks:
+                    break
+                delay = self.next_delay()
+                print(f"[Daemon] Next tick in {delay / 60:.1f} min")
+                if self._sleep(delay):
+                    break
+        finally:
+            if close is not None:
+                close()
+        print(f"[Daemon] Stopped after {self.ticks} ticks")
+        return self.ticks
@@ -8,20 +8,51 @@ python -c "from jobpilot.orchestrator.runner import JobPilotRunner; JobPilotRunn
 
 from __future__ import annotations
 import os, time 
+from contextlib import ExitStack
 from datetime import datetime, timezone
 from dataclasses import dataclass
-from typing import List
+from typing import Callable, Dict, List, Optional
 
 from jobpilot.providers.base import BaseProvider
-from jobpilot.models.job import JobPosting
-from jobpilot.storage.sheets import SheetsClient
+from jobpilot.models.job import JobPosting, ApplyResult
 
 from jobpilot.storage.repo import JobRepo
-from jobpilot.services.matcher import JobMatcher
+from jobpilot.storage.sinks import build_sink
+from jobpilot.services.multi_profile import MultiProfileMatcher, ProfileMatch
+from jobpilot.services.lexical import CorpusIndex
+from jobpilot.services.score_cache import ScoreCache
+from jobpilot.services.condense import Condenser, BoilerplateLibrary, DEFAULT_BOILERPLATE_PATH
+from jobpilot.services.resume_profile import ResumeProfile, ResumeProfileStore
+from jobpilot.services.skills import SkillExtractor, DEFAULT_SKILLS_PATH
+from jobpilot.services.dedupe import DuplicateIndex
+from jobpilot.services.rules import CardRules
+from jobpilot.services.refresh import (
+    CHANGED, ChurnReport, DescriptionStore, HttpDescriptionFetcher, check_descriptions, description_hash,
+)
+from jobpilot.services.semantic_index import HashedEmbedder, SemanticIndex, job_key, rank as semantic_rank
+from jobpilot.utils.paths import data_dir
+from jobpilot.utils.latency import LatencyRecorder
+from jobpilot.utils.metrics import metrics
 from jobpilot.providers.dice.provider import DiceProvider
+from jobpilot.orchestrator.apply_pipeline import ApplyPipeline
+from jobpilot.orchestrator.apply_queue import (
+    ACTIVE, OPENED, QUEUED, STEP1, STEP2, SUBMITTED, ApplyQueue, QueueItem, applied_value, drain,
+)
+from jobpilot.orchestrator.scheduler import ApplyScheduler
 from jobpilot.utils.config import load_configs
 from jobpilot.browser.engine import build_driver
 
+@dataclass
+class ScoringSetup:
+    """What _build_scoring() puts together for one run."""
+    matcher: MultiProfileMatcher
+    variants: Dict[str, Dict[str, Optional[str]]]
+    profiles: Dict[str, ResumeProfile]
+    corpus_index: Optional[CorpusIndex]
+    score_cache: Optional[ScoreCache]
+    condenser: Optional[Condenser]
+
+
 @dataclass
 class JobPilotRunner:
     """
@@ -32,34 +63,498 @@ class JobPilotRunner:
     - Append discovered jobs to a Google Sheet
     - Return the list of JobPosting objects for further processing
     """
-    def __init__(self, provider_name: str = "dice") -> None:
-        self.cfg = load_configs()
+    def __init__(self, provider_name: str = "dice", cfg: Optional[dict] = None) -> None:
+        # main.py passes the config loaded from --profile/--search; the
+        # default paths are only a fallback for library use
+        self.cfg = cfg if cfg is not None else load_configs()
         self.provider_name = provider_name
-        self.repo = JobRepo()
+        # Sinks come from the `storage:` block and connect lazily on first use
+        self.repo = JobRepo(sink=build_sink(self.cfg.get("storage")))
+        # Compiled resumes (one store per profile name), rebuilt only when
+        # the resume file changes
+        self.resume_profiles: Dict[str, ResumeProfileStore] = {}
+        # Compiled skills automaton, built on first use and kept across runs
+        self._skills: SkillExtractor | None = None
+        # Card-level reject rules (`filters:`), compiled once; None if unset
+        self.card_rules = CardRules.from_config(self.cfg.get("filters"))
+
+    @staticmethod
+    def _latency_recorder(browser_cfg: dict) -> LatencyRecorder | None:
+        """
+        Per-locator wait latencies (`browser.adaptive_timeouts`), loaded from
+        the data dir; None when disabled.
+        """
+        adaptive_cfg = browser_cfg.get("adaptive_timeouts") or {}
+        if not adaptive_cfg.get("enabled", False):
+            return None
+        return LatencyRecorder.load(
+            adaptive_cfg.get("path") or data_dir("wait_latency.json"),
+            factor=float(adaptive_cfg.get("factor", 3.0)),
+            min_timeout=float(adaptive_cfg.get("min_s", 2.0)),
+            max_timeout=float(adaptive_cfg.get("max_s", 20.0)),
+            min_samples=int(adaptive_cfg.get("min_samples", 20)),
+        )
+
+    @staticmethod
+    def _report_latency(latency: LatencyRecorder) -> None:
+        latency.save()
+        print(f"[Runner] Wait latencies => {latency.summary()}")
+        for key, reason in latency.regressions():
+            print(f"[Runner] SELECTOR REGRESSION {key}: {reason}")
+
+    @staticmethod
+    def _report_commands(provider) -> None:
+        """Top WebDriver call sites of this run (`browser.instrument`), then start afresh."""
+        recorder = getattr(getattr(provider, "driver", None), "jobpilot_commands", None)
+        if recorder is None:
+            return
+        print(recorder.report())
+        recorder.reset()
+
+    def _report_metrics(self) -> None:
+        """
+        Log this run's stage timings and counters and write them out
+        (`metrics:`): last_run.json in the data dir, the newest `keep_runs`
+        per-run JSON summaries next to it, and optionally a Prometheus
+        textfile.
+        """
+        metrics_cfg = self.cfg.get("metrics") or {}
+        if not metrics_cfg.get("enabled", True):
+            return
+        metrics.log_summary()
+        try:
+            if metrics_cfg.get("json", True):
+                metrics.write_json(data_dir("metrics", "last_run.json"))
+                keep_runs = int(metrics_cfg.get("keep_runs") or 0)
+                if keep_runs > 0:
+                    stamp = metrics.started_at.strftime("%Y%m%dT%H%M%SZ")
+                    metrics.write_json(data_dir("metrics", f"run-{stamp}.json"))
+                    # UTC stamps sort by name; a daemon ticking every 30 min would pile up otherwise
+                    runs = sorted(n for n in os.listdir(data_dir("metrics")) if n.startswith("run-"))
+                    for name in runs[:-keep_runs]:
+                        os.remove(data_dir("metrics", name))
+            if metrics_cfg.get("prometheus_textfile"):
+                metrics.write_prometheus(metrics_cfg["prometheus_textfile"])
+        except OSError as e:
+            print(f"[Runner] Could not write run metrics: {e}")
+
+    def _profile_store(self, name: str) -> ResumeProfileStore:
+        if name not in self.resume_profiles:
+            filename = "resume_profile.json" if name == "default" else f"resume_profile_{name}.json"
+            self.resume_profiles[name] = ResumeProfileStore(data_dir(filename))
+        return self.resume_profiles[name]
+
+    def _skill_extractor(self, path: str) -> SkillExtractor:
+        if self._skills is None:
+            self._skills = SkillExtractor.load(path)
+            print(f"[Runner] Skills dictionary: {len(self._skills.canonical)} skills, "
+                  f"{self._skills.n_patterns} patterns")
+        return self._skills
+
+    def _semantic_rank(
+            self,
+            jobs: List[JobPosting],
+            descriptions: List[str],
+            resume_texts: List[str],
+            semantic_cfg: dict,
+    ) -> None:
+        """
+        Embed this run's descriptions in one batch, score them all against
+        the resume(s) with one matrix product (best profile per job) and
+        store them for similarity queries. The semantic_score metadata it
+        sets breaks match_percent ties in the apply order (ApplyScheduler.rank).
+        """
+        embedder = HashedEmbedder(dim=int(semantic_cfg.get("dim", 512)))
+        index = SemanticIndex(semantic_cfg.get("dir") or data_dir("semantic"), embedder)
+
+        texts = [f"{job.title}\n{desc}" for job, desc in zip(jobs, descriptions)]
+        vectors = embedder.embed_many(texts)
+        scores, order = semantic_rank(
+            vectors, embedder.embed(resume_texts[0]) if len(resume_texts) == 1 else embedder.embed_many(resume_texts)
+        )
+
+        for position, i in enumerate(order, start=1):
+            md = dict(jobs[i].metadata or {})
+            md["semantic_score"] = round(float(scores[i]) * 100.0, 1)
+            md["semantic_rank"] = position
+            jobs[i].metadata = md
+
+        index.add_many(
+            [job_key(job) for job in jobs],
+            vectors,
+            [{"title": job.title, "company": job.company, "url": job.url} for job in jobs],
+        )
+        index.flush()
+        print(f"[Runner] Semantic index now holds {len(index)} postings")
+
+    def _build_scoring(self, match_cfg: dict) -> "ScoringSetup":
+        """
+        Matcher and its shared state (corpus index, score cache, condenser,
+        compiled resume profiles) from the `matching:` block.
+        """
+        cheap_strategy = match_cfg.get("cheap_strategy", "naive")
+        corpus_index = None
+        if cheap_strategy == "bm25":
+            corpus_index = CorpusIndex.load(
+                match_cfg.get("corpus_index_path") or data_dir("corpus_index.json")
+            )
+        score_cache = None
+        if match_cfg.get("llm_cache", True):
+            score_cache = ScoreCache(
+                match_cfg.get("llm_cache_path") or data_dir("llm_score_cache.sqlite3"),
+                max_entries=int(match_cfg.get("llm_cache_max_entries", 5000)),
+            )
+        condense_cfg = match_cfg.get("condense") or {}
+        condenser = None
+        if condense_cfg.get("enabled", False):
+            condenser = Condenser(
+                BoilerplateLibrary.load(condense_cfg.get("boilerplate_path") or DEFAULT_BOILERPLATE_PATH),
+                token_budget=int(condense_cfg.get("description_token_budget", 1500)),
+            )
+        resume_token_budget = int(condense_cfg.get("resume_token_budget", 2000))
+        variants = self._resume_variants()
+        profiles = {
+            name: self._profile_store(name).get(
+                variant["path"], condenser=condenser, resume_token_budget=resume_token_budget
+            )
+            for name, variant in variants.items()
+        }
+        skills_cfg = match_cfg.get("skills") or {}
+        skill_extractor = None
+        if skills_cfg.get("enabled", False) or cheap_strategy == "skills":
+            skill_extractor = self._skill_extractor(skills_cfg.get("path") or DEFAULT_SKILLS_PATH)
+        # Every fetched description is scored against every resume variant
+        matcher = MultiProfileMatcher.from_profiles(
+            profiles,
+            cheap_strategy=cheap_strategy,
+            corpus_index=corpus_index,
+            score_cache=score_cache,
+            cascade=match_cfg.get("cascade"),
+            condenser=condenser,
+            resume_token_budget=resume_token_budget,
+            skill_extractor=skill_extractor,
+            skill_prefilter_min=int(skills_cfg.get("prefilter_min_shared", 0)),
+        )
+        return ScoringSetup(
+            matcher=matcher,
+            variants=variants,
+            profiles=profiles,
+            corpus_index=corpus_index,
+            score_cache=score_cache,
+            condenser=condenser,
+        )
+
+    @staticmethod
+    def _score_kwargs(match_cfg: dict) -> dict:
+        """top_score_many options from the `matching:` block."""
+        return dict(
+            concurrency=int(match_cfg.get("llm_concurrency", 1)),
+            llm_mode=match_cfg.get("llm_mode", "single"),
+            batch_options={
+                "token_budget": int(match_cfg.get("llm_batch_token_budget", 12000)),
+                "max_batch_size": int(match_cfg.get("llm_batch_max_size", 8)),
+            },
+            timeout=float(match_cfg.get("llm_timeout_s", 60)),
+            max_attempts=int(match_cfg.get("llm_max_attempts", 5)),
+        )
+
+    def _resolve_path(self, key_or_path: str) -> str:
+        """
+        A profile path value is either an env key (.env / environment) or a path.
+        """
+        env_cfg = self.cfg.get("env", {})
+        resolved = env_cfg.get(key_or_path) or os.getenv(key_or_path)
+        resume_path = resolved or key_or_path
 
-    def _load_resume_text(self) -> str:
+        if not os.path.exists(resume_path):
+            raise FileNotFoundError(f"Resume file is not fond at: {resume_path}")
+        return resume_path
+
+    def _resume_path(self) -> str:
         profile = self.cfg.get("profile", {})
         # print(f"[Profile from YAML] => {profile}")
-        env_cfg = self.cfg.get("env", {})
-
         key_or_path = profile.get("resume_path")
 
         if not key_or_path:
             raise RuntimeError("profile.resume_path is not set")
-        
-        resolved = env_cfg.get(key_or_path) or os.getenv(key_or_path)
-        resume_path = resolved or key_or_path
+        return self._resolve_path(key_or_path)
 
-        if not os.path.exists(resume_path):
-            raise FileNotFoundError(f"Resume file is not fond at: {resume_path}")
-        
-        with open(resume_path, "r", encoding="utf-8") as f:
+    def _resume_variants(self) -> Dict[str, Dict[str, Optional[str]]]:
+        """
+        name -> {"path": text resume to score with, "upload": file to attach
+        when applying}. From `profile.resumes` when set; otherwise the single
+        profile.resume_path, whose upload is None (keep the resume already on
+        the provider profile).
+        """
+        variants = (self.cfg.get("profile", {}) or {}).get("resumes") or []
+        if not variants:
+            return {"default": {"path": self._resume_path(), "upload": None}}
+
+        resolved: Dict[str, Dict[str, Optional[str]]] = {}
+        for entry in variants:
+            name = entry.get("name")
+            if not name or not entry.get("path"):
+                raise RuntimeError("each profile.resumes entry needs a name and a path")
+            if name in resolved:
+                raise RuntimeError(f"duplicate resume profile name: {name!r}")
+            path = self._resolve_path(entry["path"])
+            upload = entry.get("upload_path")
+            resolved[name] = {"path": path, "upload": self._resolve_path(upload) if upload else path}
+        return resolved
+
+    def _load_resume_text(self) -> str:
+        with open(self._resume_path(), "r", encoding="utf-8") as f:
             return f.read()
 
+    def refresh(self, max_jobs: int | None = None) -> ChurnReport:
+        """
+        Re-check postings already saved and rescore only the ones whose
+        description changed since it was last seen.
+
+        Descriptions come from a plain HTTP fetch of the job page (JSON-LD,
+        conditional GET), so no login or browser is needed; with
+        `refresh.browser_fallback` a headless browser covers pages without
+        JSON-LD. Rescored rows get a new match_percent, notes and metadata;
+        apply status is left alone. Returns the churn per search query.
+        """
+        refresh_cfg = self.cfg.get("refresh") or {}
+        provider_name = DiceProvider.NAME
+        max_jobs = max_jobs or refresh_cfg.get("max_jobs")
+
+        saved = self.repo.iter_saved_jobs(provider_name)
+        if max_jobs:
+            # Newest rows first in line
+            saved = sorted(saved, key=lambda item: item[0])[-int(max_jobs):]
+        row_map = {job.id: row_idx for row_idx, job in saved}
+        print(f"[Runner] Refresh: checking {len(saved)} saved jobs")
+
+        driver = None
+        provider = None
+
+        def browser_fetch(job: JobPosting) -> str:
+            nonlocal driver, provider
+            if provider is None:
+                driver = build_driver(
+                    headless=True, event_waits=(self.cfg.get("browser") or {}).get("event_waits")
+                )
+                provider = DiceProvider(driver, self.cfg)
+            return provider.get_job_description(job)
+
+        with ExitStack() as closing:
+            # Stores and the fallback browser close on every exit path
+            store = DescriptionStore(data_dir("descriptions.sqlite3"))
+            closing.callback(store.close)
+            closing.callback(lambda: driver.quit() if driver is not None else None)
+            return self._refresh(saved, row_map, store, browser_fetch, refresh_cfg, closing)
+
+    def _refresh(
+            self,
+            saved: List[tuple],
+            row_map: Dict[str, int],
+            store: DescriptionStore,
+            browser_fetch: Callable[[JobPosting], str],
+            refresh_cfg: dict,
+            closing: ExitStack,
+    ) -> ChurnReport:
+        report = ChurnReport()
+        checked = check_descriptions(
+            [job for _, job in saved],
+            store,
+            HttpDescriptionFetcher(timeout=float(refresh_cfg.get("http_timeout_s", 15))),
+            browser_fetch=browser_fetch if refresh_cfg.get("browser_fallback", False) else None,
+            report=report,
+        )
+
+        for query, counts, churn in report.rows():
+            print(f"[Runner] Churn {query!r}: {churn:.1%} {counts}")
+        print(f"[Runner] Refresh totals => {report.total()}")
+
+        changed = [(job, text) for job, outcome, text in checked if outcome == CHANGED]
+        if not changed:
+            return report
+
+        match_cfg = self.cfg.get("matching", {}) or {}
+        scoring = self._build_scoring(match_cfg)
+        if scoring.score_cache is not None:
+            closing.callback(scoring.score_cache.close)
+        results = scoring.matcher.top_score_many(
+            [job for job, _ in changed], [text for _, text in changed], **self._score_kwargs(match_cfg)
+        )
+        now_iso = datetime.now(timezone.utc).isoformat()
+        for (job, text), pm in zip(changed, results):
+            md = dict(job.metadata or {})
+            previous = md.get("match_percent")
+            md["previous_match_percent"] = previous
+            md["match_percent"] = pm.result.match_percent
+            md["recommended"] = pm.result.recommended
+            md["match_reasons"] = pm.result.reasons
+            md["description_hash"] = description_hash(text)
+            md["rescored_at"] = now_iso
+            if len(scoring.variants) > 1:
+                md["best_profile"] = pm.profile
+                md["profile_scores"] = pm.scores_text()
+            job.metadata = md
+            print(f"[Runner] RESCORED {job.id}: {previous} -> {pm.result.match_percent}")
+            self.repo.update_job_status(
+                job,
+                match_percent=pm.result.match_percent,
+                notes=f"Rescored after description change: {pm.result.reasons}",
+                row_idx=row_map.get(job.id),
+                metadata=md,
+            )
+        return report
+
     # provider: BaseProvider
     # sheets: SheetsClient
     # jobs_sheet_name: str = "jobs" # Change the default to whatevr is used
 
+    @staticmethod
+    def _apply_queue(apply_cfg: dict) -> ApplyQueue:
+        queue_cfg = apply_cfg.get("queue") or {}
+        return ApplyQueue(
+            queue_cfg.get("path") or data_dir("apply_queue.sqlite3"),
+            max_attempts=int(queue_cfg.get("max_attempts", 3)),
+            lease_s=float(queue_cfg.get("lease_s", 600)),
+        )
+
+    @staticmethod
+    def _apply_scheduler(apply_cfg: dict) -> ApplyScheduler:
+        return ApplyScheduler.from_config(apply_cfg.get("schedule"), path=data_dir("apply_scheduler.json"))
+
+    def _record_apply_result(
+            self,
+            job: JobPosting,
+            result: ApplyResult,
+            row_idx: int | None,
+            dupes: DuplicateIndex | None,
+            apply_cfg: dict,
+    ) -> None:
+        """Write one apply result to the sheet (and the duplicate clusters)."""
+        match_percent = float((job.metadata or {}).get("match_percent", 0.0))
+        print(
+            f"[Runner] [APPLY RESULT] job={job.id} "
+            f"status={result.status!r} notes={result.notes!r}"
+        )
+
+        now_iso = datetime.now(timezone.utc).isoformat()
+        # APPLIED or already applied on Dice -> Yes; confirmation miss
+        # after submit -> blank/uncertain; everything else -> No
+        applied = applied_value(result)
+        notes = result.notes or f"Apply status: {result.status}"
+
+        print(
+            f"[Runner] [APPLY DECISION] job={job.id} "
+            f"result.status={result.status!r} -> applied={applied!r}"
+        )
+        if dupes is not None:
+            dupes.record_applied(job, applied)
+
+        print(f"Updading sheet for {job.id} applied={applied}")
+
+        self.repo.update_job_status(
+            job,
+            match_percent=match_percent,
+            applied=applied,
+            applied_at=now_iso if applied == "Yes" else "",
+            notes=notes,
+            row_idx=row_idx,
+        )
+        print(f"Updated sheet OK for {job.id}")
+        # Sheets write pacing; the next job's tab keeps loading meanwhile
+        time.sleep(float(apply_cfg.get("pace_s", 1.5)))
+
+    def connect(self) -> tuple[DiceProvider, Callable[[], None]]:
+        """
+        A fresh driver with a logged-in provider, and the function that
+        closes it (quits the driver, reports wait latencies).
+        """
+        browser_cfg = self.cfg.get("browser") or {}
+        latency = self._latency_recorder(browser_cfg)
+        driver = build_driver(
+            headless=False,
+            event_waits=browser_cfg.get("event_waits"),
+            latency=latency,
+            instrument=bool(browser_cfg.get("instrument", False)),
+        )
+
+        def close() -> None:
+            try:
+                driver.quit()
+            finally:
+                if latency is not None:
+                    self._report_latency(latency)
+
+        try:
+            provider = DiceProvider(driver, self.cfg)
+            with metrics.timer("login"):
+                provider.login()
+        except BaseException:
+            close()
+            raise
+        return provider, close
+
+    def apply_worker(self, limit: int | None = None) -> Dict[str, int]:
+        """
+        Drain the apply queue: recover jobs a crashed run left half-applied,
+        then walk each queued job through the Easy Apply steps, one at a
+        time, updating the sheet as results come in. Returns the queue's
+        state counts.
+        """
+        apply_cfg = self.cfg.get("apply") or {}
+        scheduler = self._apply_scheduler(apply_cfg)
+        queue = self._apply_queue(apply_cfg)
+        recovered = queue.recover()
+        if recovered:
+            print(f"[Runner] Requeued {recovered} interrupted applications")
+        if not queue.pending(limit=1):
+            counts = queue.counts()
+            print(f"[Runner] Nothing queued to apply => {counts}")
+            queue.close()
+            return counts
+
+        dedupe_cfg = (self.cfg.get("matching") or {}).get("dedupe") or {}
+        dupes = None
+        if dedupe_cfg.get("enabled", False):
+            dupes = DuplicateIndex(
+                dedupe_cfg.get("path") or data_dir("dedupe.sqlite3"),
+                threshold=float(dedupe_cfg.get("threshold", 0.8)),
+            )
+
+        def before_apply(job: JobPosting):
+            print(f"[Runner] APPLYING => {job.id} {job.title} | {job.url}")
+            if dupes is not None and dupes.cluster_applied(job) == "Yes":
+                return f"Skipped: duplicate of {job.metadata.get('duplicate_of')} was already applied to"
+            return None
+
+        def record_result(item: QueueItem, result: ApplyResult) -> None:
+            status = (result.status or "").upper()
+            # Skips (duplicates, already applied) take no apply time
+            scheduler.observe(applied=status == "APPLIED", timed=status != "SKIPPED")
+            self._record_apply_result(item.job, result, item.row_idx, dupes, apply_cfg)
+
+        print("[Runner] Starting apply worker")
+        metrics.reset()
+        provider, close = self.connect()
+        try:
+            scheduler.start()
+            items = scheduler.rank(queue.pending())[:limit]
+            print(f"[Runner] Apply schedule => {scheduler.plan_text(len(items))}")
+            counts = drain(
+                queue, provider, items=items, before_apply=before_apply, on_result=record_result, stop=scheduler.admit
+            )
+            print(f"[Runner] Apply scheduler => {scheduler.summary()}")
+            scheduler.save()
+            print(f"[Runner] Tabs => {provider.tabs.summary()}")
+            print(f"[Runner] Apply queue => {counts}")
+            return counts
+        finally:
+            self._report_commands(provider)
+            close()
+            queue.close()
+            if dupes is not None:
+                dupes.close()
+            self._report_metrics()
+
     def run_once(self, max_results: int = 10) -> List[JobPosting]:
         """
         Single-shot run:
@@ -68,224 +563,14 @@ class JobPilotRunner:
         3) Append them to Sheets
         4) Return the list of JobPosting objects
         """
-        driver = build_driver(headless=False)
+        print("[Runner] Starting run_once")
+        metrics.reset()
+        provider, close = self.connect()
         try: 
-            provider = DiceProvider(driver, self.cfg)
-            print("[Runner] Starting run_once")
-            provider.login()
-
-            jobs = provider.search(max_results=max_results)
-            # ------------------------------------------------------------
-            # 1) FILTER OUT JOBS ALREADY IN GOOGLE SHEETS BEFORE SAVE_JOBS
-            # ------------------------------------------------------------
-            existing_by_id = self.repo.get_existing_jobs_id(provider.NAME)
-            
-            fresh_jobs: List[JobPosting] = []
-            for job in jobs:
-                if job.id in existing_by_id:
-                    print(f"[Runner] SKIP EXISTING => {job.id}")
-                    continue
-                # existing = existing_by_id.get(job.id)
-                # if existing:
-                #     row_idx, row_values = existing
-                #     already_applied = self.repo.is_applied_row(provider.NAME, row_values)
-
-                #     if already_applied:
-                #         print(f"[Runner] SKIP EXISTING APPLIED => {job.id}")
-                #     else:
-                #         print(f"[Runner] SKIP EXISTING => {job.id}")
-
-                    # Do not append dupe rows from previous runs
-                    # continue
-
-                fresh_jobs.append(job)
-
-            jobs = fresh_jobs
-            
-            if not jobs:
-                print("[Runner] No new jobs to process after existing-sheet filter")
-                return []
-            
-            resume_text = self._load_resume_text()
-            matcher = JobMatcher(resume_text=resume_text)
-
-            scored_jobs: List[JobPosting] = []
-            # --------------------------------------------------
-            # 2) SCORE ONLY NEW JOBS
-            # --------------------------------------------------
-            for job in jobs:
-                desc = provider.get_job_description(job)
-                match_result = matcher.top_score(job, desc)
-
-                # Attach match info to metadata for SheetsClient
-                md = dict(job.metadata or {})
-                md["match_percent"] = match_result.match_percent
-                md["recommended"] = match_result.recommended
-                md["match_reasons"] = match_result.reasons
-                job.metadata = md
-
-                scored_jobs.append(job)
-
-            # ---------------------------------------------------
-            # 3) SAVE ONLY NEW JOBS
-            # ---------------------------------------------------
-            # use repo to select correct sheet and write
-            # self.repo.save_jobs(provider.NAME, scored_jobs)
-            row_map = self.repo.save_jobs(provider.NAME, scored_jobs)
-
-            # ---------------------------------------------------
-            # 4) Decide apply vs skip + record application status
-            # ---------------------------------------------------
-            for job in scored_jobs:
-                match_percent = float(job.metadata.get("match_percent", 0.0))
-                recommended = bool(job.metadata.get("recommended", False))
-                print(
-                    f"[Runner] job={job.id} easy_apply={job.easy_apply} "
-                    f"recommended={recommended} match={match_percent}"
-                )
-
-                # Default: skipped, log why
-                applied = "No"
-                notes = f"Only {match_percent}% match. Match score is too low."
-
-                # result = None
-
-                if recommended and job.easy_apply:
-                    print(f"[Runner] APPLYING => {job.id} {job.title} | {job.url}")
-
-                    result = provider.apply(job)
-
-                    print(
-                        f"[Runner] [APPLY RESULT] job={job.id} "
-                        f"status={result.status!r} notes={result.notes!r}"
-                    )
-
-                    now_iso = datetime.now(timezone.utc).isoformat()
-                    status = (result.status or "").upper()
-                    notes_lower = (result.notes or "").lower()
-
-                    # Better applied mapping:
-                    # - APPLIED -> Yes
-                    # - already applied on Dice -> Yes
-                    # - confirmation miss after submit -> blank/uncertain
-                    # - everything else -> No
-                    if status == "APPLIED":
-                        applied = "Yes"
-                    elif status == "SKIPPED" and "already applied" in notes_lower:
-                        applied = "Yes"
-                    elif status == "ERROR" and "confirmation was not detected" in notes_lower:
-                        applied = ""
-                    else: 
-                        applied = "No"
-
-                    notes = result.notes or f"Apply status: {result.status}"
-
-                    print(
-                        f"[Runner] [APPLY DECISION] job={job.id} "
-                        f"result.status={result.status!r} -> applied={applied!r}"
-                    )
-
-                    print(f"Updading sheet for {job.id} applied={applied}")
-
-                    self.repo.update_job_status(
-                        job,
-                        match_percent=match_percent,
-                        applied=applied,
-                        applied_at=now_iso if applied == "Yes" else "",
-                        notes=notes,
-                        row_idx=row_map.get(job.id)
-                    )
-                    print(f"Updated sheet OK for {job.id}")
-                    time.sleep(1.5)
-                else: 
-                    print(
-                        f"[Runner] SKIP => {job.id} recommended={recommended}"
-                        f"easy_apply={job.easy_apply}"
-                    )
-                    reason = []
-                    if not recommended:
-                        reason.append("match below threshold")
-                    if not job.easy_apply:
-                        reason.append("Not Easy Apply")
-                    notes = "; ".join(reason)
-
-                    print(f"Updating sheet for {job.id} applied={applied}")
-
-                    self.repo.update_job_status(
-                        job,
-                        match_percent=match_percent,
-                        applied="No",
-                        notes=notes,
-                        row_idx=row_map.get(job.id),
-                    )
-                    time.sleep(1.5)
-
-                    # Check if the job was applied for
-                #     if self.repo.was_already_applied(job.provider, job.id):
-                #         print(f"[Runner] SKIP => {job.id} already applied in sheet")
-                #         self.repo.update_job_status(
-                #             job, 
-                #             match_percent=match_percent,
-                #             applied="No",
-                #             notes="Skipped: job already marked applied in Google Sheets.",
-                #             row_idx=row_map.get(job.id)
-                #         )
-                #         time.sleep(1.5)
-                #         continue
-
-                #     print(f"[Runner] APPLYING => {job.id} {job.title} | {job.url}")
-                #     # Call provider.apply()
-                #     result = provider.apply(job)
-                #     # Status update DEBUG
-                #     print(
-                #         f"[Runner][APPLY RESULT] job={job.id} "
-                #         f"status={result.status!r} notes={result.notes!r}"
-                #     )
-                #     now_iso = datetime.now(timezone.utc).isoformat()
-                    
-                #     applied = "Yes" if result.status == "APPLIED" else "No"
-                #     notes = result.notes or f"Apply status: {result.status}"
-
-                #     # Apply status debug
-                #     print(
-                #         f"[Runner][APPLY DECISION] job={job.id} "
-                #         f"result.status={result.status!r} -> applied={applied!r}"
-                #     )
-
-                #     print("Updating sheet for", job.id, "applied=", applied)
-                    
-                #     self.repo.update_job_status(
-                #         job,
-                #         match_percent=match_percent,
-                #         applied=applied,
-                #         applied_at=now_iso if applied == "Yes" else "",
-                #         notes=notes,
-                #         row_idx=row_map.get(job.id)
-                #     )
-                #     print("Updated sheet OK for", job.id)
-                #     time.sleep(1.5)
-                # else:
-                #     print(f"[Runner] SKIP => {job.id} recommended={recommended} easy_apply={job.easy_apply}")
-                #     # Not recomened (low match %) OR not Easy Apply
-                #     reason = []
-                #     if not recommended:
-                #         reason.append("match below threshold")
-                #     if not job.easy_apply:
-                #         reason.append("Not Easy Apply")
-                #     notes = "; ".join(reason)
-
-                #     print("Updating sheet for", job.id, "applied=", applied)
-                #     self.repo.update_job_status(
-                #         job, 
-                #         match_percent=match_percent,
-                #         applied="No",
-                #         notes=notes
-                #     )
-                #     time.sleep(1.5)
-            return scored_jobs
+            return self.run_cycle(provider, max_results=max_results)
 
         finally:
-            driver.quit()    
+            close()
         # print("[Runner] Starting run_once")
         # # 1. Login
         # provider.login()
@@ -310,4 +595,419 @@ class JobPilotRunner:
         # print("[Runner] append_job() completed")
 
         # # 4. Return the list for any further scripts to use
-        # return jobs
\ No newline at end of file
+        # return jobs
+
+    def run_cycle(
+            self,
+            provider: BaseProvider,
+            max_results: int = 10,
+            scheduler: ApplyScheduler | None = None,
+            date_posted: str | None = None,
+            stop: Callable[[], Optional[str]] | None = None,
+    ) -> List[JobPosting]:
+        """
+        One search -> score -> save -> apply pass on a logged-in provider
+        (run_once's body; the daemon calls it on a warm driver every tick).
+        Stage timings collected along the way are reported at the end.
+
+        - date_posted: Dice "posted within" filter for this search (None: unfiltered)
+        - stop(): checked before each application; a reason ends the apply
+          stage after the job in flight (the rest stays queued)
+        """
+        if scheduler is None:
+            scheduler = self._apply_scheduler(self.cfg.get("apply") or {})
+        try:
+            # The cycle's SQLite stores are closed on every path (a daemon
+            # tick that fails must not leak them into the next one)
+            with ExitStack() as closing, metrics.timer("cycle"):
+                jobs = self._cycle(provider, max_results, scheduler, date_posted, stop, closing)
+            metrics.inc("jobs_new", len(jobs))
+            return jobs
+        finally:
+            self._report_commands(provider)
+            self._report_metrics()
+
+    def _cycle(
+            self,
+            provider: BaseProvider,
+            max_results: int,
+            scheduler: ApplyScheduler,
+            date_posted: str | None,
+            stop: Callable[[], Optional[str]] | None,
+            closing: ExitStack,
+    ) -> List[JobPosting]:
+        jobs = provider.search(max_results=max_results, date_posted=date_posted)
+        # ------------------------------------------------------------
+        # 1) FILTER OUT JOBS ALREADY IN GOOGLE SHEETS BEFORE SAVE_JOBS
+        # ------------------------------------------------------------
+        existing_by_id = self.repo.get_existing_jobs_id(provider.NAME)
+        
+        fresh_jobs: List[JobPosting] = []
+        for job in jobs:
+            if job.id in existing_by_id:
+                print(f"[Runner] SKIP EXISTING => {job.id}")
+                continue
+            # existing = existing_by_id.get(job.id)
+            # if existing:
+            #     row_idx, row_values = existing
+            #     already_applied = self.repo.is_applied_row(provider.NAME, row_values)
+
+            #     if already_applied:
+            #         print(f"[Runner] SKIP EXISTING APPLIED => {job.id}")
+            #     else:
+            #         print(f"[Runner] SKIP EXISTING => {job.id}")
+
+                # Do not append dupe rows from previous runs
+                # continue
+
+            fresh_jobs.append(job)
+
+        jobs = fresh_jobs
+        
+        if not jobs:
+            print("[Runner] No new jobs to process after existing-sheet filter")
+            return []
+
+        # ------------------------------------------------------------
+        # 1b) CARD RULES: reject on title/company/easy-apply before any
+        #     detail page is opened; rejects are still saved, with notes
+        # ------------------------------------------------------------
+        filtered_jobs: List[JobPosting] = []
+        if self.card_rules is not None:
+            jobs, rejected = self.card_rules.split(jobs)
+            for job, rule, reason in rejected:
+                md = dict(job.metadata or {})
+                md["filtered_by_rule"] = rule
+                md["recommended"] = False
+                md["applied"] = "No"
+                md["application_status_notes"] = f"Filtered before detail load: {reason}"
+                job.metadata = md
+                filtered_jobs.append(job)
+            print(
+                f"[Runner] Card rules rejected {len(rejected)} of {len(jobs) + len(rejected)} jobs "
+                f"({len(rejected)} detail loads avoided): {CardRules.summarize(rejected)}"
+            )
+            if not jobs:
+                self.repo.save_jobs(provider.NAME, filtered_jobs)
+                print("[Runner] No jobs left to score after card rules")
+                return []
+        
+        match_cfg = self.cfg.get("matching", {}) or {}
+        scoring = self._build_scoring(match_cfg)
+        matcher, variants, profiles = scoring.matcher, scoring.variants, scoring.profiles
+        corpus_index, score_cache, condenser = scoring.corpus_index, scoring.score_cache, scoring.condenser
+        if score_cache is not None:
+            closing.callback(score_cache.close)
+
+        scored_jobs: List[JobPosting] = []
+        # --------------------------------------------------
+        # 2) SCORE ONLY NEW JOBS
+        # --------------------------------------------------
+        # Descriptions come from the browser one at a time; scoring
+        # then runs as a batch so LLM calls can overlap.
+        dedupe_cfg = match_cfg.get("dedupe") or {}
+        dupes = None
+        card_matches: List = [None] * len(jobs)
+        if dedupe_cfg.get("enabled", False):
+            dupes = DuplicateIndex(
+                dedupe_cfg.get("path") or data_dir("dedupe.sqlite3"),
+                threshold=float(dedupe_cfg.get("threshold", 0.8)),
+            )
+            closing.callback(dupes.close)
+            if dedupe_cfg.get("skip_fetch_on_card_match", False):
+                # Same title + company as a scored posting: reuse it, no detail page
+                card_matches = [dupes.find_card(job) for job in jobs]
+
+        descriptions: List[str] = []
+        fetch_s: List[float] = []
+        for job, card_match in zip(jobs, card_matches):
+            started = time.perf_counter()
+            if card_match is not None:
+                descriptions.append("")
+            else:
+                with metrics.timer("description_fetch"):
+                    descriptions.append(provider.get_job_description(job))
+            fetch_s.append(time.perf_counter() - started)
+        dup_matches = dupes.plan(jobs, descriptions, known=card_matches) if dupes else [None] * len(jobs)
+        to_score = [
+            i for i, m in enumerate(dup_matches)
+            if m is None or (not m.has_decision and m.batch_index is None)
+        ]
+
+        score_started = time.perf_counter()
+        scored_results = matcher.top_score_many(
+            [jobs[i] for i in to_score],
+            [descriptions[i] for i in to_score],
+            **self._score_kwargs(match_cfg),
+        )
+        # Scoring runs as a batch: each scored job gets an equal share
+        share = (time.perf_counter() - score_started) / max(len(to_score), 1)
+        score_s = [0.0] * len(jobs)
+        for i in to_score:
+            score_s[i] = share
+        metrics.inc("jobs_scored", len(to_score))
+        profile_matches: List = [None] * len(jobs)
+        for i, pm in zip(to_score, scored_results):
+            profile_matches[i] = pm
+        # Near-duplicates reuse their cluster's score (in index order, so an
+        # in-batch representative is always filled in first). A stored
+        # decision has no profile attached: it goes to the first profile.
+        for i, dup in enumerate(dup_matches):
+            if profile_matches[i] is None:
+                source = profile_matches[dup.batch_index] if dup.batch_index is not None else None
+                result = DuplicateIndex.reuse_result(jobs[i], dup, source.result if source else None)
+                profile_matches[i] = ProfileMatch(
+                    result=result,
+                    profile=source.profile if source else matcher.names[0],
+                    scores=dict(source.scores) if source else {},
+                )
+
+        # Hash of each fetched description, so `refresh` can tell edited postings
+        desc_store = DescriptionStore(data_dir("descriptions.sqlite3"))
+        closing.callback(desc_store.close)
+        stage_timings = bool((self.cfg.get("metrics") or {}).get("job_metadata", False))
+        for job, pm, dup, desc, fetched_in, scored_in in zip(
+                jobs, profile_matches, dup_matches, descriptions, fetch_s, score_s
+        ):
+            match_result = pm.result
+            # Attach match info to metadata for SheetsClient
+            md = dict(job.metadata or {})
+            if desc:
+                md["description_hash"] = description_hash(desc)
+                desc_store.record(job, "browser", md["description_hash"])
+            md["match_percent"] = match_result.match_percent
+            md["recommended"] = match_result.recommended
+            md["match_reasons"] = match_result.reasons
+            if len(variants) > 1:
+                md["best_profile"] = pm.profile
+                md["profile_scores"] = pm.scores_text()
+            if dup is not None:
+                md["duplicate_of"] = dup.key
+                md["duplicate_cluster"] = dup.cluster
+                md["duplicate_similarity"] = dup.similarity
+            if stage_timings:
+                md["stage_timings"] = {
+                    "description_fetch_s": round(fetched_in, 3),
+                    "score_s": round(scored_in, 3),
+                }
+            if dupes is not None:
+                dupes.record_score(job, match_result.match_percent, match_result.recommended, match_result.reasons)
+            job.metadata = md
+
+            scored_jobs.append(job)
+
+        semantic_cfg = match_cfg.get("semantic") or {}
+        if semantic_cfg.get("enabled", False):
+            self._semantic_rank(scored_jobs, descriptions, [p.text for p in profiles.values()], semantic_cfg)
+
+        if corpus_index is not None:
+            # Keep document frequencies from this run for the next one
+            corpus_index.save()
+            print(f"[Runner] Corpus index now covers {corpus_index.n_docs} descriptions")
+        print(
+            f"[Runner] Scored {len(jobs)} jobs: llm_scored={matcher.stats['llm_scored']} "
+            f"llm_skipped={matcher.stats['llm_skipped']} "
+            f"(cascade reject={matcher.stats['cascade_reject']} accept={matcher.stats['cascade_accept']} "
+            f"skill prefilter reject={matcher.stats['prefilter_reject']})"
+        )
+        if dupes is not None:
+            print(f"[Runner] Near-duplicate postings => {dupes.stats}")
+        if condenser is not None:
+            print(f"[Runner] Condensed descriptions => {condenser.summary()}")
+        if score_cache is not None:
+            print(f"[Runner] LLM score cache => {score_cache.stats()}")
+
+        # ---------------------------------------------------
+        # 3) SAVE ONLY NEW JOBS
+        # ---------------------------------------------------
+        # use repo to select correct sheet and write
+        # self.repo.save_jobs(provider.NAME, scored_jobs)
+        row_map = self.repo.save_jobs(provider.NAME, scored_jobs + filtered_jobs)
+
+        # ---------------------------------------------------
+        # 4) Decide apply vs skip + record application status
+        # ---------------------------------------------------
+        # Skips are recorded right away; applies go through the pipeline,
+        # which loads the next job's tab while the current one submits.
+        apply_cfg = self.cfg.get("apply") or {}
+        to_apply: List[JobPosting] = []
+        for job in scored_jobs:
+            match_percent = float(job.metadata.get("match_percent", 0.0))
+            recommended = bool(job.metadata.get("recommended", False))
+            print(
+                f"[Runner] job={job.id} easy_apply={job.easy_apply} "
+                f"recommended={recommended} match={match_percent}"
+            )
+
+            # Default: skipped, log why
+            applied = "No"
+
+            # Another posting of the same role was already applied to
+            duplicate_applied = dupes is not None and dupes.cluster_applied(job) == "Yes"
+
+            if recommended and job.easy_apply and not duplicate_applied:
+                to_apply.append(job)
+            else: 
+                print(
+                    f"[Runner] SKIP => {job.id} recommended={recommended}"
+                    f"easy_apply={job.easy_apply}"
+                )
+                reason = []
+                if not recommended:
+                    reason.append("match below threshold")
+                if not job.easy_apply:
+                    reason.append("Not Easy Apply")
+                if duplicate_applied:
+                    reason.append(f"duplicate of {job.metadata.get('duplicate_of')} (already applied)")
+                notes = "; ".join(reason)
+
+                print(f"Updating sheet for {job.id} applied={applied}")
+
+                self.repo.update_job_status(
+                    job,
+                    match_percent=match_percent,
+                    applied="No",
+                    notes=notes,
+                    row_idx=row_map.get(job.id),
+                )
+                time.sleep(1.5)
+
+        def resume_for(job: JobPosting):
+            # Attach the winning variant's resume (None: keep the provider's)
+            best = job.metadata.get("best_profile")
+            return variants[best]["upload"] if best in variants else None
+
+        def before_apply(job: JobPosting):
+            print(f"[Runner] APPLYING => {job.id} {job.title} | {job.url}")
+            # A copy of this role may have been applied to earlier in this batch
+            if dupes is not None and dupes.cluster_applied(job) == "Yes":
+                return f"Skipped: duplicate of {job.metadata.get('duplicate_of')} was applied to in this run"
+            return None
+
+        # Every job handed to the pipeline is also in the durable apply
+        # queue, so `jobpilot apply-worker` can retry errors and resume
+        # after a crash
+        queue = self._apply_queue(apply_cfg)
+        closing.callback(queue.close)
+        for job in to_apply:
+            queue.enqueue(
+                job,
+                resume_path=resume_for(job),
+                row_idx=row_map.get(job.id),
+                priority=float(job.metadata.get("match_percent", 0.0)),
+            )
+
+        # The scheduler decides what this run applies to: best matches
+        # first (leftovers from earlier runs included), within the
+        # per-run budget and deadline. The rest stays queued.
+        scheduler.start()
+        items = scheduler.rank(queue.pending())
+        queued_rows = {item.key: item.row_idx for item in items}
+        queued_resumes = {item.key: item.resume_path for item in items}
+        if items:
+            print(f"[Runner] Apply schedule => {scheduler.plan_text(len(items))}")
+
+        # The pipeline reports each step, so the queue moves through the
+        # same states as drain() and a crash mid-apply is recovered from there
+        step_states = {"open": OPENED, "step1": STEP1, "step2": STEP2, "submit": SUBMITTED}
+
+        def record_step(job: JobPosting, step: str) -> None:
+            queue.transition(ApplyQueue.key(job), step_states[step])
+
+        def record_result(job: JobPosting, result) -> None:
+            key = ApplyQueue.key(job)
+            if queue.state(key) in (QUEUED,) + ACTIVE:
+                queue.record_result(key, result)
+            status = (result.status or "").upper()
+            # Skips (duplicates, already applied) take no apply time
+            scheduler.observe(applied=status == "APPLIED", timed=status != "SKIPPED")
+            row_idx = row_map.get(job.id, queued_rows.get(key))
+            self._record_apply_result(job, result, row_idx, dupes, apply_cfg)
+
+        def stop_applying() -> Optional[str]:
+            # The caller's stop request (the daemon's SIGTERM) wins over the schedule
+            return (stop() if stop is not None else None) or scheduler.admit()
+
+        if items:
+            pipeline = ApplyPipeline(provider, depth=int(apply_cfg.get("pipeline_depth", 2)))
+            pipeline.run(
+                [item.job for item in items],
+                resume_for=lambda job: queued_resumes.get(ApplyQueue.key(job)),
+                before_apply=before_apply,
+                on_result=record_result,
+                stop=stop_applying,
+                on_step=record_step,
+            )
+            # Tabs opened ahead of a stop were closed unused: back in line, no attempt spent
+            for item in items:
+                if queue.state(item.key) == OPENED:
+                    queue.transition(item.key, QUEUED, "not reached this run")
+            print(f"[Runner] Apply pipeline (depth {pipeline.depth}) timings => {pipeline.summary()}")
+            print(f"[Runner] Apply scheduler => {scheduler.summary()}")
+            scheduler.save()
+        print(f"[Runner] Apply queue => {queue.counts()}")
+
+                # Check if the job was applied for
+            #     if self.repo.was_already_applied(job.provider, job.id):
+            #         print(f"[Runner] SKIP => {job.id} already applied in sheet")
+            #         self.repo.update_job_status(
+            #             job, 
+            #             match_percent=match_percent,
+            #             applied="No",
+            #             notes="Skipped: job already marked applied in Google Sheets.",
+            #             row_idx=row_map.get(job.id)
+            #         )
+            #         time.sleep(1.5)
+            #         continue
+
+            #     print(f"[Runner] APPLYING => {job.id} {job.title} | {job.url}")
+            #     # Call provider.apply()
+            #     result = provider.apply(job)
+            #     # Status update DEBUG
+            #     print(
+            #         f"[Runner][APPLY RESULT] job={job.id} "
+            #         f"status={result.status!r} notes={result.notes!r}"
+            #     )
+            #     now_iso = datetime.now(timezone.utc).isoformat()
+                
+            #     applied = "Yes" if result.status == "APPLIED" else "No"
+            #     notes = result.notes or f"Apply status: {result.status}"
+
+            #     # Apply status debug
+            #     print(
+            #         f"[Runner][APPLY DECISION] job={job.id} "
+            #         f"result.status={result.status!r} -> applied={applied!r}"
+            #     )
+
+            #     print("Updating sheet for", job.id, "applied=", applied)
+                
+            #     self.repo.update_job_status(
+            #         job,
+            #         match_percent=match_percent,
+            #         applied=applied,
+            #         applied_at=now_iso if applied == "Yes" else "",
+            #         notes=notes,
+            #         row_idx=row_map.get(job.id)
+            #     )
+            #     print("Updated sheet OK for", job.id)
+            #     time.sleep(1.5)
+            # else:
+            #     print(f"[Runner] SKIP => {job.id} recommended={recommended} easy_apply={job.easy_apply}")
+            #     # Not recomened (low match %) OR not Easy Apply
+            #     reason = []
+            #     if not recommended:
+            #         reason.append("match below threshold")
+            #     if not job.easy_apply:
+            #         reason.append("Not Easy Apply")
+            #     notes = "; ".join(reason)
+
+            #     print("Updating sheet for", job.id, "applied=", applied)
+            #     self.repo.update_job_status(
+            #         job, 
+            #         match_percent=match_percent,
+            #         applied="No",
+            #         notes=notes
+            #     )
+            #     time.sleep(1.5)
+        print(f"[Runner] Tabs => {provider.tabs.summary()}")
+        return scored_jobs
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import json, os, time
+from datetime import datetime
+from typing import List, Optional
+
+from jobpilot.orchestrator.apply_queue import QueueItem
+
+
+class ApplyScheduler:
+    """
+    Decides which queued jobs get applied to in this run, and in what order.
+
+    rank() puts the best matches first (queue priority = match_percent);
+    equal scores go closest to the resume first (semantic_score, when the
+    semantic layer is on), then most recently posted (jobs whose card
+    showed no posting age go after those, newest enqueued first). admit() is asked before each job's
+    turn and returns a reason to stop when the per-run budget of
+    applications is used up, or when the deadline would pass before
+    another apply finishes. Jobs not reached simply stay queued for the
+    next run or `jobpilot apply-worker`.
+
+    The time one apply takes is an EWMA of the observed gaps between
+    results (so pipeline overlap is included), kept on disk between runs.
+    Only attempts that went through the apply steps feed it; an instant
+    skip just restarts the clock for the next gap.
+    """
+
+    def __init__(
+            self,
+            max_applications: Optional[int] = None,
+            deadline_s: Optional[float] = None,
+            estimate_s: float = 45.0,
+            alpha: float = 0.3,
+            path: Optional[str] = None,
+    ) -> None:
+        self.max_applications = int(max_applications) if max_applications else None
+        self.deadline_s = float(deadline_s) if deadline_s else None
+        self.estimate_s = float(estimate_s)
+        self.alpha = float(alpha)
+        self.path = path
+        self.started = time.monotonic()
+        self.last_result = None
+        self.applied = 0
+        self.attempted = 0
+        self.stopped: Optional[str] = None
+        if path and os.path.exists(path):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    self.estimate_s = float(json.load(f).get("apply_estimate_s", self.estimate_s))
+            except (OSError, ValueError, AttributeError) as e:
+                print(f"[Scheduler] Ignoring unreadable estimate file {path}: {e}")
+
+    @classmethod
+    def from_config(cls, schedule_cfg: Optional[dict], path: Optional[str] = None) -> "ApplyScheduler":
+        cfg = schedule_cfg or {}
+        deadline_min = cfg.get("deadline_min")
+        return cls(
+            max_applications=cfg.get("max_applications"),
+            deadline_s=float(deadline_min) * 60.0 if deadline_min else None,
+            estimate_s=float(cfg.get("apply_estimate_s", 45.0)),
+            alpha=float(cfg.get("ewma_alpha", 0.3)),
+            path=path,
+        )
+
+    def start(self) -> None:
+        """The deadline counts from here (the start of the apply stage)."""
+        self.started = time.monotonic()
+
+    @staticmethod
+    def rank(items: List[QueueItem]) -> List[QueueItem]:
+        return sorted(
+            items,
+            key=lambda item: (-item.priority, -_semantic_score(item), -_posted_ts(item), -item.created_at),
+        )
+
+    def remaining_s(self) -> Optional[float]:
+        if self.deadline_s is None:
+            return None
+        return self.deadline_s - (time.monotonic() - self.started)
+
+    def eta_s(self, n_jobs: int) -> float:
+        return n_jobs * self.estimate_s
+
+    def admit(self) -> Optional[str]:
+        """None: go ahead with the next job; otherwise why the run stops applying."""
+        if self.stopped is None:
+            if self.max_applications is not None and self.applied >= self.max_applications:
+                self.stopped = f"budget of {self.max_applications} applications reached"
+            else:
+                remaining = self.remaining_s()
+                if remaining is not None and remaining < self.estimate_s:
+                    self.stopped = (
+                        f"deadline: {max(remaining, 0):.0f}s left, an apply takes ~{self.estimate_s:.0f}s"
+                    )
+        if self.stopped is None and self.last_result is None:
+            # Gap to the first result is measured from the first admit
+            self.last_result = time.monotonic()
+        return self.stopped
+
+    def observe(self, applied: bool, timed: bool = True) -> None:
+        """
+        One job finished (applied or not). With `timed` (it went through
+        the apply steps) the gap since the last result updates the estimate.
+        """
+        now = time.monotonic()
+        if timed and self.last_result is not None:
+            gap = now - self.last_result
+            self.estimate_s = self.alpha * gap + (1 - self.alpha) * self.estimate_s
+        self.last_result = now
+        self.attempted += 1
+        self.applied += int(bool(applied))
+
+    def plan_text(self, n_jobs: int) -> str:
+        parts = [f"{n_jobs} queued", f"~{self.estimate_s:.0f}s/apply", f"eta {self.eta_s(n_jobs) / 60:.1f} min"]
+        if self.max_applications is not None:
+            parts.append(f"budget {self.max_applications}")
+        remaining = self.remaining_s()
+        if remaining is not None:
+            parts.append(f"{max(remaining, 0) / 60:.1f} min to deadline")
+        return ", ".join(parts)
+
+    def save(self) -> None:
+        if not self.path:
+            return
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump({"apply_estimate_s": round(self.estimate_s, 3)}, f)
+
+    def summary(self) -> dict:
+        return {
+            "attempted": self.attempted,
+            "applied": self.applied,
+            "apply_estimate_s": round(self.estimate_s, 1),
+            "stopped": self.stopped or "",
+        }
+
+
+def _semantic_score(item: QueueItem) -> float:
+    """Resume similarity set by the runner's semantic layer, 0 when off."""
+    return float((item.job.metadata or {}).get("semantic_score") or 0.0)
+
+
+def _posted_ts(item: QueueItem) -> float:
+    """Posting time from the card ("posted_at" metadata), 0 when unknown."""
+    posted = (item.job.metadata or {}).get("posted_at")
+    try:
+        return datetime.fromisoformat(posted).timestamp() if posted else 0.0
+    except ValueError:
+        return 0.0
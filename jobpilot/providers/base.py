@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Iterable
+from typing import Iterable, Optional
 from jobpilot.models.job import JobPosting, ApplyResult
 
 class BaseProvider(ABC):
@@ -12,4 +12,4 @@ class BaseProvider(ABC):
     @abstractmethod
     def open_job(self, job: JobPosting): ...
     @abstractmethod
-    def apply(self, job: JobPosting) -> ApplyResult: ...
+    def apply(self, job: JobPosting, resume_path: Optional[str] = None) -> ApplyResult: ...
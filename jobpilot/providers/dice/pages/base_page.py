@@ -1,14 +1,37 @@
+import time
+
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
+from jobpilot.utils.latency import locator_name, register_locators
+from jobpilot.utils.waits import event_waits_enabled, wait_any, wait_for, wait_url_contains
+from .. import selectors
+
 DEFAULT_TIMEOUT = 20
 
+# Waits are recorded under the selector constant names
+register_locators(selectors)
+
+_EC_FOR_STATE = {
+    "present": EC.presence_of_element_located,
+    "visible": EC.visibility_of_element_located,
+    "clickable": EC.element_to_be_clickable,
+}
+
 class BasePage:
     URL = None # set by child pages
 
     def __init__(self, driver):
         self.driver = driver
         self.wait = WebDriverWait(driver, DEFAULT_TIMEOUT)
+        # Opt-in (build_driver(event_waits=True) / JOBPILOT_EVENT_WAITS=1):
+        # visible/clickable/present/url_contains resolve on DOM mutations
+        # instead of 0.5s WebDriverWait polling
+        self.event_waits = event_waits_enabled(driver)
+        # Optional LatencyRecorder (build_driver(latency=...)): every named
+        # wait is timed, and its timeout comes from the observed latencies
+        self.latency = getattr(driver, "jobpilot_latency", None)
 
     def open(self, url: str | None = None):
         target = url or self.URL
@@ -18,17 +41,83 @@ class BasePage:
         return self  # chainable
 
     def click(self, locator):
-        element = self.wait.until(EC.element_to_be_clickable(locator))
+        element = self.clickable(locator)
         element.click()
 
     def type(self, locator, text):
-        element = self.wait.until(EC.visibility_of_element_located(locator))
+        element = self.visible(locator)
         element.clear()
         element.send_keys(text)
 
+    def _timeout(self, key: str, default: float = DEFAULT_TIMEOUT) -> float:
+        if self.latency is None:
+            return default
+        return self.latency.timeout_for(key, default)
+
+    def _record(self, key: str, started: float, ok: bool) -> None:
+        if self.latency is not None:
+            self.latency.record(key, time.perf_counter() - started, ok=ok)
+
+    def _wait_for(self, locator, state: str):
+        key = f"{state}:{locator_name(locator)}"
+        timeout = self._timeout(key)
+        started = time.perf_counter()
+        try:
+            if self.event_waits:
+                element = wait_for(self.driver, locator, state, timeout)
+            elif self.latency is None:
+                element = self.wait.until(_EC_FOR_STATE[state](locator))
+            else:
+                element = WebDriverWait(self.driver, timeout).until(_EC_FOR_STATE[state](locator))
+        except TimeoutException:
+            self._record(key, started, ok=False)
+            raise
+        self._record(key, started, ok=True)
+        return element
+
     def visible(self, locator):
-        return self.wait.until(EC.visibility_of_element_located(locator))
+        return self._wait_for(locator, "visible")
+
+    def clickable(self, locator):
+        return self._wait_for(locator, "clickable")
+
+    def present(self, locator):
+        return self._wait_for(locator, "present")
+
+    def any_of(self, *waits):
+        """
+        Wait for whichever of several (locator, state) pairs is ready first,
+        e.g. any_of((NEXT_BUTTON, "clickable"), (STEP1_CONTAINER, "present")).
+
+        Fallbacks are checked together (on each DOM mutation with event
+        waits, else on every poll) instead of one full timeout after
+        another. Returns (index, element) of the first match; the time is
+        recorded under that locator's key. The timeout is the longest of
+        the alternatives' timeouts.
+        """
+        keys = [f"{state}:{locator_name(loc)}" for loc, state in waits]
+        timeout = max(self._timeout(key) for key in keys)
+        started = time.perf_counter()
+        try:
+            index, element = wait_any(self.driver, waits, timeout, event_driven=self.event_waits)
+        except TimeoutException:
+            for key in keys:
+                self._record(key, started, ok=False)
+            raise
+        self._record(keys[index], started, ok=True)
+        return index, element
     
     def url_contains(self, fragment: str):
-        self.wait.until(EC.url_contains(fragment))
-        return self
\ No newline at end of file
+        key = f"url:{fragment}"
+        timeout = self._timeout(key)
+        started = time.perf_counter()
+        try:
+            if self.event_waits:
+                wait_url_contains(self.driver, fragment, timeout)
+            else:
+                WebDriverWait(self.driver, timeout).until(EC.url_contains(fragment))
+        except TimeoutException:
+            self._record(key, started, ok=False)
+            raise
+        self._record(key, started, ok=True)
+        return self
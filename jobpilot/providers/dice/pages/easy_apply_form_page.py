@@ -1,13 +1,15 @@
 from __future__ import annotations
 
+import time
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional
 
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException
 
+from jobpilot.utils.waits import probe
 from .base_page import BasePage
 from ..selectors import (
+    JOB_DESCRIPTION_APPLIED_BUTTON,
     EASY_APPLY_STEP1_CONTAINER,
     EASY_APPLY_RESUME_REPLACE_BUTTON,
     EASY_APPLY_RESUME_FILE_INPUT,
@@ -19,6 +21,27 @@ from ..selectors import (
     EASY_APPLY_SUBMITTED_HEADER
 )
 
+# Form states, as classified by EasyApplyFormPage.probe_state()
+STATE_UNKNOWN = "unknown"                  # loading, or nothing recognised
+STATE_STEP1 = "step1"                      # resume & cover letter
+STATE_QUESTIONS = "questions"              # any other step with a Next button (screening questions)
+STATE_STEP2 = "step2"                      # review & submit
+STATE_SUBMITTED = "submitted"              # Submit clicked (set by drive(), never probed)
+STATE_CONFIRMED = "confirmed"              # post-apply banner
+STATE_ALREADY_APPLIED = "already_applied"  # the job page says "Applied"
+
+# Checked top to bottom in one script call; the first state whose checks
+# all pass wins
+STATE_PROBES = (
+    (STATE_CONFIRMED, ((EASY_APPLY_CONFIRMATION_CONTAINER, "visible"), (EASY_APPLY_SUBMITTED_HEADER, "visible"))),
+    (STATE_ALREADY_APPLIED, ((JOB_DESCRIPTION_APPLIED_BUTTON, "present"),)),
+    (STATE_STEP2, ((EASY_APPLY_SUBMIT_BUTTON, "visible"),)),
+    (STATE_STEP1, ((EASY_APPLY_STEP1_CONTAINER, "present"), (EASY_APPLY_STEP1_NEXT_BUTTON, "present"))),
+    (STATE_QUESTIONS, ((EASY_APPLY_STEP1_NEXT_BUTTON, "visible"),)),
+)
+
+_FINAL_STATES = (STATE_SUBMITTED, STATE_CONFIRMED, STATE_ALREADY_APPLIED)
+
 class EasyApplyFormPage(BasePage):
     """
     Page Object for Dice's 2-step Easy Apply flow:
@@ -32,20 +55,118 @@ class EasyApplyFormPage(BasePage):
     - click Next
     - wait for review step
     - click Submit
+
+    probe_state() tells the steps apart in one script call, and drive()
+    walks whatever order they come in (a skipped step 1, extra screening
+    question steps) through STEP_HANDLERS instead of waiting for each
+    expected step to time out.
     """
 
-    # ---------- STEP 1: RESUME & COVER LETTER ------------
-    def wait_step1_loaded(self, timeout: int = 15) -> "EasyApplyFormPage":
+    # state -> handler(resume_path); each returns the state it leaves the form in
+    STEP_HANDLERS = {
+        STATE_STEP1: "_on_step1",
+        STATE_QUESTIONS: "_on_questions",
+        STATE_STEP2: "_on_step2",
+    }
+    POLL_S = 0.2
+    # How long a step gets to move on after Next before it counts as stuck
+    # (unless learned latencies say otherwise)
+    LEAVE_TIMEOUT_S = 8.0
+
+    # ---------- STATE PROBE ------------
+    def probe_state(self) -> str:
+        """Current form state (one of the STATE_* names), in one round trip."""
+        checks = [check for _, state_checks in STATE_PROBES for check in state_checks]
+        flags = probe(self.driver, checks)
+        i = 0
+        for state, state_checks in STATE_PROBES:
+            if all(flags[i:i + len(state_checks)]):
+                return state
+            i += len(state_checks)
+        return STATE_UNKNOWN
+
+    def wait_state(
+            self,
+            accept: Optional[Iterable[str]] = None,
+            leave: Optional[str] = None,
+            timeout: Optional[float] = None,
+            left_if_stale=None,
+    ) -> str:
         """
-        Wait till Step 1 container is visible
+        Poll probe_state() until the form is in a recognised state (one of
+        `accept` if given) other than `leave`; `leave` again also counts once
+        the element `left_if_stale` is gone (another step of the same kind).
+        Recorded under "state:<state>" ("state:any!<leave>" when leaving)
+        when latencies are tracked; leaving defaults to LEAVE_TIMEOUT_S.
+        Raises TimeoutException.
+        """
+        accept = set(accept) if accept is not None else None
+        key = f"state:{'|'.join(sorted(accept)) if accept else 'any'}"
+        if leave is not None:
+            key += f"!{leave}"
+        if timeout is None:
+            timeout = self._timeout(key, self.LEAVE_TIMEOUT_S) if leave is not None else self._timeout(key)
+        started = time.perf_counter()
+        deadline = time.monotonic() + timeout
+        while True:
+            state = self.probe_state()
+            left = state != leave or (left_if_stale is not None and _is_stale(left_if_stale))
+            if state != STATE_UNKNOWN and left and (accept is None or state in accept):
+                self._record(key, started, ok=True)
+                return state
+            if time.monotonic() >= deadline:
+                self._record(key, started, ok=False)
+                raise TimeoutException(f"Easy Apply form stayed {state!r} for {timeout}s")
+            time.sleep(self.POLL_S)
+
+    def drive(self, resume_path: Optional[str | Path] = None, until: str = STATE_SUBMITTED,
+              max_steps: int = 8) -> str:
         """
+        Move through the form from wherever it is until `until` (STATE_STEP2
+        stops before Submit). Returns the state reached: `until`, or
+        confirmed / already applied if the form turned out to be past that.
+        Raises RuntimeError when a step doesn't advance (e.g. required
+        screening questions we can't answer).
+        """
+        state = self.wait_state()
+        for _ in range(max_steps):
+            if state == until or state in _FINAL_STATES:
+                return state
+            print(f"[EasyApply] Form state => {state}")
+            state = getattr(self, self.STEP_HANDLERS[state])(resume_path)
+        raise RuntimeError(f"Easy Apply form still at {state!r} after {max_steps} steps")
+
+    def _next(self, state: str) -> str:
+        button = self._click(EASY_APPLY_STEP1_NEXT_BUTTON)
         try:
-            # self.wait.until(EC.visibility_of_element_located(EASY_APPLY_STEP1_CONTAINER))
-            self.wait.until(EC.element_to_be_clickable(EASY_APPLY_STEP1_NEXT_BUTTON))
+            return self.wait_state(leave=state, left_if_stale=button)
         except TimeoutException:
-            # Looser fallback: visibility only
-            self.wait.until(EC.presence_of_element_located(EASY_APPLY_STEP1_CONTAINER))
+            raise RuntimeError(f"Easy Apply form did not move past {state!r} (required fields?)")
+
+    def _on_step1(self, resume_path) -> str:
+        self.set_resume(resume_path)
+        print("[EasyApply] Clicking NEXT")
+        return self._next(STATE_STEP1)
 
+    def _on_questions(self, resume_path) -> str:
+        print("[EasyApply] Extra step (screening questions): clicking NEXT")
+        return self._next(STATE_QUESTIONS)
+
+    def _on_step2(self, resume_path) -> str:
+        self.click_submit()
+        return STATE_SUBMITTED
+
+    # ---------- STEP 1: RESUME & COVER LETTER ------------
+    def wait_step1_loaded(self, timeout: int = 15) -> "EasyApplyFormPage":
+        """
+        Wait till Step 1 container is visible
+        """
+        # Next button clickable, or (looser fallback) the container present;
+        # both are checked together rather than one timeout after the other
+        self.any_of(
+            (EASY_APPLY_STEP1_NEXT_BUTTON, "clickable"),
+            (EASY_APPLY_STEP1_CONTAINER, "present"),
+        )
         return self
     
     def _click_replace_resume(self) -> None:
@@ -99,21 +220,21 @@ class EasyApplyFormPage(BasePage):
         # btn.click()
         print("[EasyApply] Clicking NEXT")
 
-        self._click_and_wait_stale(EASY_APPLY_STEP1_NEXT_BUTTON)
+        self._next(STATE_STEP1)
         return self
     
     # ------------ STEP 2: Review & Submit -------------
     def wait_step2_loaded(self, timeout: int = 15) -> "EasyApplyFormPage":
+        # Wait on either the main container or a stable header.
+        # self.wait.until(EC.visibility_of_element_located(EASY_APPLY_STEP2_CONTAINER))
+        # self.wait.until(EC.visibility_of_element_located(EASY_APPLY_REVIEW_RESUME_HEADER))
+        print("[EasyApply] Waiting for STEP 2 (Submit button)")
+        # Submit button visible, else at least present (click_submit waits
+        # for clickable); visible's timeout is the adaptive one
         try:
-            # Wait on either the main container or a stable header.
-            # self.wait.until(EC.visibility_of_element_located(EASY_APPLY_STEP2_CONTAINER))
-            # self.wait.until(EC.visibility_of_element_located(EASY_APPLY_REVIEW_RESUME_HEADER))
-            print("[EasyApply] Waiting for STEP 2 (Submit button)")
-            # Wait for the visability of Submit button
-            self.wait.until(EC.visibility_of_element_located(EASY_APPLY_SUBMIT_BUTTON))
-
+            self.visible(EASY_APPLY_SUBMIT_BUTTON)
         except TimeoutException:
-            self.wait.until(EC.presence_of_element_located(EASY_APPLY_SUBMIT_BUTTON))
+            self.present(EASY_APPLY_SUBMIT_BUTTON)
         return self    
     
     def click_submit(self) -> "EasyApplyFormPage":
@@ -124,15 +245,15 @@ class EasyApplyFormPage(BasePage):
         return self
     
     # ------------- Application Confirmation Page --------------
-    def wait_submission_confirmation(self, timeout: int = 15) -> bool:
+    def wait_submission_confirmation(self, timeout: Optional[float] = None) -> bool:
         """
         Wait for the post-apply confirmation banner.
         Return True if see within timeout, False otherwise.
         """
 
+        # One probe per poll instead of two visibility waits back to back
         try:
-            self.wait.until(EC.visibility_of_element_located(EASY_APPLY_CONFIRMATION_CONTAINER))
-            self.wait.until(EC.visibility_of_element_located(EASY_APPLY_SUBMITTED_HEADER))
+            self.wait_state(accept=(STATE_CONFIRMED,), timeout=timeout)
             return True
         except TimeoutException:
             return False
@@ -151,23 +272,19 @@ class EasyApplyFormPage(BasePage):
         except Exception:
             return False
         
-    def _click(self, locator, timeout: int=15) -> None:
-        el = self.wait.until(EC.element_to_be_clickable(locator))
+    def _click(self, locator, timeout: int=15):
+        el = self.clickable(locator)
         self.driver.execute_script("arguments[0].scrollIntoView({block:'center'});", el)
         try:
             el.click()
         except Exception:
             self.driver.execute_script("arguments[0].click();", el)
+        return el
 
 
-    def _click_and_wait_stale(self, locator, timeout: int = 15) -> None:
-        el = self.wait.until(EC.element_to_be_clickable(locator))
-        self.driver.execute_script("arguments[0].scrollIntoView({block:'center'});", el)
-
-        try:
-            el.click()
-        except Exception:
-            self.driver.execute_script("arguments[0].click();", el)
-
-        # Key difference vs _click(): wait for the element to become stale
-        self.wait.until(EC.staleness_of(el))
\ No newline at end of file
+def _is_stale(element) -> bool:
+    try:
+        element.is_enabled()
+        return False
+    except StaleElementReferenceException:
+        return True
\ No newline at end of file
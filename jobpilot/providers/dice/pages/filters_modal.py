@@ -112,7 +112,7 @@ class FiltersModal(BasePage):
         Click 'Apply filters' and wait for model to close and results to refresh    
         """
 
-        apply_filters_button = self.wait.until(EC.presence_of_element_located(APPLY_FILTERS_BUTTON))
+        apply_filters_button = self.present(APPLY_FILTERS_BUTTON)
 
         # scroll into view to avoid "not interactable"
         try:
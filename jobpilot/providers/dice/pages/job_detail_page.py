@@ -28,12 +28,13 @@ class JobDetailPage(BasePage):
 
         # Wait for the job description area to be present/visible.
         # Return self for chaining;
-        try: 
+        # Same locator twice, so not an any_of(): presence always comes
+        # first. Visible gets its (adaptive) timeout, then presence.
+        try:
             self.visible(JOB_DESCRIPTION_CONTAINER)
-        except Exception:
+        except TimeoutException:
             # As a defensive measure, do one last wait on presence (less strict than visible).
-            self.wait.until(EC.presence_of_element_located(JOB_DESCRIPTION_CONTAINER))
-
+            self.present(JOB_DESCRIPTION_CONTAINER)
         return self
 
     def toggle_open_description(self) -> "JobDetailPage":
@@ -75,13 +76,13 @@ class JobDetailPage(BasePage):
 
         This method should never raise an exception for "normal" missing elements.
         """
+        # Sequential on purpose: .text of a present-but-hidden container is
+        # empty, so visible gets its (adaptive) timeout before the fallback
         try:
             container = self.visible(JOB_DESCRIPTION_CONTAINER)
         except Exception:
             try:
-                container = self.wait.until(
-                    EC.presence_of_element_located(JOB_DESCRIPTION_CONTAINER)
-                )
+                container = self.present(JOB_DESCRIPTION_CONTAINER)
             except TimeoutException:
                 # Defensive scrapint: don't blow up the whole run for one job
                 return ""
@@ -1,5 +1,6 @@
-from typing import List, Set
-import hashlib
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional, Set
+import hashlib, re
 
 from .base_page import BasePage
 from selenium.webdriver.support import expected_conditions as EC
@@ -20,6 +21,32 @@ from ..selectors import (
 
 from jobpilot.models.job import JobPosting
 
+# Card wording for the posting age: "Today", "Yesterday", "3 days ago", "2 hours ago"
+_POSTED_RE = re.compile(
+    r"\b(?:(just now|today)|(yesterday)|(\d+)\s*(minute|hour|day|week|month)s?\s+ago)\b", re.I
+)
+_POSTED_UNIT = {"minute": timedelta(minutes=1), "hour": timedelta(hours=1), "day": timedelta(days=1),
+                "week": timedelta(weeks=1), "month": timedelta(days=30)}
+
+
+def posted_at(card_text: str, now: Optional[datetime] = None) -> str:
+    """
+    Approximate posting time (UTC ISO, minute precision) from a card's
+    "posted N days ago" text; "" when the card doesn't say.
+    """
+    m = _POSTED_RE.search(card_text or "")
+    if not m:
+        return ""
+    now = now or datetime.now(timezone.utc)
+    if m.group(1):
+        age = timedelta(0)
+    elif m.group(2):
+        age = timedelta(days=1)
+    else:
+        age = int(m.group(3)) * _POSTED_UNIT[m.group(4).lower()]
+    return (now - age).isoformat(timespec="minutes")
+
+
 class ResultsPage(BasePage):
     def _card(self):
         self.wait.until(EC.presence_of_all_elements_located(RESULT_CARDS))
@@ -86,8 +113,15 @@ class ResultsPage(BasePage):
             "company": self._safe_text(card, RESULT_COMPANY),
             "easy_apply": self._has_easy_apply(card),
             "raw_company_url": self._company_url(card),
+            "posted_at": posted_at(self._card_text(card)),
         }
 
+    def _card_text(self, card) -> str:
+        try:
+            return card.text or ""
+        except StaleElementReferenceException:
+            return ""
+
     #### --- Public API ------
 
     def iterate_all(self, max_results: int = 100) -> List[JobPosting]:
@@ -153,7 +187,8 @@ class ResultsPage(BasePage):
                         easy_apply=payload["easy_apply"],
                         metadata={
                             "source_card_index": str(idx),
-                            "raw_company_url": payload["raw_company_url"]
+                            "raw_company_url": payload["raw_company_url"],
+                            "posted_at": payload["posted_at"],
                         },
                         # title=title,
                         # company=company,
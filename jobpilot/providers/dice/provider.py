@@ -1,10 +1,12 @@
 from __future__ import annotations
-from typing import Iterable, List
+from dataclasses import dataclass
+from typing import Iterable, List, Optional
 from selenium.webdriver.remote.webdriver import WebDriver
-from selenium.webdriver.support.ui import WebDriverWait 
 
+from jobpilot.browser.tabs import TabManager
 from jobpilot.providers.base import BaseProvider
 from jobpilot.models.job import JobPosting, ApplyResult
+from jobpilot.utils.metrics import metrics
 
 from jobpilot.providers.dice.pages.login_page_email_submit import LoginPageEmailSubmit
 from jobpilot.providers.dice.pages.login_page_password_submit import LoginPagePasswordSubmit
@@ -12,6 +14,24 @@ from jobpilot.providers.dice.pages.search_page import SearchPage
 from jobpilot.providers.dice.pages.results_page import ResultsPage
 from jobpilot.providers.dice.pages.dashboard_page import DashboardPage
 from jobpilot.providers.dice.pages.job_detail_page import JobDetailPage
+from jobpilot.providers.dice.pages.easy_apply_form_page import (
+    EasyApplyFormPage, STATE_ALREADY_APPLIED, STATE_CONFIRMED, STATE_STEP2, STATE_SUBMITTED,
+)
+
+
+@dataclass
+class ApplySession:
+    """
+    One job's Easy Apply in progress: its tab and the page objects reached so far.
+    """
+    job: JobPosting
+    handle: str                  # window handle of the job's tab
+    home: str                    # window to return to when the tab closes
+    prechecked: bool = False
+    precheck_result: Optional[ApplyResult] = None   # SKIPPED when already applied
+    detail_page: Optional[JobDetailPage] = None
+    form_page: Optional[EasyApplyFormPage] = None
+    form_state: Optional[str] = None   # last EasyApplyFormPage state seen
 
 
 class DiceProvider(BaseProvider):
@@ -25,9 +45,13 @@ class DiceProvider(BaseProvider):
 
     NAME = "dice"
 
-    def __init__ (self, driver: WebDriver, cfg: dict) -> None:
+    def __init__ (self, driver: WebDriver, cfg: dict, tabs: Optional[TabManager] = None) -> None:
         self.driver = driver
         self.cfg = cfg
+        # Worker tabs for job pages (apply, describe), navigated in place
+        # instead of opened and closed per job
+        browser_cfg = cfg.get("browser") or {}
+        self.tabs = tabs or TabManager(driver, reuse=bool(browser_cfg.get("reuse_tabs", True)))
 
         self.env = cfg.get("env", {})
         self.search_cfg = cfg.get("dice", {})
@@ -46,11 +70,15 @@ class DiceProvider(BaseProvider):
         LoginPagePasswordSubmit(self.driver).login_password_submit(password)
         DashboardPage(self.driver).wait_loaded()
 
-    def search(self, max_results: int=100) -> List[JobPosting]:
+    def search(self, max_results: int=100, date_posted: Optional[str] = None) -> List[JobPosting]:
         """
          Perform a search and return JobPosting objects
 
+         date_posted ("today", "last_3_days", "last_7_days") is applied
+         through the filters modal after each query; None leaves the
+         results unfiltered (the daemon passes dice.date_posted).
         """
+        self.tabs.focus_home()
         max_results = min(
             max_results,
             int(self.search_cfg.get("max_results", max_results))
@@ -75,11 +103,17 @@ class DiceProvider(BaseProvider):
                 if remaining <= 0:
                     return all_jobs
                 print(f"[DiceProvider.search] => Processing {keyword} + {location}")
-                search_page = SearchPage(self.driver).open()
-                search_page.search(keyword=keyword, location=location)
-
-                results_page = ResultsPage(self.driver)
-                jobs = results_page.iterate_all(max_results=remaining)
+                query = f"{keyword} @ {location}"
+                with metrics.timer("search_query", query=query):
+                    search_page = SearchPage(self.driver).open()
+                    search_page.search(keyword=keyword, location=location)
+                    if date_posted:
+                        self._filter_posted_date(search_page, date_posted)
+
+                with metrics.timer("card_scrape", query=query):
+                    results_page = ResultsPage(self.driver)
+                    jobs = results_page.iterate_all(max_results=remaining)
+                metrics.inc("cards_scraped", len(jobs), query=query)
                 print(f"[DiceProvider.search] => Found {len(jobs)} jobs for {keyword} + {location}")
                 for job in jobs:
                     if job.id in seen_ids:
@@ -110,6 +144,15 @@ class DiceProvider(BaseProvider):
 
         # return jobs
     
+    def _filter_posted_date(self, search_page: SearchPage, date_posted: str) -> None:
+        try:
+            search_page.open_filters().wait_open().set_posted_date(date_posted).apply_filters()
+        except ValueError:
+            raise
+        except Exception as e:
+            # Unfiltered results are still usable; already-saved jobs are skipped later
+            print(f"[DiceProvider.search] Could not apply date_posted={date_posted!r}: {e}")
+
     def get_job_description(self, job: JobPosting) -> str:
         """
         Open a job detail page and return the normalized description text.
@@ -117,72 +160,127 @@ class DiceProvider(BaseProvider):
         This is a thin wrapper around the Dice JobDetailPage, so that
         the orchestrator doesn't need to know about Dice DOM details.
         """
-        page = JobDetailPage(self.driver).open(job.url)
+        if not self.tabs.reuse:
+            page = JobDetailPage(self.driver).open(job.url)
+        else:
+            # The "describe" tab: the home window keeps the search results
+            handle = self.tabs.load("describe", job.url, background=False)
+            self.tabs.release(handle)
+            page = JobDetailPage(self.driver)
         page.toggle_open_description()
         return page.get_description_text()
 
     def is_easy_apply(self, job: JobPosting) -> bool:
         return bool(job.easy_apply)
     
-    def apply(self, job: JobPosting) -> ApplyResult:
-        apply_window = None
-        original_window = self.driver.current_window_handle
+    def apply(self, job: JobPosting, resume_path: Optional[str] = None) -> ApplyResult:
+        """
+        Easy Apply for one job. `resume_path` replaces the attached resume
+        on step 1 (multi-profile runs); None keeps the one on the Dice profile.
 
+        Runs the apply steps back to back; ApplyPipeline interleaves the
+        same steps across jobs.
+        """
+        session = None
         try:
-            # 1) Force open job in a new tab and switch
-            before = set(self.driver.window_handles)
-            original_window = self._open_in_new_tab_and_switch(job.url, timeout=10)
-            after = set(self.driver.window_handles)
-            new_handles = list(after - before)
-            apply_window = new_handles[0] if new_handles else None
-
-            # 2) Now we are in the job detail tab
-            detail_page = JobDetailPage(self.driver)
-            detail_page.wait_loaded()
-
-            # 2_a) Validate Apply button text is not "Applied"
-            btn_text = detail_page.get_easy_apply_button_text()
-            print(f"[DiceProvider.appy] button text => {btn_text!r}")
-
-            if detail_page.is_already_applied():
-                return ApplyResult(
-                    status="SKIPPED",
-                    app_id=None,
-                    notes=f"Job already applied on Dice. Button text: {btn_text}"
-                )
-
-            # 3) Click Apply/Easy Apply -> Step 1
-            form_page = detail_page.click_easy_apply()
-
-            # 4) Step 1 -> Next
-            form_page.wait_step1_loaded()
-            form_page.click_next_step()
-
-            # 5) Step 2 -> Submit
-            form_page.wait_step2_loaded()
-            form_page.click_submit()
-
-            # 6) Confirmation
-            ok = form_page.wait_submission_confirmation()
-            success = ok and form_page.is_submission_successful()
-
-            if success:
-                return ApplyResult(status="APPLIED", app_id=None, notes="Applied via Easy Apply.")
-            return ApplyResult(status="ERROR", app_id=None, notes="Submit clicked but confirmation was not detected.")
+            session = self.open_apply_tab(job)
+            result = self.precheck_apply(session)
+            if result is not None:
+                return result
+            self.submit_apply(session, resume_path)
+            return self.confirm_apply(session)
 
         except Exception as e:
             return ApplyResult(status="ERROR", app_id=None, notes=f"Exception during Easy apply: {e}")
 
         finally:
-            try:
-                # Close the apply tab if we opened one
-                if apply_window and apply_window in self.driver.window_handles:
-                    self.driver.close()
-                # Switch back to original
-                if original_window in self.driver.window_handles:
-                    self.driver.switch_to.window(original_window)
-            except Exception:
-                pass
+            if session is not None:
+                self.close_apply_tab(session)
+
+    # --- Apply steps (each leaves the driver on the session's tab) ----
+    def open_apply_tab(self, job: JobPosting) -> ApplySession:
+        """
+        Start loading the job detail page in an apply worker tab (an idle
+        one navigated in place, else a new one) without waiting for it.
+        """
+        handle = self.tabs.load("apply", job.url)
+        return ApplySession(job=job, handle=handle, home=self.tabs.home)
+
+    def precheck_apply(self, session: ApplySession) -> Optional[ApplyResult]:
+        """
+        Switch to the tab, wait for the detail page and return a SKIPPED
+        result if the job was already applied to (None: go ahead).
+        """
+        self.tabs.focus(session.handle)
+        if session.prechecked:
+            return session.precheck_result
+        self.tabs.wait_navigated(session.handle)
+        detail_page = JobDetailPage(self.driver)
+        detail_page.wait_loaded()
+        session.detail_page = detail_page
+
+        # Validate Apply button text is not "Applied"
+        btn_text = detail_page.get_easy_apply_button_text()
+        print(f"[DiceProvider.appy] button text => {btn_text!r}")
+        if detail_page.is_already_applied():
+            session.precheck_result = ApplyResult(
+                status="SKIPPED",
+                app_id=None,
+                notes=f"Job already applied on Dice. Button text: {btn_text}"
+            )
+        session.prechecked = True
+        return session.precheck_result
+
+    def submit_apply(self, session: ApplySession, resume_path: Optional[str] = None) -> None:
+        """
+        Easy Apply -> step 1 (resume) -> Next -> step 2 -> Submit.
+        """
+        self.open_step1(session)
+        self.open_step2(session, resume_path)
+        self.click_submit(session)
+
+    def open_step1(self, session: ApplySession) -> None:
+        """Click Easy Apply and wait for the form's first step, whichever it is."""
+        self.tabs.focus(session.handle)
+        detail_page = session.detail_page or JobDetailPage(self.driver).wait_loaded()
+        form_page = detail_page.click_easy_apply()
+        session.form_page = form_page
+        session.form_state = form_page.wait_state()
+
+    def open_step2(self, session: ApplySession, resume_path: Optional[str] = None) -> None:
+        """
+        Attach the resume (if given) and walk the form up to step 2 (review),
+        through any extra steps.
+        """
+        self.tabs.focus(session.handle)
+        session.form_state = session.form_page.drive(resume_path, until=STATE_STEP2)
+
+    def click_submit(self, session: ApplySession) -> None:
+        self.tabs.focus(session.handle)
+        if session.form_state == STATE_STEP2:
+            session.form_page.click_submit()
+            session.form_state = STATE_SUBMITTED
+
+    def confirm_apply(self, session: ApplySession) -> ApplyResult:
+        """
+        Wait for the confirmation banner of a submitted session.
+        """
+        self.tabs.focus(session.handle)
+        if session.form_state == STATE_ALREADY_APPLIED:
+            return ApplyResult(
+                status="SKIPPED", app_id=None, notes="Job already applied on Dice (seen in the apply form)."
+            )
+        ok = session.form_state == STATE_CONFIRMED or session.form_page.wait_submission_confirmation()
+        success = ok and session.form_page.is_submission_successful()
+
+        if success:
+            return ApplyResult(status="APPLIED", app_id=None, notes="Applied via Easy Apply.")
+        return ApplyResult(status="ERROR", app_id=None, notes="Submit clicked but confirmation was not detected.")
+
+    def close_apply_tab(self, session: ApplySession) -> None:
+        # Back to the pool for the next job (closed when reuse_tabs is off)
+        self.tabs.release(session.handle)
+
     # def apply(self, job: JobPosting) -> ApplyResult:
     #     """
     #     Full Easy Apply flow for Dice.
@@ -278,21 +376,3 @@ class DiceProvider(BaseProvider):
             
     def open_job(self, job):
         self.driver.get(job.url)
-
-    def _open_in_new_tab_and_switch(self, url: str, timeout: int = 10) -> str:
-        """
-        Opens given url in the new tab via JS and switches to it
-        Returns new window handle
-        """
-        original = self.driver.current_window_handle
-        before = set(self.driver.window_handles)
-
-        self.driver.execute_script("window.open(arguments[0], '_blank');", url)
-
-        WebDriverWait(self.driver, timeout).until(
-            lambda d: len(set(d.window_handles) - before) == 1
-        )
-
-        new_handle = list(set(self.driver.window_handles) - before)[0]
-        self.driver.switch_to.window(new_handle)
-        return original
\ No newline at end of file
@@ -91,6 +91,7 @@ JOB_DESCRIPTION_TOGGLE_BUTTON = (By.CSS_SELECTOR, "button[id='descriptionToggle'
 # JOB_DESCRIPTION_EASY_APPLY_BUTTON = (By.XPATH, "//button[contains(., 'Easy apply')]")
 JOB_DESCRIPTION_EASY_APPLY_BUTTON = (By.CSS_SELECTOR, "[data-testid='apply-button']")
 JOB_DESCRIPTION_APPLY_NOW_BUTTON = (By.XPATH, "//button[contains(., 'Apply now')]")
+JOB_DESCRIPTION_APPLIED_BUTTON = (By.XPATH, "//*[@data-testid='apply-button'][normalize-space()='Applied']")
 
 # JOB_DESCRIPTION_CONTAINER = (By.CSS_SELECTOR, "div[class^='job-detail-description-module__'][class$='__jobDescription']")
 # The xpath version for backup
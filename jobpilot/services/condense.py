@@ -0,0 +1,247 @@
+from __future__ import annotations
+
+import hashlib, os, re
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+import yaml
+
+from jobpilot.services.tokens import estimate_tokens
+
+DEFAULT_BOILERPLATE_PATH = os.path.join("configs", "boilerplate.yaml")
+
+# Sentence boundary in flattened text; bullets count as boundaries too
+_SENTENCE_RE = re.compile(r"(?<=[.!?])\s+(?=[\"'(\[A-Z0-9])|\s*[•▪●]\s*|\n+")
+_NORM_RE = re.compile(r"\W+")
+
+
+@dataclass
+class Section:
+    heading: str          # "" for text before the first heading
+    kind: str             # "intro" | "priority" | "drop" | "other"
+    sentences: List[str] = field(default_factory=list)
+
+
+@dataclass
+class CondensedText:
+    text: str
+    tokens_before: int
+    tokens_after: int
+    boilerplate_dropped: int = 0   # sentences
+    duplicates_dropped: int = 0    # sentences
+    budget_dropped: int = 0        # sentences
+
+
+class BoilerplateLibrary:
+    """
+    Regex library from configs/boilerplate.yaml:
+    - drop_headings: sections that are never sent (benefits, EEO, about us)
+    - priority_headings: sections kept first under a tight budget
+    - drop_phrases: sentences dropped wherever they appear
+    """
+
+    def __init__(
+            self,
+            drop_headings: List[str] | None = None,
+            priority_headings: List[str] | None = None,
+            drop_phrases: List[str] | None = None,
+    ) -> None:
+        self.drop_headings = list(drop_headings or [])
+        self.priority_headings = list(priority_headings or [])
+        self.drop_phrases = list(drop_phrases or [])
+
+        self._drop_heading_re = self._any(self.drop_headings, full=True)
+        self._priority_heading_re = self._any(self.priority_headings, full=True)
+        self._phrase_re = self._any(self.drop_phrases)
+
+        headings = "|".join(f"(?:{p})" for p in self.drop_headings + self.priority_headings)
+        # "Requirements:" inline (Dice flattens whitespace), or a heading alone on its line
+        self._heading_re = re.compile(
+            rf"(?<![\w'])(?P<inline>{headings})\s*:|^[ \t]*(?P<line>{headings})[ \t]*:?[ \t]*$",
+            re.I | re.M,
+        ) if headings else None
+
+        digest = hashlib.sha1(
+            "\0".join(self.drop_headings + ["|"] + self.priority_headings + ["|"] + self.drop_phrases).encode("utf-8")
+        )
+        self.fingerprint = digest.hexdigest()[:8]
+
+    @staticmethod
+    def _any(patterns: List[str], full: bool = False) -> Optional[re.Pattern]:
+        if not patterns:
+            return None
+        body = "|".join(f"(?:{p})" for p in patterns)
+        return re.compile(rf"^(?:{body})$" if full else body, re.I)
+
+    @classmethod
+    def load(cls, path: str = DEFAULT_BOILERPLATE_PATH) -> "BoilerplateLibrary":
+        if not os.path.exists(path):
+            print(f"[Condenser] Boilerplate library not found at {path}; only dedupe/budget apply")
+            return cls()
+        with open(path, "r", encoding="utf-8") as f:
+            data = yaml.safe_load(f) or {}
+        return cls(
+            drop_headings=data.get("drop_headings"),
+            priority_headings=data.get("priority_headings"),
+            drop_phrases=data.get("drop_phrases"),
+        )
+
+    def heading_kind(self, heading: str) -> str:
+        if self._drop_heading_re is not None and self._drop_heading_re.match(heading):
+            return "drop"
+        if self._priority_heading_re is not None and self._priority_heading_re.match(heading):
+            return "priority"
+        return "other"
+
+    def is_boilerplate(self, sentence: str) -> bool:
+        return self._phrase_re is not None and self._phrase_re.search(sentence) is not None
+
+    def split_sections(self, text: str) -> List[Section]:
+        """
+        Cut text at known headings and split each section into sentences.
+        """
+        spans = []
+        if self._heading_re is not None:
+            for m in self._heading_re.finditer(text):
+                heading = (m.group("inline") or m.group("line")).strip()
+                spans.append((m.start(), m.end(), heading))
+
+        sections: List[Section] = []
+        starts = [(0, 0, "")] + spans
+        for n, (_, body_start, heading) in enumerate(starts):
+            body_end = starts[n + 1][0] if n + 1 < len(starts) else len(text)
+            body = text[body_start:body_end]
+            kind = self.heading_kind(heading) if heading else "intro"
+            sentences = [s.strip() for s in _SENTENCE_RE.split(body) if s and s.strip()]
+            if heading or sentences:
+                sections.append(Section(heading, kind, sentences))
+        return sections
+
+
+class Condenser:
+    """
+    Shrinks a job description before it goes into an LLM prompt.
+
+    1. split into sections at known headings (works on Dice's
+       whitespace-collapsed text as well as multi-line text)
+    2. drop boilerplate sections/sentences (BoilerplateLibrary)
+    3. drop repeated sentences (recruiter templates often paste a block twice)
+    4. fit what's left into token_budget, priority sections first, then the
+       rest in document order; the output keeps document order
+
+    Token counts use estimate_tokens, so the budget means the same thing as
+    the API bill. Running totals live in self.stats for the run log.
+    """
+
+    def __init__(
+            self,
+            library: BoilerplateLibrary | None = None,
+            token_budget: int = 1500,
+            model: str = "gpt-4.1-mini",
+    ) -> None:
+        self.library = library or BoilerplateLibrary()
+        self.token_budget = max(1, int(token_budget))
+        self.model = model
+        self.stats: Counter = Counter()
+        # Same description is condensed for packing and again for the prompt
+        self._memo: dict[tuple, CondensedText] = {}
+
+    @property
+    def fingerprint(self) -> str:
+        """Changes whenever condensed output could change (feeds the score cache key)."""
+        return f"{self.library.fingerprint}-{self.token_budget}"
+
+    def _tokens(self, text: str) -> int:
+        return estimate_tokens(text, self.model)
+
+    def condense(self, text: str, token_budget: int | None = None, record: bool = True) -> CondensedText:
+        budget = self.token_budget if token_budget is None else max(1, int(token_budget))
+        memo_key = (text, budget)
+        cached = self._memo.get(memo_key)
+        if cached is not None:
+            return cached
+
+        result = self._condense(text or "", budget)
+        if len(self._memo) >= 256:
+            self._memo.clear()
+        self._memo[memo_key] = result
+
+        if record:
+            self.stats["docs"] += 1
+            self.stats["tokens_before"] += result.tokens_before
+            self.stats["tokens_after"] += result.tokens_after
+            self.stats["boilerplate_dropped"] += result.boilerplate_dropped
+            self.stats["duplicates_dropped"] += result.duplicates_dropped
+            self.stats["budget_dropped"] += result.budget_dropped
+        return result
+
+    def _condense(self, text: str, budget: int) -> CondensedText:
+        tokens_before = self._tokens(text)
+        boilerplate = duplicates = 0
+
+        # Steps 1-3: (section index, sentence) pairs worth keeping
+        seen: set[str] = set()
+        sections = self.library.split_sections(text)
+        kept: List[List[str]] = []
+        for section in sections:
+            keep: List[str] = []
+            if section.kind == "drop":
+                boilerplate += len(section.sentences)
+            else:
+                for sentence in section.sentences:
+                    if self.library.is_boilerplate(sentence):
+                        boilerplate += 1
+                        continue
+                    norm = _NORM_RE.sub(" ", sentence.lower()).strip()
+                    if norm in seen:
+                        duplicates += 1
+                        continue
+                    seen.add(norm)
+                    keep.append(sentence)
+            kept.append(keep)
+
+        # Step 4: budget, priority sections first
+        order = sorted(range(len(sections)), key=lambda i: sections[i].kind != "priority")
+        selected: List[List[str]] = [[] for _ in sections]
+        used = budget_dropped = 0
+        full = False
+        for i in order:
+            if not kept[i]:
+                continue
+            heading_cost = self._tokens(sections[i].heading + ":") if sections[i].heading else 0
+            for sentence in kept[i]:
+                cost = self._tokens(sentence) + (heading_cost if not selected[i] else 0)
+                if full or used + cost > budget:
+                    full = True
+                    budget_dropped += 1
+                    continue
+                selected[i].append(sentence)
+                used += cost
+
+        parts = []
+        for section, sentences in zip(sections, selected):
+            if not sentences:
+                continue
+            body = " ".join(sentences)
+            parts.append(f"{section.heading}: {body}" if section.heading else body)
+        condensed = "\n".join(parts)
+
+        return CondensedText(
+            text=condensed,
+            tokens_before=tokens_before,
+            tokens_after=self._tokens(condensed),
+            boilerplate_dropped=boilerplate,
+            duplicates_dropped=duplicates,
+            budget_dropped=budget_dropped,
+        )
+
+    def summary(self) -> str:
+        before, after = self.stats["tokens_before"], self.stats["tokens_after"]
+        saved = before - after
+        pct = round(100.0 * saved / before, 1) if before else 0.0
+        return (
+            f"docs={self.stats['docs']} tokens_before={before} tokens_after={after} "
+            f"saved={saved} ({pct}%) boilerplate={self.stats['boilerplate_dropped']} "
+            f"duplicates={self.stats['duplicates_dropped']} over_budget={self.stats['budget_dropped']}"
+        )
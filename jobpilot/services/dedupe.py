@@ -0,0 +1,291 @@
+from __future__ import annotations
+
+import json, os, random, re, sqlite3, time, zlib
+from dataclasses import dataclass, replace
+from typing import List, Optional, Sequence, Tuple
+
+from jobpilot.models.job import JobPosting
+
+# NumPy import (optional; signatures are computed in pure Python without it)
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+_WORD_RE = re.compile(r"\w+")
+_MERSENNE = (1 << 31) - 1
+
+
+def card_key(title: str, company: str) -> str:
+    """Normalized title|company, the only identity a results-page card has."""
+    norm = lambda s: " ".join(_WORD_RE.findall((s or "").lower()))
+    return f"{norm(title)}|{norm(company)}"
+
+
+def shingles(text: str, k: int = 3) -> set:
+    """crc32 ids of the word k-grams of `text` (whole text if shorter than k words)."""
+    words = _WORD_RE.findall((text or "").lower())
+    if len(words) < k:
+        return {zlib.crc32(" ".join(words).encode("utf-8"))} if words else set()
+    return {zlib.crc32(" ".join(words[i:i + k]).encode("utf-8")) for i in range(len(words) - k + 1)}
+
+
+class MinHasher:
+    """
+    MinHash signatures: num_perm universal hashes (a*x + b) mod 2^31-1 over
+    the shingle ids, keeping the minimum of each. The share of equal
+    positions between two signatures estimates the Jaccard similarity of
+    their shingle sets.
+    """
+
+    def __init__(self, num_perm: int = 64, seed: int = 1) -> None:
+        rng = random.Random(seed)
+        self.num_perm = int(num_perm)
+        self.a = [rng.randrange(1, _MERSENNE) for _ in range(self.num_perm)]
+        self.b = [rng.randrange(0, _MERSENNE) for _ in range(self.num_perm)]
+
+    def signature(self, shingle_ids: set) -> Tuple[int, ...]:
+        if not shingle_ids:
+            return tuple([_MERSENNE] * self.num_perm)
+        if np is not None:
+            # 31-bit inputs x 31-bit multipliers fit in uint64
+            x = np.fromiter((s & _MERSENNE for s in shingle_ids), dtype=np.uint64)
+            a = np.asarray(self.a, dtype=np.uint64)[:, None]
+            b = np.asarray(self.b, dtype=np.uint64)[:, None]
+            return tuple(int(v) for v in ((a * x + b) % _MERSENNE).min(axis=1))
+        xs = [s & _MERSENNE for s in shingle_ids]
+        return tuple(min((a * x + b) % _MERSENNE for x in xs) for a, b in zip(self.a, self.b))
+
+
+def estimate_jaccard(sig_a: Sequence[int], sig_b: Sequence[int]) -> float:
+    if not sig_a or len(sig_a) != len(sig_b):
+        return 0.0
+    return sum(x == y for x, y in zip(sig_a, sig_b)) / len(sig_a)
+
+
+@dataclass
+class DuplicateMatch:
+    key: str                      # representative posting ("provider:id")
+    cluster: str                  # cluster id (key of its first posting)
+    similarity: float             # estimated Jaccard; 1.0 for card matches
+    match_percent: Optional[float] = None
+    recommended: Optional[bool] = None
+    reasons: Optional[str] = None
+    applied: str = ""             # "Yes" once any posting in the cluster was applied to
+    batch_index: Optional[int] = None   # set when the representative is in the current batch
+
+    @property
+    def has_decision(self) -> bool:
+        return self.match_percent is not None
+
+
+class DuplicateIndex:
+    """
+    Near-duplicate postings across URLs (reposts, several recruiters).
+
+    Each posting is fingerprinted with MinHash over word 3-grams of
+    title + company + description and bucketed by LSH (bands x rows of the
+    signature). A new posting whose candidates reach `threshold` estimated
+    Jaccard joins that cluster and can reuse its score and apply decision.
+
+    SQLite-backed (one file in the data dir); cluster ids are the key of
+    the cluster's first posting.
+    """
+
+    def __init__(self, path: str, num_perm: int = 64, bands: int = 16, threshold: float = 0.8) -> None:
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+        self.path = path
+        self.hasher = MinHasher(num_perm)
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.threshold = threshold
+        self.stats = {"checked": 0, "duplicates": 0, "card_matches": 0}
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        with self.conn:
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS postings ("
+                " key TEXT PRIMARY KEY, cluster TEXT NOT NULL, card_key TEXT NOT NULL,"
+                " signature TEXT NOT NULL, match_percent REAL, recommended INTEGER, reasons TEXT,"
+                " created_at REAL NOT NULL)"
+            )
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS clusters (cluster TEXT PRIMARY KEY, applied TEXT NOT NULL DEFAULT '')"
+            )
+            self.conn.execute("CREATE TABLE IF NOT EXISTS bands (band INTEGER, bucket TEXT, key TEXT)")
+            self.conn.execute("CREATE INDEX IF NOT EXISTS bands_lookup ON bands (band, bucket)")
+            self.conn.execute("CREATE INDEX IF NOT EXISTS postings_card ON postings (card_key)")
+
+    @staticmethod
+    def key(job: JobPosting) -> str:
+        return f"{job.provider}:{job.id}"
+
+    def signature(self, job: JobPosting, description: str) -> Tuple[int, ...]:
+        return self.hasher.signature(shingles(f"{job.title}\n{job.company}\n{description}"))
+
+    def _buckets(self, signature: Sequence[int]) -> List[Tuple[int, str]]:
+        r = self.rows
+        return [
+            (band, format(zlib.crc32(repr(signature[band * r:(band + 1) * r]).encode("ascii")), "08x"))
+            for band in range(self.bands)
+        ]
+
+    def _match_from_row(self, key: str, similarity: float) -> DuplicateMatch:
+        cluster, match_percent, recommended, reasons = self.conn.execute(
+            "SELECT cluster, match_percent, recommended, reasons FROM postings WHERE key = ?", (key,)
+        ).fetchone()
+        if match_percent is None:
+            # Not scored (yet): any scored member speaks for the cluster
+            scored = self.conn.execute(
+                "SELECT match_percent, recommended, reasons FROM postings"
+                " WHERE cluster = ? AND match_percent IS NOT NULL ORDER BY created_at LIMIT 1",
+                (cluster,),
+            ).fetchone()
+            if scored is not None:
+                match_percent, recommended, reasons = scored
+        (applied,) = self.conn.execute(
+            "SELECT applied FROM clusters WHERE cluster = ?", (cluster,)
+        ).fetchone() or ("",)
+        return DuplicateMatch(
+            key=key,
+            cluster=cluster,
+            similarity=similarity,
+            match_percent=match_percent,
+            recommended=None if recommended is None else bool(recommended),
+            reasons=reasons,
+            applied=applied or "",
+        )
+
+    def find_card(self, job: JobPosting) -> Optional[DuplicateMatch]:
+        """
+        Exact title+company match against a scored posting from an earlier
+        run: lets the caller skip the detail fetch entirely.
+        """
+        row = self.conn.execute(
+            "SELECT key FROM postings WHERE card_key = ? AND key != ? AND match_percent IS NOT NULL"
+            " ORDER BY created_at DESC LIMIT 1",
+            (card_key(job.title, job.company), self.key(job)),
+        ).fetchone()
+        if row is None:
+            return None
+        self.stats["card_matches"] += 1
+        return self._match_from_row(row[0], 1.0)
+
+    def find(self, job: JobPosting, signature: Sequence[int]) -> Optional[DuplicateMatch]:
+        """
+        Best stored posting (other than this one) at or above the threshold.
+        """
+        self.stats["checked"] += 1
+        own = self.key(job)
+        candidates = set()
+        for band, bucket in self._buckets(signature):
+            for (key,) in self.conn.execute(
+                "SELECT key FROM bands WHERE band = ? AND bucket = ?", (band, bucket)
+            ):
+                if key != own:
+                    candidates.add(key)
+
+        best_key, best_sim = None, 0.0
+        for key in sorted(candidates):
+            (stored,) = self.conn.execute("SELECT signature FROM postings WHERE key = ?", (key,)).fetchone()
+            sim = estimate_jaccard(signature, json.loads(stored))
+            if sim > best_sim:
+                best_key, best_sim = key, sim
+        if best_key is None or best_sim < self.threshold:
+            return None
+        self.stats["duplicates"] += 1
+        return self._match_from_row(best_key, round(best_sim, 3))
+
+    def add(self, job: JobPosting, signature: Sequence[int], cluster: Optional[str] = None) -> None:
+        key = self.key(job)
+        cluster = cluster or key
+        with self.conn:
+            exists = self.conn.execute("SELECT 1 FROM postings WHERE key = ?", (key,)).fetchone()
+            self.conn.execute(
+                "INSERT INTO postings (key, cluster, card_key, signature, created_at) VALUES (?, ?, ?, ?, ?)"
+                " ON CONFLICT(key) DO UPDATE SET signature = excluded.signature",
+                (key, cluster, card_key(job.title, job.company), json.dumps(list(signature)), time.time()),
+            )
+            self.conn.execute("INSERT OR IGNORE INTO clusters (cluster) VALUES (?)", (cluster,))
+            if not exists:
+                self.conn.executemany(
+                    "INSERT INTO bands (band, bucket, key) VALUES (?, ?, ?)",
+                    [(band, bucket, key) for band, bucket in self._buckets(signature)],
+                )
+
+    def plan(
+            self,
+            jobs: Sequence[JobPosting],
+            descriptions: Sequence[str],
+            known: Sequence[Optional[DuplicateMatch]] | None = None,
+    ) -> List[Optional[DuplicateMatch]]:
+        """
+        Fingerprint a batch, index it, and return per job its DuplicateMatch
+        (None for postings that start a new cluster). Duplicates of postings
+        earlier in the same batch carry batch_index instead of a stored
+        decision. `known` holds matches already made (find_card); those jobs
+        just join their cluster.
+        """
+        known = list(known) if known is not None else [None] * len(jobs)
+        batch_pos = {self.key(job): i for i, job in enumerate(jobs)}
+        matches: List[Optional[DuplicateMatch]] = []
+        for job, desc, match in zip(jobs, descriptions, known):
+            sig = self.signature(job, desc)
+            if match is None:
+                match = self.find(job, sig)
+            if match is not None and match.key in batch_pos and not match.has_decision:
+                match.batch_index = batch_pos[match.key]
+            self.add(job, sig, cluster=match.cluster if match else None)
+            matches.append(match)
+        return matches
+
+    @staticmethod
+    def reuse_result(job: JobPosting, match: DuplicateMatch, source=None):
+        """
+        JobMatchResult for `job` copied from its cluster: from `source` (the
+        in-batch representative's result) or the stored decision.
+        """
+        from jobpilot.services.matcher import JobMatchResult
+
+        note = f" [DUPLICATE of {match.key} (similarity {match.similarity}); score reused]"
+        if source is not None:
+            return replace(source, job_id=job.id, provider=job.provider, reasons=f"{source.reasons}{note}")
+        return JobMatchResult(
+            job_id=job.id,
+            provider=job.provider,
+            match_percent=float(match.match_percent),
+            recommended=bool(match.recommended),
+            reasons=f"{match.reasons or ''}{note}",
+        )
+
+    def record_score(self, job: JobPosting, match_percent: float, recommended: bool, reasons: str) -> None:
+        with self.conn:
+            self.conn.execute(
+                "UPDATE postings SET match_percent = ?, recommended = ?, reasons = ? WHERE key = ?",
+                (match_percent, int(bool(recommended)), reasons, self.key(job)),
+            )
+
+    def cluster_of(self, job: JobPosting) -> Optional[str]:
+        row = self.conn.execute("SELECT cluster FROM postings WHERE key = ?", (self.key(job),)).fetchone()
+        return row[0] if row else None
+
+    def cluster_applied(self, job: JobPosting) -> str:
+        """'Yes' if any posting in this job's cluster was applied to."""
+        row = self.conn.execute(
+            "SELECT c.applied FROM postings p JOIN clusters c ON c.cluster = p.cluster WHERE p.key = ?",
+            (self.key(job),),
+        ).fetchone()
+        return (row[0] or "") if row else ""
+
+    def record_applied(self, job: JobPosting, applied: str) -> None:
+        if applied != "Yes":
+            return
+        cluster = self.cluster_of(job)
+        if cluster is not None:
+            with self.conn:
+                self.conn.execute("UPDATE clusters SET applied = 'Yes' WHERE cluster = ?", (cluster,))
+
+    def close(self) -> None:
+        self.conn.close()
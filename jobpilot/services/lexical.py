@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import hashlib, json, math, os, re
+from collections import Counter
+from typing import Iterable
+
+from jobpilot.models.job import JobPosting
+
+_WORD_RE = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercase word tokens (same \\w+ rule as JobMatcher._tokenize, but keeps repeats)."""
+    return _WORD_RE.findall((text or "").lower())
+
+
+def doc_key(text: str) -> str:
+    """Stable key for a description, so re-seen postings don't inflate the stats."""
+    normalized = " ".join((text or "").lower().split())
+    return hashlib.sha1(normalized.encode("utf-8")).hexdigest()[:16]
+
+
+class CorpusIndex:
+    """
+    Corpus statistics for BM25: document count, total length and per-term
+    document frequencies over every description we've seen.
+
+    Persisted as JSON between runs and updated incrementally: add() counts a
+    description once (keyed by a hash of its normalized text), so rescoring
+    or reposts don't skew the frequencies.
+    """
+
+    def __init__(self, path: str | None = None) -> None:
+        self.path = path
+        self.n_docs = 0
+        self.total_len = 0
+        self.df: Counter = Counter()
+        self._seen: set[str] = set()
+        self._dirty = False
+
+    @classmethod
+    def load(cls, path: str) -> "CorpusIndex":
+        index = cls(path)
+        if not os.path.exists(path):
+            return index
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        index.n_docs = int(data.get("n_docs", 0))
+        index.total_len = int(data.get("total_len", 0))
+        index.df = Counter(data.get("df") or {})
+        index._seen = set(data.get("seen") or [])
+        return index
+
+    def save(self, path: str | None = None) -> None:
+        path = path or self.path
+        if not path or not self._dirty:
+            return
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "n_docs": self.n_docs,
+                    "total_len": self.total_len,
+                    "df": self.df,
+                    "seen": sorted(self._seen),
+                },
+                f,
+            )
+        os.replace(tmp_path, path)
+        self._dirty = False
+
+    def add(self, text: str, tokens: Iterable[str] | None = None) -> bool:
+        """
+        Count a description into the corpus. Returns False if it was already seen.
+        """
+        key = doc_key(text)
+        if key in self._seen:
+            return False
+        tokens = list(tokens) if tokens is not None else tokenize(text)
+        if not tokens:
+            return False
+
+        self._seen.add(key)
+        self.n_docs += 1
+        self.total_len += len(tokens)
+        self.df.update(set(tokens))
+        self._dirty = True
+        return True
+
+    @property
+    def avg_doc_len(self) -> float:
+        return self.total_len / self.n_docs if self.n_docs else 0.0
+
+    def idf(self, term: str) -> float:
+        """BM25 idf (the +1 variant, so it never goes negative for very common terms)."""
+        df = self.df.get(term, 0)
+        return math.log(1.0 + (self.n_docs - df + 0.5) / (df + 0.5))
+
+
+class Bm25Scorer:
+    """
+    Weighted lexical match between the resume and one description.
+
+    Every distinct description term gets its BM25 weight (idf x saturated,
+    length-normalised tf). The match is the share of that weight carried by
+    terms that also appear in the resume, so "python" counts for a lot and
+    "the" for almost nothing once the corpus has a few hundred postings.
+    """
+
+    def __init__(
+            self,
+            index: CorpusIndex,
+            resume_text: str,
+            threshold: float = 0.60,
+            k1: float = 1.2,
+            b: float = 0.75,
+            resume_terms: Iterable[str] | None = None,
+    ) -> None:
+        self.index = index
+        self.threshold = threshold
+        self.k1 = k1
+        self.b = b
+        # resume_terms: pre-tokenized resume (e.g. from a ResumeProfile)
+        self._resume_terms = set(resume_terms) if resume_terms is not None else set(tokenize(resume_text))
+
+    def score(self, job: JobPosting, description: str, observe: bool = True):
+        # Imported here: matcher imports this module for its strategy table
+        from jobpilot.services.matcher import JobMatchResult
+
+        tokens = tokenize(description)
+        if not tokens or not self._resume_terms:
+            return JobMatchResult(
+                job_id=job.id,
+                provider=job.provider,
+                match_percent=0.0,
+                recommended=False,
+                reasons="Missing text of resume or job description",
+            )
+
+        if observe:
+            # Incremental update: the index learns from every posting it scores
+            self.index.add(description, tokens)
+
+        tf = Counter(tokens)
+        avgdl = self.index.avg_doc_len or len(tokens)
+        norm = self.k1 * (1.0 - self.b + self.b * len(tokens) / avgdl)
+
+        weights = {
+            term: self.index.idf(term) * (count * (self.k1 + 1.0)) / (count + norm)
+            for term, count in tf.items()
+        }
+        total = sum(weights.values())
+        shared = {t: w for t, w in weights.items() if t in self._resume_terms}
+        coverage = sum(shared.values()) / total if total else 0.0
+
+        match_percent = round(max(0.0, min(100.0, coverage * 100.0)), 1)
+        top_terms = ", ".join(sorted(shared, key=shared.get, reverse=True)[:8]) or "none"
+
+        return JobMatchResult(
+            job_id=job.id,
+            provider=job.provider,
+            match_percent=match_percent,
+            recommended=match_percent >= self.threshold * 100.0,
+            reasons=(
+                f"BM25 weighted overlap: resume covers {match_percent}% of the posting's "
+                f"term weight (corpus={self.index.n_docs} docs); top shared terms: {top_terms}."
+            ),
+        )
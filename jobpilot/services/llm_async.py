@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+import asyncio, dataclasses, os, time
+from typing import Callable, List, Optional, Sequence
+
+from tenacity import (
+    AsyncRetrying,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_random_exponential,
+)
+
+from jobpilot.models.job import JobPosting
+
+# OpenAI import
+try:
+    from openai import AsyncOpenAI, RateLimitError, APITimeoutError
+except ImportError:
+    AsyncOpenAI = None  # Graceful fallback on your installed client version
+    RateLimitError = APITimeoutError = None
+
+# Errors worth another attempt: throttling and slow responses.
+# Anything else (auth, bad request, bad JSON) goes straight to the fallback.
+_RETRYABLE = tuple(
+    e for e in (RateLimitError, APITimeoutError, asyncio.TimeoutError) if e is not None
+)
+
+
+class AsyncLLMScorer:
+    """
+    Concurrent LLM scoring for a batch of jobs.
+
+    - one AsyncOpenAI client, at most `concurrency` requests in flight
+      (the semaphore is held per attempt, so backoff sleeps don't hold a slot)
+    - per-request timeout via asyncio.wait_for
+    - tenacity retries with jittered exponential backoff on rate-limit/timeouts
+    - results are handled as they finish (on_result callback), and returned
+      in input order
+
+    Prompt building, parsing and the naive fallback come from the JobMatcher,
+    so scores are identical to the serial _score_with_llm path.
+    """
+
+    def __init__(
+            self,
+            matcher,
+            concurrency: int = 4,
+            timeout: float = 60.0,
+            max_attempts: int = 5,
+            base_url: str | None = None,
+            client=None,
+    ) -> None:
+        self.matcher = matcher
+        self.concurrency = max(1, int(concurrency))
+        self.timeout = timeout
+        self.max_attempts = max(1, int(max_attempts))
+        self.base_url = base_url or os.getenv("OPENAI_BASE_URL")
+        self._client = client
+
+        # Simple counters for the run log
+        self.calls = 0
+        self.retries = 0
+        self.failures = 0
+        self.deduped = 0
+
+        # Identical descriptions in one batch share a single call
+        self._inflight: dict[str, asyncio.Future] = {}
+
+    def _get_client(self):
+        if self._client is None and AsyncOpenAI is not None and self.matcher.api_key:
+            # tenacity owns retries, so turn off the SDK's own
+            self._client = AsyncOpenAI(
+                api_key=self.matcher.api_key,
+                base_url=self.base_url,
+                max_retries=0,
+            )
+        return self._client
+
+    async def _call(self, client, messages) -> str:
+        self.calls += 1
+        resp = await asyncio.wait_for(
+            client.chat.completions.create(
+                model=self.matcher.llm_model_name(),
+                messages=messages,
+                temperature=0.1,
+            ),
+            timeout=self.timeout,
+        )
+        return resp.choices[0].message.content
+
+    async def score_one(self, job: JobPosting, description: str, semaphore: asyncio.Semaphore):
+        client = self._get_client()
+        if client is None or not self.matcher.use_llm:
+            return self.matcher._score_naive(job, description)
+
+        messages = self.matcher._build_llm_messages(job, description)
+        if messages is None:
+            return self.matcher._score_naive(job, description)
+
+        cached = self.matcher._cached_llm_score(job, description)
+        if cached is not None:
+            return cached
+
+        key = self.matcher._llm_cache_key(description)
+        pending = self._inflight.get(key)
+        if pending is not None:
+            self.deduped += 1
+            shared = await asyncio.shield(pending)
+            return dataclasses.replace(shared, job_id=job.id, provider=job.provider)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await self._score_uncached(client, job, description, messages, semaphore)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            # Jobs waiting on this description fail the same way instead of hanging
+            future.set_exception(e)
+            future.exception()   # retrieved here; waiters still get it
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._inflight[key]
+
+    async def _score_uncached(self, client, job: JobPosting, description: str, messages, semaphore):
+        try:
+            async for attempt in AsyncRetrying(
+                retry=retry_if_exception_type(_RETRYABLE),
+                wait=wait_random_exponential(multiplier=0.5, max=20),
+                stop=stop_after_attempt(self.max_attempts),
+                reraise=True,
+            ):
+                with attempt:
+                    if attempt.retry_state.attempt_number > 1:
+                        self.retries += 1
+                    async with semaphore:
+                        raw = await self._call(client, messages)
+            result = self.matcher._parse_llm_response(job, raw)
+            self.matcher._store_llm_score(description, result)
+            return result
+        except Exception as e:
+            self.failures += 1
+            return self.matcher._llm_fallback(job, description, e)
+
+    async def score_all(
+            self,
+            jobs: Sequence[JobPosting],
+            descriptions: Sequence[str],
+            on_result: Optional[Callable[[int, object], None]] = None,
+    ) -> List:
+        """
+        Score every (job, description) pair concurrently.
+
+        on_result(index, JobMatchResult) fires in completion order.
+        """
+        if len(jobs) != len(descriptions):
+            raise ValueError("score_all needs one description per job")
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def indexed(i: int):
+            return i, await self.score_one(jobs[i], descriptions[i], semaphore)
+
+        results: List = [None] * len(jobs)
+        for next_done in asyncio.as_completed([indexed(i) for i in range(len(jobs))]):
+            i, result = await next_done
+            results[i] = result
+            if on_result is not None:
+                on_result(i, result)
+        return results
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
+
+
+def score_llm_concurrently(
+        matcher,
+        jobs: Sequence[JobPosting],
+        descriptions: Sequence[str],
+        on_result: Optional[Callable[[int, object], None]] = None,
+        **scorer_kwargs,
+) -> List:
+    """
+    Sync entry point for callers outside an event loop (the runner).
+    """
+    async def _run():
+        scorer = AsyncLLMScorer(matcher, **scorer_kwargs)
+        started = time.perf_counter()
+        try:
+            return await scorer.score_all(jobs, descriptions, on_result=on_result)
+        finally:
+            await scorer.aclose()
+            print(
+                f"[AsyncLLMScorer] jobs={len(jobs)} calls={scorer.calls} "
+                f"retries={scorer.retries} failures={scorer.failures} deduped={scorer.deduped} "
+                f"elapsed={time.perf_counter() - started:.1f}s"
+            )
+
+    return asyncio.run(_run())
@@ -0,0 +1,273 @@
+from __future__ import annotations
+
+import json, time
+from typing import Any, Dict, List, Optional, Sequence
+
+from jobpilot.models.job import JobPosting
+from jobpilot.services.tokens import estimate_tokens
+
+# OpenAI import
+try:
+    from openai import AuthenticationError, NotFoundError, PermissionDeniedError
+except ImportError:
+    AuthenticationError = NotFoundError = PermissionDeniedError = None
+
+# Errors every other request would hit too (bad key, unknown model): no
+# smaller batches, no single-job retries. Bad requests still split, since
+# a smaller batch may fit the context window.
+_NON_RETRYABLE = tuple(
+    e for e in (AuthenticationError, NotFoundError, PermissionDeniedError) if e is not None
+)
+
+# Batched answers come from a different prompt than single-job ones, so they
+# get their own cache namespace. Bump when the batch prompt/format changes.
+BATCH_PROMPT_VERSION = "batch-1"
+
+# Rough answer size per job (tokens), reserved out of the budget
+_ANSWER_TOKENS = 80
+
+_SYSTEM_MSG = (
+    "You are an expert technical recruiter. "
+    "Given a candidate's resume and several job postings, evaluate how strong "
+    "the match is for EACH posting independently. Return ONLY a valid JSON array "
+    "with one object per posting, keys: job_key (string, as given), "
+    "match_percent (float 0-100), recommended (boolean, true if >=60%), "
+    "reasons (short explanation string)."
+)
+
+
+def parse_batch_response(raw: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Pull {job_key: answer} out of the model's reply.
+
+    Tolerant: code fences and chatter around the array are ignored, and
+    entries without a job_key or a numeric match_percent are dropped, so a
+    partial answer still yields whatever jobs it did cover.
+    """
+    text = (raw or "").strip()
+    start, end = text.find("["), text.rfind("]")
+    if start == -1 or end <= start:
+        return {}
+    try:
+        items = json.loads(text[start:end + 1])
+    except ValueError:
+        return {}
+
+    answers: Dict[str, Dict[str, Any]] = {}
+    for item in items if isinstance(items, list) else []:
+        if not isinstance(item, dict) or not item.get("job_key"):
+            continue
+        try:
+            float(item.get("match_percent"))
+        except (TypeError, ValueError):
+            continue
+        answers[str(item["job_key"])] = item
+    return answers
+
+
+class BatchLLMScorer:
+    """
+    Scores several jobs per LLM request.
+
+    - the resume goes once per request as a shared preamble, followed by
+      job blocks keyed J1..Jn
+    - jobs are packed greedily until the prompt reaches token_budget
+      (or max_batch_size jobs)
+    - jobs missing from (or malformed in) the answer are re-batched in the
+      next round at half the batch size; whatever is still unanswered after
+      max_rounds goes through the single-job _score_with_llm path
+    - a non-retryable error (bad key, unknown model) stops all requests:
+      the remaining jobs get the naive fallback right away
+
+    Cache hits are returned without a call; fresh answers are stored under
+    BATCH_PROMPT_VERSION.
+    """
+
+    def __init__(
+            self,
+            matcher,
+            token_budget: int = 12000,
+            max_batch_size: int = 8,
+            max_rounds: int = 3,
+            client=None,
+    ) -> None:
+        self.matcher = matcher
+        self.token_budget = max(1, int(token_budget))
+        self.max_batch_size = max(1, int(max_batch_size))
+        self.max_rounds = max(1, int(max_rounds))
+        self.client = client or matcher.client
+
+        # Counters for the run log
+        self.calls = 0
+        self.jobs_sent = 0
+        self.retried = 0
+        self.single_fallbacks = 0
+        self.failures = 0
+
+    # ---------- Prompt ----------
+
+    def _preamble(self) -> str:
+        resume_text = self.matcher.llm_resume()
+        return f'Candidate Resume:\n"""{resume_text}"""\n\nJob Postings:\n'
+
+    def _job_block(self, key: str, job: JobPosting, description: str) -> str:
+        desc_text = self.matcher.llm_description(description)
+        return (
+            f"\n[{key}]\n"
+            f"- Title: {job.title}\n"
+            f"- Company: {job.company or 'Unknown'}\n"
+            f"- Location: {job.location or 'Unknown'}\n"
+            f'Description:\n"""{desc_text}"""\n'
+        )
+
+    def _instructions(self, keys: Sequence[str]) -> str:
+        return (
+            "\nInstructions:\n"
+            "1. Score every posting against the resume, considering skills, tech stack, "
+            "years of experience, domain knowledge, and responsibilities.\n"
+            f"2. Return ONLY a JSON array with exactly {len(keys)} objects, one per job_key "
+            f"({', '.join(keys)}), no extra text:\n"
+            '[{"job_key": "J1", "match_percent": 0-100 as float, '
+            '"recommended": true or false, "reasons": "short explanation"}]\n'
+        )
+
+    def build_messages(self, items: Sequence[tuple]) -> List[Dict[str, str]]:
+        """
+        Chat messages for one batch of (job, description) pairs.
+        """
+        keys = [f"J{n}" for n in range(1, len(items) + 1)]
+        blocks = "".join(self._job_block(k, job, desc) for k, (job, desc) in zip(keys, items))
+        return [
+            {"role": "system", "content": _SYSTEM_MSG},
+            {"role": "user", "content": self._preamble() + blocks + self._instructions(keys)},
+        ]
+
+    # ---------- Packing ----------
+
+    def pack(self, items: Sequence[tuple], max_size: int) -> List[List[int]]:
+        """
+        Split item indexes into batches that fit token_budget.
+
+        A single job larger than the budget still gets a batch of its own.
+        """
+        model = self.matcher.llm_model_name()
+        fixed = (
+            estimate_tokens(_SYSTEM_MSG, model)
+            + estimate_tokens(self._preamble(), model)
+            + estimate_tokens(self._instructions(["J1"]), model)
+        )
+
+        batches: List[List[int]] = []
+        current: List[int] = []
+        used = fixed
+        for i, (job, desc) in enumerate(items):
+            cost = estimate_tokens(self._job_block(f"J{len(current) + 1}", job, desc), model) + _ANSWER_TOKENS
+            if current and (used + cost > self.token_budget or len(current) >= max_size):
+                batches.append(current)
+                current, used = [], fixed
+            current.append(i)
+            used += cost
+        if current:
+            batches.append(current)
+        return batches
+
+    # ---------- Scoring ----------
+
+    def _call(self, messages) -> str:
+        self.calls += 1
+        resp = self.client.chat.completions.create(
+            model=self.matcher.llm_model_name(),
+            messages=messages,
+            temperature=0.1,
+        )
+        return resp.choices[0].message.content
+
+    def score_all(self, jobs: Sequence[JobPosting], descriptions: Sequence[str]) -> List:
+        """
+        Score every (job, description) pair; results are in input order.
+        """
+        if len(jobs) != len(descriptions):
+            raise ValueError("score_all needs one description per job")
+
+        m = self.matcher
+        results: List[Optional[Any]] = [None] * len(jobs)
+        pending: List[int] = []
+        for i, (job, desc) in enumerate(zip(jobs, descriptions)):
+            if self.client is None or not m.use_llm or m._build_llm_messages(job, desc) is None:
+                results[i] = m._score_naive(job, desc)
+                continue
+            cached = m._cached_llm_score(job, desc, BATCH_PROMPT_VERSION)
+            if cached is not None:
+                results[i] = cached
+            else:
+                pending.append(i)
+
+        size = self.max_batch_size
+        fatal: Optional[Exception] = None
+        for round_no in range(self.max_rounds):
+            if not pending or fatal is not None:
+                break
+            if round_no:
+                self.retried += len(pending)
+
+            items = [(jobs[i], descriptions[i]) for i in pending]
+            missing: List[int] = []
+            for batch in self.pack(items, size):
+                idxs = [pending[b] for b in batch]
+                self.jobs_sent += len(idxs)
+                try:
+                    answers = parse_batch_response(
+                        self._call(self.build_messages([(jobs[i], descriptions[i]) for i in idxs]))
+                    )
+                except Exception as e:
+                    print(f"[BatchLLMScorer] Batch of {len(idxs)} failed: {e}")
+                    self.failures += 1
+                    if isinstance(e, _NON_RETRYABLE):
+                        fatal = e
+                        break
+                    answers = {}
+
+                for n, i in enumerate(idxs, start=1):
+                    data = answers.get(f"J{n}")
+                    if data is None:
+                        missing.append(i)
+                        continue
+                    result = m._result_from_data(jobs[i], data)
+                    m._store_llm_score(descriptions[i], result, BATCH_PROMPT_VERSION)
+                    results[i] = result
+
+            pending = missing
+            size = max(1, size // 2)
+
+        if fatal is not None:
+            for i, result in enumerate(results):
+                if result is None:
+                    results[i] = m._llm_fallback(jobs[i], descriptions[i], fatal)
+            return results
+
+        # Still unanswered: one request per job, with the usual naive fallback
+        for i in pending:
+            self.single_fallbacks += 1
+            results[i] = m._score_with_llm(jobs[i], descriptions[i])
+        return results
+
+
+def score_llm_batched(
+        matcher,
+        jobs: Sequence[JobPosting],
+        descriptions: Sequence[str],
+        **scorer_kwargs,
+) -> List:
+    """
+    Entry point for the runner: score a batch and log the call savings.
+    """
+    scorer = BatchLLMScorer(matcher, **scorer_kwargs)
+    started = time.perf_counter()
+    try:
+        return scorer.score_all(jobs, descriptions)
+    finally:
+        print(
+            f"[BatchLLMScorer] jobs={len(jobs)} calls={scorer.calls} jobs_sent={scorer.jobs_sent} "
+            f"retried={scorer.retried} single_fallbacks={scorer.single_fallbacks} "
+            f"failures={scorer.failures} elapsed={time.perf_counter() - started:.1f}s"
+        )
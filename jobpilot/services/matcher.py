@@ -1,9 +1,16 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, asdict
-from typing import Optional, Dict, Any
+from collections import Counter
+from dataclasses import dataclass, asdict, replace
+from typing import Optional, Dict, Any, List, Sequence
 import re, os, json
 from jobpilot.models.job import JobPosting
+from jobpilot.services.lexical import Bm25Scorer, CorpusIndex
+from jobpilot.services.score_cache import ScoreCache, cache_key, text_sha
+from jobpilot.services.condense import Condenser
+from jobpilot.services.resume_profile import ResumeProfile, profile_condense_key
+from jobpilot.services.skills import SkillExtractor
+from jobpilot.utils.metrics import metrics
 
 # OpenAI import 
 try:
@@ -11,6 +18,10 @@ try:
 except ImportError:
     OpenAI = None # Graceful fallback on your installed client version
 
+# Bump whenever the scoring prompt/response format changes, so cached
+# LLM scores from the old prompt stop matching.
+PROMPT_VERSION = "1"
+
 @dataclass
 class JobMatchResult:
     job_id: str
@@ -24,11 +35,18 @@ class JobMatcher:
     Job/resume matcher.
 
     Uses: 
-    - naive keyword-overlap heuristic
+    - a cheap lexical strategy: naive keyword overlap (default),
+      BM25-weighted overlap backed by a persistent CorpusIndex, or
+      canonical-skill coverage (SkillExtractor)
+    - optional skill pre-filter: postings sharing too few known skills
+      with the resume are rejected before the LLM
     - LLM scoring via OpenAI
+    - optional cascade: when the cheap score is decisive (below
+      reject_below or above accept_above), the LLM call is skipped
 
     Public API:
     - top-scrore(job, description) -> JobMatchResult 
+    - score_many(jobs, descriptions) -> list[JobMatchResult] (naive, batched)
     """
 
     def __init__(
@@ -36,10 +54,56 @@ class JobMatcher:
             resume_text: str, 
             threshold: float = 0.60,
             use_llm: bool = True,
+            cheap_strategy: str = "naive",
+            corpus_index: CorpusIndex | None = None,
+            score_cache: ScoreCache | None = None,
+            cascade: Optional[Dict[str, float]] = None,
+            condenser: Condenser | None = None,
+            resume_token_budget: int = 2000,
+            profile: ResumeProfile | None = None,
+            skill_extractor: SkillExtractor | None = None,
+            skill_prefilter_min: int = 0,
     ) -> None:
         
         self.resume_text = resume_text or ""
         self.threshold = threshold
+        # Precompiled resume (tokens, skills, condensed text); see from_profile()
+        self.profile = profile
+
+        # Pre-tokenize resume once; reruse for evry job.
+        if profile is not None:
+            self._resume_words = set(profile.word_terms)
+            # Whitespace tokens used by the naive scorer
+            self._resume_split = set(profile.split_terms)
+        else:
+            self._resume_words = self._tokenize(self.resume_text)
+            # Whitespace tokens used by the naive scorer (lowercased + split once)
+            self._resume_split = set(self.resume_text.lower().split())
+
+        # Canonical skills (dictionary match); feeds the "skills" strategy
+        # and the pre-filter
+        self.skill_extractor = skill_extractor
+        self.skill_prefilter_min = int(skill_prefilter_min or 0)
+        self._resume_skills = skill_extractor.extract(self.resume_text) if skill_extractor else frozenset()
+        if self.skill_prefilter_min and skill_extractor is None:
+            raise ValueError("skill_prefilter_min needs a skill_extractor")
+
+        # Cheap (non-LLM) scoring strategy: "naive" | "bm25" | "skills"
+        self.cheap_strategy = cheap_strategy
+        self.corpus_index = corpus_index
+        self._bm25: Bm25Scorer | None = None
+        if cheap_strategy == "bm25":
+            self.corpus_index = corpus_index or CorpusIndex()
+            self._bm25 = Bm25Scorer(
+                self.corpus_index, self.resume_text, threshold=threshold, resume_terms=self._resume_words
+            )
+        elif cheap_strategy == "skills":
+            if skill_extractor is None:
+                raise ValueError("cheap_strategy 'skills' needs a skill_extractor")
+        elif cheap_strategy != "naive":
+            raise ValueError(
+                f"Unknown cheap_strategy: {cheap_strategy!r} (expected 'naive', 'bm25' or 'skills')"
+            )
         
         self.use_llm = use_llm
         self.api_key = os.getenv("OPENAI_API_KEY")
@@ -48,8 +112,36 @@ class JobMatcher:
             # Only create client if key is present and library is installed
             self.client = OpenAI(api_key=self.api_key)
         
-        # Pre-tokenize resume once; reruse for evry job.
-        self._resume_words = self._tokenize(self.resume_text)
+        # Cascade bands on the cheap score (percent). None disables the cascade.
+        self.cascade = None
+        if cascade and cascade.get("enabled", True):
+            reject_below = float(cascade.get("reject_below", 0.0))
+            accept_above = float(cascade.get("accept_above", 100.0))
+            if reject_below > accept_above:
+                raise ValueError("cascade.reject_below must be <= cascade.accept_above")
+            self.cascade = (reject_below, accept_above)
+        # Per-matcher counters: llm_scored, llm_skipped, cascade_reject, cascade_accept
+        self.stats: Counter = Counter()
+
+        # LLM score cache, keyed by model + prompt version + resume/description hashes
+        self.score_cache = score_cache
+        self._resume_sha = profile.sha if profile is not None else text_sha(self.resume_text)
+
+        # Token-aware condensation of prompt text (None: blind 8000-char cut)
+        self.condenser = condenser
+        self.resume_token_budget = resume_token_budget
+        self._resume_llm_text: str | None = None
+        if profile is not None and profile.llm_summary is not None and condenser is not None \
+                and profile.condense_key == profile_condense_key(condenser, resume_token_budget):
+            self._resume_llm_text = profile.llm_summary
+
+    @classmethod
+    def from_profile(cls, profile: ResumeProfile, **kwargs) -> "JobMatcher":
+        """
+        Matcher over a compiled ResumeProfile: no resume re-tokenizing, and the
+        condensed LLM resume is reused when it was built with the same condenser.
+        """
+        return cls(profile.text, profile=profile, **kwargs)
 
     def _tokenize(self, text: str) -> set[str]:
         """
@@ -62,15 +154,24 @@ class JobMatcher:
         """
         Fallback heuristic: keyword overlap between resume and job descrioption.
         """
-        resume_text = (self.resume_text or "").lower()
         desc_text = (description or "").lower()
 
         # Very dumb tokenization: split on whitespace
         # Can be replaced by other more advanced methods like SBERT
-        resume_tokens = set(resume_text.split())
         desc_tokens = set(desc_text.split())
 
-        if not resume_tokens or not desc_tokens:
+        if not self._resume_split or not desc_tokens:
+            return self._naive_result(job, None)
+        
+        shared = self._resume_split & desc_tokens
+        return self._naive_result(job, len(shared))
+
+    def _naive_result(self, job: JobPosting, shared_count: int | None) -> JobMatchResult:
+        """
+        Build the naive JobMatchResult from a shared-term count
+        (None means the resume or description text was missing).
+        """
+        if shared_count is None:
             return JobMatchResult(
                 job_id=job.id,
                 provider=job.provider,
@@ -78,15 +179,13 @@ class JobMatcher:
                 recommended=False,
                 reasons="Missing text of resume or job description"
             )
-        
-        shared = resume_tokens & desc_tokens
 
-        overlap_ratio = len(shared) / max(1, len(resume_tokens))
+        overlap_ratio = shared_count / max(1, len(self._resume_split))
         match_percent = round(overlap_ratio * 100, 1)
         recommended = match_percent >= 60.0
 
         reasons = (
-            f"Naive keyword overlap: {len(shared)} shared unque terms between "
+            f"Naive keyword overlap: {shared_count} shared unque terms between "
             f"resume and job description; approx {match_percent}% match." 
         )
 
@@ -97,26 +196,130 @@ class JobMatcher:
             recommended=recommended,
             reasons=reasons,
         )
+
+    def score_many(self, jobs: Sequence[JobPosting], descriptions: Sequence[str]) -> List[JobMatchResult]:
+        """
+        Naive scoring for a whole batch in one pass.
+
+        Same numbers as calling _score_naive per job; the resume terms are
+        split once at construction and each description is intersected
+        with them directly.
+        """
+        if len(jobs) != len(descriptions):
+            raise ValueError("score_many needs one description per job")
+
+        resume_terms = self._resume_split
+        return [
+            self._naive_result(job, len(resume_terms.intersection((desc or "").lower().split()))
+                               if resume_terms and desc and not desc.isspace() else None)
+            for job, desc in zip(jobs, descriptions)
+        ]
     
-    def _score_with_llm(self, job: JobPosting, description: str) -> Dict[str, Any]:
+    def score_cheap(self, job: JobPosting, description: str) -> JobMatchResult:
         """
-        Use an OpenAI model to score job vs resume.
+        Score with the configured non-LLM strategy.
+        """
+        if self._bm25 is not None:
+            return self._bm25.score(job, description)
+        if self.cheap_strategy == "skills":
+            return self._score_skills(job, description)
+        return self._score_naive(job, description)
 
-        Returens a JobMatchResult.
-        Falls back to naive scoring if anything goes wrong.
+    def skill_match(self, description: str) -> tuple[frozenset, frozenset]:
+        """
+        (shared, job_skills): canonical skills the posting asks for, and
+        which of them the resume has.
+        """
+        job_skills = self.skill_extractor.extract(description)
+        return job_skills & self._resume_skills, job_skills
+
+    def _score_skills(self, job: JobPosting, description: str) -> JobMatchResult:
+        """
+        Share of the posting's canonical skills that the resume covers.
+        """
+        shared, job_skills = self.skill_match(description)
+        if not job_skills or not self._resume_skills:
+            return JobMatchResult(
+                job_id=job.id,
+                provider=job.provider,
+                match_percent=0.0,
+                recommended=False,
+                reasons="No known skills found in resume or job description",
+            )
+
+        match_percent = round(100.0 * len(shared) / len(job_skills), 1)
+        missing = ", ".join(sorted(job_skills - shared)[:8]) or "none"
+        return JobMatchResult(
+            job_id=job.id,
+            provider=job.provider,
+            match_percent=match_percent,
+            recommended=match_percent >= self.threshold * 100.0,
+            reasons=(
+                f"Skill match: resume covers {len(shared)} of {len(job_skills)} skills in the posting "
+                f"({', '.join(sorted(shared)[:8]) or 'none'}); missing: {missing}."
+            ),
+        )
+
+    def prefilter_decision(self, cheap: JobMatchResult, description: str) -> Optional[JobMatchResult]:
+        """
+        Reject before any LLM call when the posting names known skills but
+        shares fewer than skill_prefilter_min of them with the resume.
+        Postings with no recognised skills pass (nothing to judge on).
+        """
+        if not self.skill_prefilter_min or self.skill_extractor is None:
+            return None
+        shared, job_skills = self.skill_match(description)
+        if not job_skills or len(shared) >= self.skill_prefilter_min:
+            return None
+
+        self.stats["prefilter_reject"] += 1
+        self.stats["llm_skipped"] += 1
+        return replace(
+            cheap,
+            recommended=False,
+            reasons=(
+                f"{cheap.reasons} [PREFILTER: {len(shared)} of {len(job_skills)} posting skills on resume, "
+                f"need {self.skill_prefilter_min}; LLM skipped]"
+            ),
+        )
+
+    def llm_model_name(self) -> str:
+        return os.getenv("JOBPILOT_MATCH_MODEL", "gpt-4.1-mini")
+
+    def llm_description(self, description: str) -> str:
+        """
+        Description text as it goes into an LLM prompt.
         """
-        if not self.client:
-            # Safely fallback if client not available
-            return self._score_naive(job, description)
-        
-        # Basic safety: truncate very long texts to avoid token blow-up
         desc_text = (description or "").strip()
-        resume_text = (self.resume_text or "").strip()
+        if self.condenser is None:
+            # Basic safety: truncate very long texts to avoid token blow-up
+            return desc_text[:8000]
+        return self.condenser.condense(desc_text).text
 
-        if not desc_text or not resume_text:
-            return self._score_naive(job, description)
+    def llm_resume(self) -> str:
+        """
+        Resume text as it goes into an LLM prompt (condensed once per matcher).
+        """
+        if self._resume_llm_text is None:
+            resume_text = (self.resume_text or "").strip()
+            if self.condenser is None:
+                self._resume_llm_text = resume_text[:8000]
+            else:
+                self._resume_llm_text = self.condenser.condense(
+                    resume_text, token_budget=self.resume_token_budget, record=False
+                ).text
+        return self._resume_llm_text
+
+    def _build_llm_messages(self, job: JobPosting, description: str) -> Optional[List[Dict[str, str]]]:
+        """
+        Chat messages for scoring one job, or None if there's nothing to send
+        (empty description/resume). Shared by the sync and async paths.
+        """
+        if not (description or "").strip() or not (self.resume_text or "").strip():
+            return None
 
-        model_name = os.getenv("JOBPILOT_MATCH_MODEL", "gpt-4.1-mini")
+        desc_text = self.llm_description(description)
+        resume_text = self.llm_resume()
 
         system_msg = (
             "You are an expert technical recruiter. "
@@ -135,10 +338,10 @@ class JobMatcher:
             - URL: {job.url}
 
             Job Description:
-            \"\"\"{desc_text[:8000]}\"\"\"
+            \"\"\"{desc_text}\"\"\"
 
             Candidate Resume:
-            \"\"\"{resume_text[:8000]}\"\"\"
+            \"\"\"{resume_text}\"\"\"
 
             Instructions:
             1. Analyze how well the candidate fits the role, considering skills, tech stack, years of experience, domain knowledge, and responsibilities.
@@ -151,48 +354,131 @@ class JobMatcher:
             "reasons": "short explanation"
             }}
             """
+
+        return [
+            {"role": "system", "content": system_msg},
+            {"role": "user", "content": user_msg}
+        ]
+
+    def _parse_llm_response(self, job: JobPosting, raw: str) -> JobMatchResult:
+        """
+        Turn the model's JSON reply into a JobMatchResult (raises on bad JSON).
+        """
+        data = json.loads(raw.strip())
+        return self._result_from_data(job, data)
+
+    def _result_from_data(self, job: JobPosting, data: Dict[str, Any]) -> JobMatchResult:
+        match_percent = float(data.get("match_percent", 0.0))
+        recommended = bool(data.get("recommended", match_percent >= 60.0))
+        reasons = str(data.get("reasons", "")) or "No reasons returned by the model."
+
+        # Clamp match_percent to [0, 100] just in case
+        match_percent = max(0.0, min(100.0, match_percent))
+
+        return JobMatchResult(
+            job_id=job.id,
+            provider=job.provider,
+            match_percent=match_percent,
+            recommended=recommended,
+            reasons=reasons,
+        )
+
+    def _llm_cache_key(self, description: str, prompt_version: str = PROMPT_VERSION) -> str:
+        if self.condenser is not None:
+            # Different condensing rules send a different prompt
+            prompt_version = f"{prompt_version}+condense-{self.condenser.fingerprint}-{self.resume_token_budget}"
+        return cache_key(self.llm_model_name(), prompt_version, self._resume_sha, description)
+
+    def _cached_llm_score(
+            self, job: JobPosting, description: str, prompt_version: str = PROMPT_VERSION
+    ) -> Optional[JobMatchResult]:
+        if self.score_cache is None:
+            return None
+        return self.score_cache.get(self._llm_cache_key(description, prompt_version), job)
+
+    def _store_llm_score(
+            self, description: str, result: JobMatchResult, prompt_version: str = PROMPT_VERSION
+    ) -> None:
+        # Only real model answers are cached, never fallbacks
+        if self.score_cache is not None:
+            self.score_cache.put(self._llm_cache_key(description, prompt_version), result)
+
+    def _llm_fallback(self, job: JobPosting, description: str, error: Exception) -> JobMatchResult:
+        # If anything blows up (bad JSON , etc.) -> fallback to naive
+        fallback = self._score_naive(job, description)
+        fallback.reasons += f"[FALLBACK: LLM scoring failed: {error}]"
+        return fallback
+
+    def _score_with_llm(self, job: JobPosting, description: str) -> Dict[str, Any]:
+        """
+        Use an OpenAI model to score job vs resume.
+
+        Returens a JobMatchResult.
+        Falls back to naive scoring if anything goes wrong.
+        """
+        if not self.client:
+            # Safely fallback if client not available
+            return self._score_naive(job, description)
         
+        messages = self._build_llm_messages(job, description)
+        if messages is None:
+            return self._score_naive(job, description)
+
+        cached = self._cached_llm_score(job, description)
+        if cached is not None:
+            return cached
+
         try: 
             resp = self.client.chat.completions.create(
-                model=model_name,
-                messages=[
-                    {"role": "system", "content": system_msg},
-                    {"role": "user", "content": user_msg}
-                ],
+                model=self.llm_model_name(),
+                messages=messages,
                 temperature=0.1,
             )
+            result = self._parse_llm_response(job, resp.choices[0].message.content)
+            self._store_llm_score(description, result)
+            return result
 
-            raw = resp.choices[0].message.content.strip()
-            data = json.loads(raw)
-
-            match_percent = float(data.get("match_percent", 0.0))
-            recommended = bool(data.get("recommended", match_percent >= 60.0))
-            reasons = str(data.get("reasons", "")) or "No reasons returned by the model."
-
-            # Clamp match_percent to [0, 100] just in case
-            match_percent = max(0.0, min(100.0, match_percent))
+        except Exception as e:
+            return self._llm_fallback(job, description, e)
 
-            return JobMatchResult(
-                job_id=job.id,
-                provider=job.provider,
-                match_percent=match_percent,
-                recommended=recommended,
-                reasons=reasons,
-            )
+    def cascade_decision(self, cheap: JobMatchResult) -> Optional[JobMatchResult]:
+        """
+        If the cheap score is outside the ambiguous band, return the final
+        result (no LLM needed); otherwise None.
+        """
+        if self.cascade is None:
+            return None
+        reject_below, accept_above = self.cascade
+
+        if cheap.match_percent < reject_below:
+            self.stats["cascade_reject"] += 1
+            verdict, recommended = f"below reject band ({reject_below}%)", False
+        elif cheap.match_percent > accept_above:
+            self.stats["cascade_accept"] += 1
+            verdict, recommended = f"above accept band ({accept_above}%)", True
+        else:
+            return None
 
-        except Exception as e:
-            # If anything blows up (bad JSON , etc.) -> fallback to naive
-            fallback = self._score_naive(job, description)
-            fallback.reasons += f"[FALLBACK: LLM scoring failed: {e}]"
-            return fallback
+        self.stats["llm_skipped"] += 1
+        return replace(
+            cheap,
+            recommended=recommended,
+            reasons=f"{cheap.reasons} [CASCADE: cheap score {verdict}; LLM skipped]",
+        )
 
     def top_score(self, job:JobPosting, description: str) -> Dict[str, Any]:
 
         """
-        Get both scores llm and naive and return to score
+        Get both scores llm and cheap (naive/bm25) and return to score.
+        With a cascade configured, a decisive cheap score is returned as-is.
         """
 
-        naive_score = self._score_naive(job, description)
+        naive_score = self.score_cheap(job, description)
+        decided = self.prefilter_decision(naive_score, description) or self.cascade_decision(naive_score)
+        if decided is not None:
+            return decided
+
+        self.stats["llm_scored"] += 1
         llm_score = self._score_with_llm(job, description)
 
         if naive_score.match_percent > llm_score.match_percent:
@@ -200,6 +486,62 @@ class JobMatcher:
         else:
             return llm_score
 
+    def top_score_many(
+            self,
+            jobs: Sequence[JobPosting],
+            descriptions: Sequence[str],
+            concurrency: int = 1,
+            llm_mode: str = "single",
+            batch_options: Optional[Dict[str, Any]] = None,
+            cheap_scores: Optional[Sequence[JobMatchResult]] = None,
+            **async_kwargs,
+    ) -> List[JobMatchResult]:
+        """
+        top_score for a batch. Only jobs the cascade can't decide go to the
+        LLM tier. With llm_mode="batch" those jobs are packed several per
+        request (BatchLLMScorer, batch_options go to its constructor). In
+        "single" mode, concurrency > 1 (and an LLM client) runs one request
+        per job concurrently through AsyncLLMScorer; otherwise serially.
+        `cheap_scores` skips the cheap tier when the caller already has it
+        (MultiProfileMatcher computes it for all profiles at once).
+        """
+        if llm_mode not in ("single", "batch"):
+            raise ValueError(f"Unknown llm_mode: {llm_mode!r} (expected 'single' or 'batch')")
+
+        if cheap_scores is None:
+            with metrics.timer("score_naive"):
+                cheap_scores = [self.score_cheap(job, desc) for job, desc in zip(jobs, descriptions)]
+        elif len(cheap_scores) != len(jobs):
+            raise ValueError("top_score_many needs one cheap score per job")
+        results: List[Optional[JobMatchResult]] = [
+            self.prefilter_decision(cheap, desc) or self.cascade_decision(cheap)
+            for cheap, desc in zip(cheap_scores, descriptions)
+        ]
+        pending = [i for i, r in enumerate(results) if r is None]
+        self.stats["llm_scored"] += len(pending)
+
+        pending_jobs = [jobs[i] for i in pending]
+        pending_descs = [descriptions[i] for i in pending]
+        llm_scores: List[JobMatchResult] = []
+        if pending:
+            metrics.inc("llm_jobs", len(pending), mode=llm_mode)
+            with metrics.timer("score_llm", mode=llm_mode):
+                if llm_mode == "batch" and self.client is not None:
+                    from jobpilot.services.llm_batch import score_llm_batched
+                    llm_scores = score_llm_batched(self, pending_jobs, pending_descs, **(batch_options or {}))
+                elif concurrency > 1 and self.client is not None:
+                    from jobpilot.services.llm_async import score_llm_concurrently
+                    llm_scores = score_llm_concurrently(
+                        self, pending_jobs, pending_descs, concurrency=concurrency, **async_kwargs
+                    )
+                else:
+                    llm_scores = [self._score_with_llm(job, desc) for job, desc in zip(pending_jobs, pending_descs)]
+
+        for i, llm in zip(pending, llm_scores):
+            cheap = cheap_scores[i]
+            results[i] = cheap if cheap.match_percent > llm.match_percent else llm
+        return results
+
     # The set up is using top_score method instead of this.
     def score(self, job: JobPosting, description: str) -> JobMatchResult:
         """
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+from collections import Counter
+from dataclasses import dataclass, field, replace
+from typing import Dict, List, Optional, Sequence
+
+from jobpilot.models.job import JobPosting
+from jobpilot.services.matcher import JobMatcher, JobMatchResult
+from jobpilot.services.resume_profile import ResumeProfile
+from jobpilot.utils.metrics import metrics
+
+
+@dataclass
+class ProfileMatch:
+    """
+    A job scored against every resume profile: the best result, which
+    profile produced it, and each profile's score.
+    """
+    result: JobMatchResult
+    profile: str
+    scores: Dict[str, float] = field(default_factory=dict)
+
+    def scores_text(self) -> str:
+        return "; ".join(f"{name}={score}" for name, score in self.scores.items())
+
+
+class MultiProfileMatcher:
+    """
+    Scores one set of fetched descriptions against several resume variants
+    (QA, backend, data, ...) in a single pass.
+
+    - one JobMatcher per profile, sharing the score cache, condenser,
+      corpus index and skill extractor
+    - naive cheap scores for all profiles share one split per description:
+      it is intersected with the union of the resumes' terms once, and each
+      profile counts its own terms in that (much smaller) hit set
+    - each job goes on to the rest of top_score_many (prefilter, cascade,
+      batched/concurrent LLM tier) only for its best cheap profile, so the
+      LLM is asked once per job, not once per job per profile
+
+    Ties on the cheap score go to the profile listed first.
+    """
+
+    def __init__(self, matchers: Dict[str, JobMatcher]) -> None:
+        if not matchers:
+            raise ValueError("MultiProfileMatcher needs at least one profile")
+        self.matchers = dict(matchers)
+
+    @classmethod
+    def from_profiles(cls, profiles: Dict[str, ResumeProfile], **kwargs) -> "MultiProfileMatcher":
+        """
+        One JobMatcher.from_profile per named profile, all built with the
+        same matcher kwargs.
+        """
+        return cls({name: JobMatcher.from_profile(profile, **kwargs) for name, profile in profiles.items()})
+
+    @property
+    def names(self) -> List[str]:
+        return list(self.matchers)
+
+    @property
+    def stats(self) -> Counter:
+        total: Counter = Counter()
+        for matcher in self.matchers.values():
+            total.update(matcher.stats)
+        return total
+
+    def cheap_scores(
+            self, jobs: Sequence[JobPosting], descriptions: Sequence[str]
+    ) -> Dict[str, List[JobMatchResult]]:
+        """
+        Cheap-tier result per profile per job. Profiles on the naive strategy
+        share one tokenization per description; the others score per job.
+        """
+        if len(jobs) != len(descriptions):
+            raise ValueError("cheap_scores needs one description per job")
+
+        scores: Dict[str, List[JobMatchResult]] = {}
+        naive = [
+            name for name, m in self.matchers.items()
+            if m.cheap_strategy == "naive" and m._resume_split
+        ]
+        if naive:
+            union = set().union(*(self.matchers[n]._resume_split for n in naive))
+            hits = [
+                union.intersection(desc.lower().split()) if desc and not desc.isspace() else None
+                for desc in descriptions
+            ]
+            for name in naive:
+                matcher = self.matchers[name]
+                terms = matcher._resume_split
+                scores[name] = [
+                    matcher._naive_result(job, len(terms & doc_hits) if doc_hits is not None else None)
+                    for job, doc_hits in zip(jobs, hits)
+                ]
+
+        for name, matcher in self.matchers.items():
+            if name not in scores:
+                scores[name] = [matcher.score_cheap(job, desc) for job, desc in zip(jobs, descriptions)]
+        return scores
+
+    def top_score_many(
+            self, jobs: Sequence[JobPosting], descriptions: Sequence[str], **kwargs
+    ) -> List[ProfileMatch]:
+        """
+        Cheap scores against every profile, then JobMatcher.top_score_many
+        for each job against its best cheap profile only (kwargs pass
+        through: concurrency, llm_mode, batch_options, ...). `scores` holds
+        the chosen profile's final score and the others' cheap scores.
+        """
+        with metrics.timer("score_naive"):
+            cheap = self.cheap_scores(jobs, descriptions)
+        best = [max(self.matchers, key=lambda name: cheap[name][i].match_percent) for i in range(len(jobs))]
+
+        final: List[Optional[JobMatchResult]] = [None] * len(jobs)
+        for name, matcher in self.matchers.items():
+            rows = [i for i, b in enumerate(best) if b == name]
+            if not rows:
+                continue
+            results = matcher.top_score_many(
+                [jobs[i] for i in rows],
+                [descriptions[i] for i in rows],
+                cheap_scores=[cheap[name][i] for i in rows],
+                **kwargs,
+            )
+            for i, result in zip(rows, results):
+                final[i] = result
+
+        matches: List[ProfileMatch] = []
+        for i, (profile, result) in enumerate(zip(best, final)):
+            scores = {name: cheap[name][i].match_percent for name in self.matchers}
+            scores[profile] = result.match_percent
+            if len(self.matchers) > 1:
+                result = replace(result, reasons=f"[profile {profile}] {result.reasons}")
+            matches.append(ProfileMatch(result=result, profile=profile, scores=scores))
+        return matches
@@ -0,0 +1,256 @@
+from __future__ import annotations
+
+import html, json, os, re, sqlite3, time
+import urllib.error
+import urllib.request
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from jobpilot.models.job import JobPosting
+from jobpilot.services.score_cache import normalize_description, text_sha
+
+_LD_JSON_RE = re.compile(
+    r"<script[^>]*type=[\"']application/ld\+json[\"'][^>]*>(?P<body>.*?)</script>", re.S | re.I
+)
+_TAG_RE = re.compile(r"<[^>]+>")
+_BLOCK_TAG_RE = re.compile(r"</?(?:p|br|li|ul|ol|div|h[1-6])\b[^>]*>", re.I)
+_DEFAULT_UA = "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0 Safari/537.36"
+
+
+def description_hash(text: str) -> str:
+    """Short hash of the normalized description (case/whitespace-insensitive)."""
+    return text_sha(normalize_description(text))[:16]
+
+
+def html_to_text(markup: str) -> str:
+    """Plain text from a description's HTML: tags dropped, entities decoded, whitespace collapsed."""
+    text = _BLOCK_TAG_RE.sub(" ", markup or "")
+    text = html.unescape(_TAG_RE.sub("", text))
+    return " ".join(text.split())
+
+
+def extract_ld_description(page_html: str) -> Optional[str]:
+    """
+    Description of the schema.org JobPosting embedded as JSON-LD (what job
+    boards publish for search engines), or None if the page has none.
+    """
+    for m in _LD_JSON_RE.finditer(page_html or ""):
+        try:
+            data = json.loads(m.group("body").strip())
+        except ValueError:
+            continue
+        stack = [data]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, list):
+                stack.extend(node)
+            elif isinstance(node, dict):
+                kind = node.get("@type")
+                if (kind == "JobPosting" or (isinstance(kind, list) and "JobPosting" in kind)) \
+                        and node.get("description"):
+                    return html_to_text(str(node["description"]))
+                stack.extend(node.get("@graph") or [])
+    return None
+
+
+@dataclass
+class FetchResult:
+    text: Optional[str]          # None: unchanged (304) or unavailable
+    not_modified: bool = False
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    error: Optional[str] = None
+
+
+class HttpDescriptionFetcher:
+    """
+    Browser-free description fetch: one plain GET of the job URL, reading
+    the JSON-LD JobPosting. Sends If-None-Match / If-Modified-Since from the
+    previous check so an unchanged page can come back as a body-less 304.
+    """
+
+    def __init__(self, timeout: float = 15.0, user_agent: str = _DEFAULT_UA) -> None:
+        self.timeout = timeout
+        self.user_agent = user_agent
+
+    def fetch(self, url: str, etag: Optional[str] = None, last_modified: Optional[str] = None) -> FetchResult:
+        headers = {"User-Agent": self.user_agent, "Accept": "text/html,application/xhtml+xml"}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        request = urllib.request.Request(url, headers=headers)
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as resp:
+                charset = resp.headers.get_content_charset() or "utf-8"
+                body = resp.read().decode(charset, errors="replace")
+                return FetchResult(
+                    text=extract_ld_description(body),
+                    etag=resp.headers.get("ETag"),
+                    last_modified=resp.headers.get("Last-Modified"),
+                    error=None,
+                )
+        except urllib.error.HTTPError as e:
+            if e.code == 304:
+                return FetchResult(text=None, not_modified=True, etag=etag, last_modified=last_modified)
+            return FetchResult(text=None, error=f"HTTP {e.code}")
+        except (urllib.error.URLError, OSError, ValueError) as e:
+            return FetchResult(text=None, error=str(e))
+
+
+class DescriptionStore:
+    """
+    Last seen description hash per posting (SQLite in the data dir), with
+    the HTTP validators of the last browser-free fetch.
+
+    Hashes are only compared between fetches from the same source ("http"
+    JSON-LD vs "browser" rendered text): a source switch re-baselines
+    instead of counting as a change.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        with self.conn:
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS descriptions ("
+                " key TEXT NOT NULL, source TEXT NOT NULL, hash TEXT NOT NULL,"
+                " etag TEXT, last_modified TEXT, checked_at REAL NOT NULL, changed_at REAL NOT NULL,"
+                " PRIMARY KEY (key, source))"
+            )
+
+    @staticmethod
+    def key(job: JobPosting) -> str:
+        return f"{job.provider}:{job.id}"
+
+    def get(self, job: JobPosting, source: str) -> Optional[Tuple[str, Optional[str], Optional[str]]]:
+        """(hash, etag, last_modified) from the last check, or None."""
+        return self.conn.execute(
+            "SELECT hash, etag, last_modified FROM descriptions WHERE key = ? AND source = ?",
+            (self.key(job), source),
+        ).fetchone()
+
+    def record(
+            self,
+            job: JobPosting,
+            source: str,
+            digest: str,
+            etag: Optional[str] = None,
+            last_modified: Optional[str] = None,
+    ) -> bool:
+        """Store the hash; True when it differs from the stored one."""
+        now = time.time()
+        previous = self.get(job, source)
+        changed = previous is not None and previous[0] != digest
+        with self.conn:
+            self.conn.execute(
+                "INSERT INTO descriptions (key, source, hash, etag, last_modified, checked_at, changed_at)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)"
+                " ON CONFLICT(key, source) DO UPDATE SET hash = excluded.hash, etag = excluded.etag,"
+                " last_modified = excluded.last_modified, checked_at = excluded.checked_at,"
+                " changed_at = CASE WHEN descriptions.hash != excluded.hash"
+                "   THEN excluded.changed_at ELSE descriptions.changed_at END",
+                (self.key(job), source, digest, etag, last_modified, now, now),
+            )
+        return changed
+
+    def touch(self, job: JobPosting, source: str) -> None:
+        with self.conn:
+            self.conn.execute(
+                "UPDATE descriptions SET checked_at = ? WHERE key = ? AND source = ?",
+                (time.time(), self.key(job), source),
+            )
+
+    def close(self) -> None:
+        self.conn.close()
+
+
+# Outcome of one refresh check
+CHANGED, UNCHANGED, BASELINED, UNAVAILABLE = "changed", "unchanged", "baselined", "unavailable"
+
+
+@dataclass
+class ChurnReport:
+    """
+    Refresh outcomes per search query (keyword @ location from the job's
+    metadata). churn = changed / (changed + unchanged).
+    """
+    by_query: Dict[str, Dict[str, int]] = field(default_factory=lambda: defaultdict(
+        lambda: {CHANGED: 0, UNCHANGED: 0, BASELINED: 0, UNAVAILABLE: 0}
+    ))
+
+    @staticmethod
+    def query_of(job: JobPosting) -> str:
+        md = job.metadata or {}
+        keyword = md.get("search_keyword") or "?"
+        location = md.get("search_location")
+        return f"{keyword} @ {location}" if location else keyword
+
+    def add(self, job: JobPosting, outcome: str) -> None:
+        self.by_query[self.query_of(job)][outcome] += 1
+
+    @staticmethod
+    def churn(counts: Dict[str, int]) -> float:
+        compared = counts[CHANGED] + counts[UNCHANGED]
+        return round(counts[CHANGED] / compared, 3) if compared else 0.0
+
+    def rows(self) -> List[Tuple[str, Dict[str, int], float]]:
+        """(query, counts, churn), highest churn first."""
+        return sorted(
+            ((q, dict(c), self.churn(c)) for q, c in self.by_query.items()),
+            key=lambda row: (-row[2], row[0]),
+        )
+
+    def total(self) -> Dict[str, int]:
+        totals = {CHANGED: 0, UNCHANGED: 0, BASELINED: 0, UNAVAILABLE: 0}
+        for counts in self.by_query.values():
+            for k, v in counts.items():
+                totals[k] += v
+        return totals
+
+
+def check_descriptions(
+        jobs: Iterable[JobPosting],
+        store: DescriptionStore,
+        fetcher: HttpDescriptionFetcher,
+        browser_fetch=None,
+        report: Optional[ChurnReport] = None,
+) -> List[Tuple[JobPosting, str, Optional[str]]]:
+    """
+    Re-check known postings: (job, outcome, description) per job, where the
+    description is set for CHANGED jobs (the ones worth rescoring).
+
+    The HTTP fetch is tried first; `browser_fetch(job) -> str` (optional)
+    covers pages without JSON-LD.
+    """
+    report = report if report is not None else ChurnReport()
+    checked: List[Tuple[JobPosting, str, Optional[str]]] = []
+    for job in jobs:
+        previous = store.get(job, "http")
+        etag, last_modified = (previous[1], previous[2]) if previous else (None, None)
+        got = fetcher.fetch(job.url, etag=etag, last_modified=last_modified)
+
+        if got.not_modified:
+            store.touch(job, "http")
+            outcome, text = UNCHANGED, None
+        elif got.text:
+            known = previous is not None
+            changed = store.record(job, "http", description_hash(got.text), got.etag, got.last_modified)
+            outcome = CHANGED if changed else (UNCHANGED if known else BASELINED)
+            text = got.text
+        elif browser_fetch is not None:
+            text = browser_fetch(job) or ""
+            if text:
+                known = store.get(job, "browser") is not None
+                changed = store.record(job, "browser", description_hash(text))
+                outcome = CHANGED if changed else (UNCHANGED if known else BASELINED)
+            else:
+                outcome = UNAVAILABLE
+        else:
+            outcome, text = UNAVAILABLE, None
+
+        report.add(job, outcome)
+        checked.append((job, outcome, text if outcome == CHANGED else None))
+    return checked
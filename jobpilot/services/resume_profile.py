@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import json, os
+from dataclasses import dataclass, asdict
+from typing import List, Optional
+
+from jobpilot.services.lexical import tokenize
+from jobpilot.services.score_cache import text_sha
+
+# Bump when compile_profile() output changes shape or meaning
+PROFILE_VERSION = 2
+
+
+@dataclass
+class ResumeProfile:
+    """
+    Everything the scorers need from the resume, computed once per file
+    version and persisted as JSON.
+    """
+    source_path: str
+    mtime: float
+    sha: str                                # text_sha of the text (score cache key input)
+    text: str
+    split_terms: List[str]                  # whitespace tokens (naive scorer)
+    word_terms: List[str]                   # \w+ tokens (legacy score(), BM25)
+    llm_summary: Optional[str] = None       # condensed LLM-ready text
+    condense_key: Optional[str] = None      # condenser fingerprint + budget it was built with
+    version: int = PROFILE_VERSION
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ResumeProfile":
+        return cls(**data)
+
+
+def profile_condense_key(condenser, resume_token_budget: int) -> Optional[str]:
+    """Which condenser settings an llm_summary was built with (None: not condensed)."""
+    if condenser is None:
+        return None
+    return f"{condenser.fingerprint}/{resume_token_budget}"
+
+
+def compile_profile(
+        text: str,
+        source_path: str = "",
+        mtime: float = 0.0,
+        condenser=None,
+        resume_token_budget: int = 2000,
+) -> ResumeProfile:
+    """
+    Build a ResumeProfile from raw resume text.
+    """
+
+    llm_summary = None
+    if condenser is not None:
+        llm_summary = condenser.condense(text.strip(), token_budget=resume_token_budget, record=False).text
+
+    return ResumeProfile(
+        source_path=source_path,
+        mtime=mtime,
+        sha=text_sha(text),
+        text=text,
+        split_terms=sorted(set(text.lower().split())),
+        word_terms=sorted(set(tokenize(text))),
+        llm_summary=llm_summary,
+        condense_key=profile_condense_key(condenser, resume_token_budget),
+    )
+
+
+class ResumeProfileStore:
+    """
+    Compiled-resume cache, on disk (JSON) and in memory.
+
+    get(path) returns the stored profile while the file's mtime is unchanged;
+    if the mtime moved but the content hash didn't (touch, re-save, copy) the
+    profile is reused with the new mtime. Only real edits recompile.
+    """
+
+    def __init__(self, cache_path: str) -> None:
+        self.cache_path = cache_path
+        self._profile: Optional[ResumeProfile] = None
+        self.compiles = 0
+
+    def _read(self) -> Optional[ResumeProfile]:
+        if self._profile is not None:
+            return self._profile
+        if not os.path.exists(self.cache_path):
+            return None
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") != PROFILE_VERSION:
+                return None
+            return ResumeProfile.from_dict(data)
+        except (OSError, ValueError, TypeError) as e:
+            print(f"[ResumeProfile] Ignoring unreadable cache {self.cache_path}: {e}")
+            return None
+
+    def _write(self, profile: ResumeProfile) -> None:
+        self._profile = profile
+        os.makedirs(os.path.dirname(os.path.abspath(self.cache_path)), exist_ok=True)
+        tmp_path = self.cache_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(asdict(profile), f)
+        os.replace(tmp_path, self.cache_path)
+
+    def get(self, resume_path: str, condenser=None, resume_token_budget: int = 2000) -> ResumeProfile:
+        source_path = os.path.abspath(resume_path)
+        mtime = os.stat(source_path).st_mtime
+        condense_key = profile_condense_key(condenser, resume_token_budget)
+
+        cached = self._read()
+        if cached is not None and (cached.source_path, cached.condense_key) != (source_path, condense_key):
+            cached = None
+        if cached is not None and cached.mtime == mtime:
+            self._profile = cached
+            return cached
+
+        with open(source_path, "r", encoding="utf-8") as f:
+            text = f.read()
+
+        if cached is not None and cached.sha == text_sha(text):
+            # Touched or re-saved, same content: just remember the new mtime
+            cached.mtime = mtime
+            self._write(cached)
+            return cached
+
+        self.compiles += 1
+        print(f"[ResumeProfile] Compiling resume profile for {source_path}")
+        profile = compile_profile(
+            text,
+            source_path=source_path,
+            mtime=mtime,
+            condenser=condenser,
+            resume_token_budget=resume_token_budget,
+        )
+        self._write(profile)
+        return profile
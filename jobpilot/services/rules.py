@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import re
+from collections import Counter
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from jobpilot.models.job import JobPosting
+
+
+def _compile_any(patterns: Sequence[str] | None, whole: bool = False) -> Optional[re.Pattern]:
+    """One case-insensitive alternation for a list of regexes (None if empty)."""
+    patterns = [p for p in (patterns or []) if p]
+    if not patterns:
+        return None
+    body = "|".join(f"(?:{p})" for p in patterns)
+    return re.compile(rf"^\s*(?:{body})\s*$" if whole else body, re.I)
+
+
+class CardRules:
+    """
+    Accept/reject rules over the fields a results-page card already has
+    (title, company, easy_apply), so obvious rejects never cost a detail
+    page load.
+
+    Config (`filters:` in searches.yaml):
+    - title_include: regexes, at least one must match (empty: any title)
+    - title_exclude: regexes, none may match (seniority, unwanted keywords)
+    - company_block: company names/regexes (whole-name, case-insensitive)
+    - easy_apply_only: reject cards without Easy Apply
+
+    Each list is compiled once into a single regex; evaluate() is a couple
+    of regex searches per card.
+    """
+
+    def __init__(
+            self,
+            title_include: Sequence[str] | None = None,
+            title_exclude: Sequence[str] | None = None,
+            company_block: Sequence[str] | None = None,
+            easy_apply_only: bool = False,
+    ) -> None:
+        self._title_include = _compile_any(title_include)
+        self._title_exclude = _compile_any(title_exclude)
+        self._company_block = _compile_any(company_block, whole=True)
+        self.easy_apply_only = bool(easy_apply_only)
+
+    @classmethod
+    def from_config(cls, filters_cfg: Optional[Dict]) -> Optional["CardRules"]:
+        """CardRules from a `filters:` block, or None when disabled/absent."""
+        cfg = filters_cfg or {}
+        if not cfg.get("enabled", True) or not any(
+            cfg.get(k) for k in ("title_include", "title_exclude", "company_block", "easy_apply_only")
+        ):
+            return None
+        return cls(
+            title_include=cfg.get("title_include"),
+            title_exclude=cfg.get("title_exclude"),
+            company_block=cfg.get("company_block"),
+            easy_apply_only=cfg.get("easy_apply_only", False),
+        )
+
+    def evaluate(self, job: JobPosting) -> Optional[Tuple[str, str]]:
+        """
+        (rule, reason) for a rejected card, or None if it should be fetched
+        and scored.
+        """
+        if self.easy_apply_only and not job.easy_apply:
+            return "easy_apply_only", "not Easy Apply"
+
+        title = job.title or ""
+        if self._title_exclude is not None:
+            m = self._title_exclude.search(title)
+            if m:
+                return "title_exclude", f"title matches excluded {m.group(0).strip()!r}"
+        if self._title_include is not None and not self._title_include.search(title):
+            return "title_include", "title matches no included keyword"
+
+        if self._company_block is not None and job.company and self._company_block.match(job.company):
+            return "company_block", f"company {job.company!r} is blocked"
+        return None
+
+    def split(self, jobs: Sequence[JobPosting]) -> Tuple[List[JobPosting], List[Tuple[JobPosting, str, str]]]:
+        """
+        One pass over all cards: (kept jobs, [(rejected job, rule, reason)]).
+        """
+        kept: List[JobPosting] = []
+        rejected: List[Tuple[JobPosting, str, str]] = []
+        for job in jobs:
+            verdict = self.evaluate(job)
+            if verdict is None:
+                kept.append(job)
+            else:
+                rejected.append((job, *verdict))
+        return kept, rejected
+
+    @staticmethod
+    def summarize(rejected: Sequence[Tuple[JobPosting, str, str]]) -> Dict[str, int]:
+        """Rejections per rule, for the run log."""
+        return dict(Counter(rule for _, rule, _ in rejected))
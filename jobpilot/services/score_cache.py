@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import hashlib, os, sqlite3, time
+from typing import Optional
+
+from jobpilot.models.job import JobPosting
+
+
+def text_sha(text: str) -> str:
+    return hashlib.sha256((text or "").encode("utf-8")).hexdigest()
+
+
+def normalize_description(text: str) -> str:
+    """Whitespace/case-insensitive form, so re-scrapes of the same text hash the same."""
+    return " ".join((text or "").lower().split())
+
+
+def cache_key(model: str, prompt_version: str, resume_sha: str, description: str) -> str:
+    """
+    Content address of one LLM score: same model + prompt + resume + description
+    text means the same answer, whatever URL or job id the posting came under.
+    """
+    desc_sha = text_sha(normalize_description(description))
+    return text_sha("\0".join([model, prompt_version, resume_sha, desc_sha]))
+
+
+class ScoreCache:
+    """
+    Persistent LLM score cache (SQLite), size-bounded with LRU eviction.
+
+    Stores match_percent / recommended / reasons per content key; the job id
+    and provider are filled back in from whichever job asks. Keeps hit/miss
+    counters for the run log.
+    """
+
+    def __init__(self, path: str, max_entries: int = 5000) -> None:
+        self.path = path
+        self.max_entries = max(1, int(max_entries))
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._conn: sqlite3.Connection | None = None
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        if self._conn is None:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            self._conn = sqlite3.connect(self.path)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS scores ("
+                " key TEXT PRIMARY KEY,"
+                " match_percent REAL NOT NULL,"
+                " recommended INTEGER NOT NULL,"
+                " reasons TEXT NOT NULL,"
+                " created_at REAL NOT NULL,"
+                " last_used REAL NOT NULL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS scores_last_used ON scores (last_used)")
+            self._conn.commit()
+        return self._conn
+
+    def get(self, key: str, job: JobPosting):
+        from jobpilot.services.matcher import JobMatchResult
+
+        row = self.conn.execute(
+            "SELECT match_percent, recommended, reasons FROM scores WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        with self.conn:
+            self.conn.execute("UPDATE scores SET last_used = ? WHERE key = ?", (time.time(), key))
+        match_percent, recommended, reasons = row
+        return JobMatchResult(
+            job_id=job.id,
+            provider=job.provider,
+            match_percent=float(match_percent),
+            recommended=bool(recommended),
+            reasons=f"{reasons} [cached]",
+        )
+
+    def put(self, key: str, result) -> None:
+        now = time.time()
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO scores"
+                " (key, match_percent, recommended, reasons, created_at, last_used)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (key, result.match_percent, int(bool(result.recommended)), result.reasons, now, now),
+            )
+            self._evict()
+
+    def _evict(self) -> None:
+        (size,) = self.conn.execute("SELECT COUNT(*) FROM scores").fetchone()
+        overflow = size - self.max_entries
+        if overflow > 0:
+            self.conn.execute(
+                "DELETE FROM scores WHERE key IN"
+                " (SELECT key FROM scores ORDER BY last_used ASC LIMIT ?)",
+                (overflow,),
+            )
+            self.evictions += overflow
+
+    def __len__(self) -> int:
+        (size,) = self.conn.execute("SELECT COUNT(*) FROM scores").fetchone()
+        return size
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "evictions": self.evictions,
+            "size": len(self),
+        }
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
@@ -0,0 +1,247 @@
+from __future__ import annotations
+
+import json, math, os, re, time, zlib
+from collections import Counter
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+# NumPy import
+try:
+    import numpy as np
+except ImportError:
+    np = None  # semantic layer is disabled without NumPy
+
+_WORD_RE = re.compile(r"[a-z0-9][a-z0-9+#./-]*[a-z0-9+#]|[a-z0-9]")
+
+# Function words carry no topical signal and would dominate unweighted vectors
+_STOPWORDS = frozenset(
+    "a an and are as at be by for from has have in is it its of on or our that the this to "
+    "we will with you your they their who what which can may must should would not all any "
+    "etc including about into over per via".split()
+)
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise RuntimeError("The semantic index needs NumPy (pip install numpy)")
+
+
+class HashedEmbedder:
+    """
+    Fixed-size text vectors without a model or network.
+
+    Features are word unigrams, word bigrams and character n-grams of each
+    word (so "automate" and "automation" overlap). Each feature is hashed
+    (crc32) into one of `dim` buckets with a hash-derived sign, weighted by
+    sublinear term frequency, and the vector is L2-normalised, so a dot
+    product is a cosine similarity.
+    """
+
+    def __init__(self, dim: int = 512, char_ngram: int = 4, bigram_weight: float = 0.7,
+                 char_weight: float = 0.3) -> None:
+        _require_numpy()
+        self.dim = int(dim)
+        self.char_ngram = int(char_ngram)
+        self.bigram_weight = bigram_weight
+        self.char_weight = char_weight
+
+    @property
+    def fingerprint(self) -> str:
+        return f"hash-v1-{self.dim}-{self.char_ngram}-{self.bigram_weight}-{self.char_weight}"
+
+    def features(self, text: str) -> Dict[str, float]:
+        words = [w for w in _WORD_RE.findall((text or "").lower()) if w not in _STOPWORDS]
+        feats: Counter = Counter()
+        for w in words:
+            feats["w:" + w] += 1.0
+        for a, b in zip(words, words[1:]):
+            feats["b:" + a + " " + b] += self.bigram_weight
+        if self.char_ngram > 0:
+            n = self.char_ngram
+            # Char grams per distinct word; repeats are already in the unigram tf
+            for w in set(words):
+                padded = f"<{w}>"
+                for i in range(len(padded) - n + 1):
+                    feats["c:" + padded[i:i + n]] += self.char_weight
+        # Sublinear tf: a posting that says "python" ten times isn't ten times as python
+        return {f: 1.0 + math.log(v) if v >= 1.0 else v for f, v in feats.items()}
+
+    def _hash(self, feature: str) -> Tuple[int, float]:
+        h = zlib.crc32(feature.encode("utf-8"))
+        return h % self.dim, (1.0 if h & 0x80000000 else -1.0)
+
+    def embed_many(self, texts: Sequence[str]):
+        """
+        (len(texts), dim) float32 matrix, one L2-normalised row per text
+        (all-zero rows for empty texts).
+        """
+        rows: List[int] = []
+        cols: List[int] = []
+        vals: List[float] = []
+        hash_ = self._hash
+        for r, text in enumerate(texts):
+            for feature, weight in self.features(text).items():
+                col, sign = hash_(feature)
+                rows.append(r)
+                cols.append(col)
+                vals.append(sign * weight)
+
+        matrix = np.zeros((len(texts), self.dim), dtype=np.float64)
+        np.add.at(matrix, (np.asarray(rows, dtype=np.int64), np.asarray(cols, dtype=np.int64)), vals)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        np.divide(matrix, norms, out=matrix, where=norms > 0)
+        return matrix.astype(np.float32)
+
+    def embed(self, text: str):
+        return self.embed_many([text])[0]
+
+
+def job_key(job) -> str:
+    return f"{job.provider}:{job.id}"
+
+
+def rank(matrix, query) -> Tuple[object, object]:
+    """
+    Cosine scores of every row against `query` in one matrix-vector product,
+    plus row indexes ordered best-first. A 2-D `query` (one row per resume
+    profile) scores each row by its best profile.
+    """
+    scores = matrix @ query if query.ndim == 1 else (matrix @ query.T).max(axis=1)
+    return scores, np.argsort(-scores, kind="stable")
+
+
+class SemanticIndex:
+    """
+    Persistent vector store for job descriptions.
+
+    - vectors.f32: float32 memmap, capacity x dim (grows by doubling)
+    - index.json: dim, capacity, embedder fingerprint and per-row key/metadata
+
+    Keys are "provider:job_id"; re-adding a key overwrites its row. Only
+    rows [0, count) are live.
+    """
+
+    def __init__(self, directory: str, embedder: HashedEmbedder | None = None) -> None:
+        _require_numpy()
+        self.directory = directory
+        self.embedder = embedder or HashedEmbedder()
+        self.dim = self.embedder.dim
+        self.keys: List[str] = []
+        self.meta: List[dict] = []
+        self._rows: Dict[str, int] = {}
+        self._vectors = None
+        self._capacity = 0
+
+        os.makedirs(directory, exist_ok=True)
+        self._load()
+
+    @property
+    def _vectors_path(self) -> str:
+        return os.path.join(self.directory, "vectors.f32")
+
+    @property
+    def _index_path(self) -> str:
+        return os.path.join(self.directory, "index.json")
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def _load(self) -> None:
+        if not os.path.exists(self._index_path):
+            return
+        with open(self._index_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("fingerprint") != self.embedder.fingerprint:
+            # Different embedding settings: old vectors aren't comparable
+            print(f"[SemanticIndex] Embedder changed; starting a fresh index in {self.directory}")
+            return
+        self.keys = list(data.get("keys") or [])
+        self.meta = list(data.get("meta") or [{} for _ in self.keys])
+        self._rows = {k: i for i, k in enumerate(self.keys)}
+        self._capacity = int(data.get("capacity", len(self.keys)))
+        if self._capacity:
+            self._vectors = np.memmap(self._vectors_path, dtype=np.float32, mode="r+",
+                                      shape=(self._capacity, self.dim))
+
+    def _reserve(self, needed: int) -> None:
+        if needed <= self._capacity:
+            return
+        capacity = max(needed, 2 * self._capacity, 256)
+        tmp_path = self._vectors_path + ".tmp"
+        grown = np.memmap(tmp_path, dtype=np.float32, mode="w+", shape=(capacity, self.dim))
+        if self._vectors is not None:
+            grown[:len(self.keys)] = self._vectors[:len(self.keys)]
+            self._vectors.flush()
+            del self._vectors
+        grown.flush()
+        del grown
+        os.replace(tmp_path, self._vectors_path)
+        self._capacity = capacity
+        self._vectors = np.memmap(self._vectors_path, dtype=np.float32, mode="r+", shape=(capacity, self.dim))
+
+    def add_many(self, keys: Sequence[str], vectors, meta: Sequence[dict] | None = None) -> None:
+        """
+        Store precomputed vectors (rows of embed_many) under their keys.
+        """
+        meta = list(meta) if meta is not None else [{} for _ in keys]
+        new = [k for k in dict.fromkeys(keys) if k not in self._rows]
+        self._reserve(len(self.keys) + len(new))
+        for key in new:
+            self._rows[key] = len(self.keys)
+            self.keys.append(key)
+            self.meta.append({})
+        rows = np.asarray([self._rows[k] for k in keys], dtype=np.int64)
+        self._vectors[rows] = vectors
+        for key, m in zip(keys, meta):
+            self.meta[self._rows[key]] = dict(m, added_at=time.time())
+
+    def add(self, key: str, text: str, meta: dict | None = None) -> None:
+        self.add_many([key], self.embedder.embed_many([text]), [meta or {}])
+
+    def vector(self, key: str):
+        row = self._rows.get(key)
+        return None if row is None else np.array(self._vectors[row])
+
+    def search(self, query, k: int = 10, exclude: Iterable[str] = ()) -> List[Tuple[str, float, dict]]:
+        """
+        Nearest stored rows to a query vector: [(key, cosine, meta)], best first.
+        Brute force over the memmap; fine for the tens of thousands of
+        postings one job search produces.
+        """
+        count = len(self.keys)
+        if not count or k <= 0:
+            return []
+        scores = self._vectors[:count] @ query
+        skip = {self._rows[key] for key in exclude if key in self._rows}
+        k = min(count, k + len(skip))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [
+            (self.keys[i], float(scores[i]), self.meta[i])
+            for i in top if i not in skip
+        ][:k - len(skip)]
+
+    def similar_to(self, key: str, k: int = 10) -> List[Tuple[str, float, dict]]:
+        """
+        "Jobs like this one": nearest neighbours of a stored posting.
+        """
+        vec = self.vector(key)
+        if vec is None:
+            raise KeyError(f"{key!r} is not in the semantic index")
+        return self.search(vec, k=k, exclude=[key])
+
+    def flush(self) -> None:
+        if self._vectors is not None:
+            self._vectors.flush()
+        tmp_path = self._index_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "fingerprint": self.embedder.fingerprint,
+                    "dim": self.dim,
+                    "capacity": self._capacity,
+                    "keys": self.keys,
+                    "meta": self.meta,
+                },
+                f,
+            )
+        os.replace(tmp_path, self._index_path)
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import hashlib, os
+from collections import deque
+from typing import Dict, FrozenSet, Iterable, List, Tuple
+
+import yaml
+
+DEFAULT_SKILLS_PATH = os.path.join("configs", "skills.yaml")
+
+
+def _normalize(text: str) -> str:
+    # Lowercase and collapse whitespace runs, so "Test   Automation" matches
+    return " ".join((text or "").lower().split())
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum() or ch == "_"
+
+
+class AhoCorasick:
+    """
+    Multi-pattern matcher compiled to a DFA: one dict lookup per input
+    character, whatever the number of patterns.
+
+    Patterns map to a payload (here: a canonical skill id). Matches only
+    count on word boundaries, so "java" doesn't fire inside "javascript".
+    """
+
+    def __init__(self, patterns: Iterable[Tuple[str, int]]) -> None:
+        # Trie
+        goto: List[Dict[str, int]] = [{}]
+        out: List[List[Tuple[int, int]]] = [[]]
+        for pattern, payload in patterns:
+            if not pattern:
+                continue
+            state = 0
+            for ch in pattern:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][ch] = nxt
+                    goto.append({})
+                    out.append([])
+                state = nxt
+            out[state].append((len(pattern), payload))
+
+        # Failure links (BFS), folded into full transition tables so the scan
+        # never has to walk fail chains
+        fail = [0] * len(goto)
+        delta: List[Dict[str, int]] = [dict(goto[0])] + [{} for _ in range(len(goto) - 1)]
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            out[state] = out[state] + out[fail[state]]
+            # Inherit the fail state's transitions, then override with our own
+            delta[state] = dict(delta[fail[state]])
+            for ch, nxt in goto[state].items():
+                fail[nxt] = delta[fail[state]].get(ch, 0)
+                delta[state][ch] = nxt
+                queue.append(nxt)
+
+        self.delta = delta
+        self.out = [tuple(o) for o in out]
+        self.n_states = len(goto)
+
+    def iter_matches(self, text: str) -> Iterable[Tuple[int, int, int]]:
+        """
+        Yield (start, end, payload) for every word-bounded match in `text`.
+        """
+        delta, out = self.delta, self.out
+        state = 0
+        n = len(text)
+        for i, ch in enumerate(text):
+            state = delta[state].get(ch, 0)
+            if out[state]:
+                after_ok = i + 1 >= n or not _is_word_char(text[i + 1])
+                for length, payload in out[state]:
+                    start = i - length + 1
+                    # A pattern that ends/starts in punctuation ("c++", ".net")
+                    # sets its own boundary on that side
+                    if (after_ok or not _is_word_char(text[i])) and (
+                        start == 0 or not _is_word_char(text[start - 1]) or not _is_word_char(text[start])
+                    ):
+                        yield start, i + 1, payload
+
+
+class SkillExtractor:
+    """
+    Canonical skills in a text, via one Aho-Corasick pass over the whole
+    synonym dictionary (configs/skills.yaml).
+
+    A skill with a synonym list matches only those spellings (the canonical
+    name is just its id, so "go: [golang]" leaves the English word alone);
+    an empty list matches the canonical name itself.
+
+    Built once; extract() is linear in the text length.
+    """
+
+    def __init__(self, skills: Dict[str, List[str]]) -> None:
+        self.canonical: List[str] = []
+        patterns: List[Tuple[str, int]] = []
+        for canonical, synonyms in (skills or {}).items():
+            canonical = _normalize(str(canonical))
+            skill_id = len(self.canonical)
+            self.canonical.append(canonical)
+            for pattern in {_normalize(str(s)) for s in synonyms or []} or {canonical}:
+                patterns.append((pattern, skill_id))
+        self.n_patterns = len(patterns)
+        self._automaton = AhoCorasick(sorted(patterns))
+
+        digest = hashlib.sha1(repr(sorted(patterns)).encode("utf-8"))
+        self.fingerprint = digest.hexdigest()[:8]
+
+    @classmethod
+    def load(cls, path: str = DEFAULT_SKILLS_PATH) -> "SkillExtractor":
+        with open(path, "r", encoding="utf-8") as f:
+            data = yaml.safe_load(f) or {}
+        return cls(data.get("skills") or {})
+
+    def extract(self, text: str) -> FrozenSet[str]:
+        """
+        Canonical skills mentioned anywhere in `text`.
+        """
+        ids = {payload for _, _, payload in self._automaton.iter_matches(_normalize(text))}
+        return frozenset(self.canonical[i] for i in ids)
+
+    def find(self, text: str) -> List[Tuple[str, str]]:
+        """
+        (canonical, matched text) for every mention, in order. For debugging
+        the dictionary rather than for scoring.
+        """
+        norm = _normalize(text)
+        return [(self.canonical[p], norm[s:e]) for s, e, p in self._automaton.iter_matches(norm)]
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+
+# tiktoken import (optional; exact counts when installed)
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+# Word pieces / punctuation runs: close to how BPE tokenizers split English
+# text, and much closer than len(text) / 4 on code-ish job descriptions.
+_PIECE_RE = re.compile(r"[A-Za-z]+|\d+|[^\sA-Za-z\d]")
+
+
+@lru_cache(maxsize=4)
+def _encoding(model: str):
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.encoding_for_model(model)
+    except Exception:
+        try:
+            return tiktoken.get_encoding("o200k_base")
+        except Exception:
+            return None
+
+
+def estimate_tokens(text: str, model: str = "gpt-4.1-mini") -> int:
+    """
+    Token count for `text`: exact via tiktoken if available, otherwise an
+    estimate from word pieces (long words count as several tokens).
+    """
+    if not text:
+        return 0
+    enc = _encoding(model)
+    if enc is not None:
+        return len(enc.encode(text, disallowed_special=()))
+
+    total = 0
+    for piece in _PIECE_RE.findall(text):
+        # BPE vocabularies cover common words whole; long/rare ones split
+        total += 1 + (len(piece) - 1) // 6 if piece.isalpha() else 1 + (len(piece) - 1) // 3
+    return total
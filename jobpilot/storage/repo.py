@@ -1,50 +1,47 @@
 from __future__ import annotations
+import json
 from typing import List
 from jobpilot.models.job import JobPosting
-from jobpilot.storage.sheets import SheetsClient
+from jobpilot.storage.schema import row_to_job
+from jobpilot.storage.sinks import JobSink, SheetsSink
+from jobpilot.utils.metrics import metrics
 # from jobpilot.utils.config import load_configs
 
 class JobRepo:
     """
-    Currently backed by Google Sheets via SheetsClient, but callers don't
-    need to know that. They just say: 'save these jobs for provider X'.
+    Backed by a JobSink (Google Sheets by default, or local JSONL/CSV/SQLite,
+    or a fan-out of several), but callers don't need to know that.
+    They just say: 'save these jobs for provider X'.
     """
-    def __init__(self, client: SheetsClient | None = None):
-        self._client = client or SheetsClient()
+    def __init__(self, client=None, sink: JobSink | None = None):
+        # `client` keeps the old JobRepo(SheetsClient()) call working
+        self._sink = sink or SheetsSink(client=client)
+
+    @property
+    def sink(self) -> JobSink:
+        return self._sink
 
-    def _sheet_name_for_provider(self, provider: str) -> str:
-        # return f"{provider.capitalize()} Jobs"
-        return self._client.default_sheet_name
-    
     def save_jobs(self, provider: str, jobs: List[JobPosting]) -> dict[str, int]:
         """
         Persits a batch of jobs for a provider.
 
-        Right now this just delegates to SheetsClient.append_jobs
-        with a provide-specific worksheet name. 
+        Delegates to the configured sink; returns {job_id: row_idx}.
         """
         if not jobs:
             return {}
         
-        sheet_name = self._sheet_name_for_provider(provider)
-        return self._client.append_jobs(sheet_name, jobs)
+        with metrics.timer("sink_append", sink=type(self._sink).__name__):
+            row_map = self._sink.save_jobs(provider, jobs)
+        metrics.inc("jobs_saved", len(jobs))
+        return row_map
 
     def _find_row_index_by_job_id(self, provider:  str, job_id: str) -> int | None:
-        sheet_name = self._sheet_name_for_provider(provider)
-        last_match = None
-        for row_idx, row_values in self._client.iter_jobs(sheet_name):
-            # HEADER: ["id", "provider", "title", ...]
-            if not row_values:
-                continue
-            if row_values[0] == job_id:
-                last_match = row_idx
-        return last_match
+        return self._sink.find_row_index(provider, job_id)
     
     def _get_job_row(self, provider: str, job_id: str) -> tuple[int, list[str]] | None:
-        sheet_name = self._sheet_name_for_provider(provider)
         last_match = None
 
-        for row_idx, row_values in self._client.iter_jobs(sheet_name):
+        for row_idx, row_values in self._sink.iter_jobs(provider):
             if row_values and row_values[0] == job_id:
                 last_match = (row_idx, row_values)
 
@@ -59,24 +56,31 @@ class JobRepo:
                 ...
             }
         """
-        sheet_name = self._sheet_name_for_provider(provider)
         found: dict[str, tuple[int, list[str]]] = {}
 
-        for row_idx, row_values in self._client.iter_jobs(sheet_name):
-            if not row_values:
-                continue
-            job_id = row_values[0]
-            if job_id:
-                found[job_id] = (row_idx, row_values)
+        with metrics.timer("sink_read", sink=type(self._sink).__name__):
+            for row_idx, row_values in self._sink.iter_jobs(provider):
+                if not row_values:
+                    continue
+                job_id = row_values[0]
+                if job_id:
+                    found[job_id] = (row_idx, row_values)
 
         return found
 
+    def iter_saved_jobs(self, provider: str) -> list[tuple[int, JobPosting]]:
+        """
+        (row_idx, JobPosting) for every stored job, newest row per id.
+        """
+        latest: dict[str, tuple[int, list[str]]] = self.get_existing_jobs_id(provider)
+        return [(row_idx, row_to_job(row_values)) for row_idx, row_values in latest.values()]
+
     def is_applied_row(self, provider: str, row_values: list[str]) -> bool:
         """
         Check whether a row's 'applied' column is Yes
         """
         try:
-            headers = self._client.headers_for_sheet(self._sheet_name_for_provider(provider))
+            headers = self._sink.headers(provider)
             applied_idx = headers.index("applied")
             applied_value = row_values[applied_idx].strip().lower() if len(row_values) > applied_idx else ""
             return applied_value == "yes"
@@ -113,9 +117,8 @@ class JobRepo:
             applied_at: str | None = None,
             notes: str | None = None,
             row_idx: int | None = None,
+            metadata: dict | None = None,
     ) -> None:
-        sheet_name = self._sheet_name_for_provider(job.provider)
-
         if row_idx is None:
             row_idx = self._find_row_index_by_job_id(job.provider, job.id)
 
@@ -132,6 +135,9 @@ class JobRepo:
             fields["applied_at"] = applied_at
         if notes is not None:
             fields["application_status_notes"] = notes
+        if metadata is not None:
+            fields["raw_metadata"] = json.dumps(metadata, ensure_ascii=False)
 
         if fields:
-            self._client.update_fields(sheet_name, row_idx, fields)
+            with metrics.timer("sink_update", sink=type(self._sink).__name__):
+                self._sink.update_fields(job.provider, job.id, fields, row_idx=row_idx)
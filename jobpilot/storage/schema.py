@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import json
+from datetime import datetime, timezone
+
+from jobpilot.models.job import JobPosting
+
+# Column layout shared by every sink (Sheets worksheet, CSV, SQLite, JSONL)
+HEADERS = [
+    "id",
+    "provider",
+    "title",
+    "company",
+    "location",
+    "job_url",
+    "easy_apply",
+    "created_at",
+    "match_percent",
+    "applied",
+    "applied_at",
+    "application_status_notes",
+    "raw_metadata",
+]
+
+
+def job_to_row(job: JobPosting, created_at: datetime | None = None) -> list:
+    """Flatten a JobPosting into a row  matching HEADERS orders."""
+    created_at = created_at or datetime.now(timezone.utc)
+    created_iso = created_at.isoformat()
+
+    # Normalizing location into empty string in None.
+    location = job.location or (job.metadata.get("location") if job.metadata else "")
+    raw_metadata = json.dumps(job.metadata or {}, ensure_ascii=False)
+
+    # Read job application status, match percentage from matadata
+    metadata = job.metadata or {}
+
+    match_percent = metadata.get("match_percent", "")
+    applied = metadata.get("applied", "")
+    applied_at = metadata.get("applied_at", "")
+    status_notes = (
+        metadata.get("application_status_notes")
+        or metadata.get("match_reasons")
+        or ""
+    )
+
+    # Match HEADERS:
+    return [
+        job.id,
+        job.provider,
+        job.title,
+        job.company,
+        location,
+        job.url,
+        job.easy_apply,
+        created_iso,
+        match_percent,          # match_percent (empty for now)
+        applied,          # applied
+        applied_at,          # applied_at
+        status_notes,          # application_status_notes
+        raw_metadata,
+    ]
+
+
+def stringify_row(row: list) -> list[str]:
+    """
+    Local sinks store what Sheets hands back on read: plain strings, '' for None.
+    """
+    return ["" if value is None else str(value) for value in row]
+
+
+def row_to_job(row: list[str]) -> JobPosting:
+    """Rebuild a JobPosting from a stored row (inverse of job_to_row)."""
+    values = dict(zip(HEADERS, list(row) + [""] * (len(HEADERS) - len(row))))
+    try:
+        metadata = json.loads(values["raw_metadata"] or "{}")
+    except ValueError:
+        metadata = {}
+    return JobPosting(
+        id=values["id"],
+        title=values["title"],
+        company=values["company"],
+        location=values["location"],
+        url=values["job_url"],
+        provider=values["provider"],
+        easy_apply=str(values["easy_apply"]).strip().lower() == "true",
+        metadata=metadata if isinstance(metadata, dict) else {},
+    )
@@ -9,24 +9,9 @@ from typing import List
 from google.oauth2.service_account import Credentials
 
 from jobpilot.models.job import JobPosting
+from jobpilot.storage.schema import HEADERS, job_to_row
 from jobpilot.utils.config import load_configs
 
-HEADERS = [
-    "id",
-    "provider",
-    "title",
-    "company",
-    "location",
-    "job_url",
-    "easy_apply",
-    "created_at",
-    "match_percent",
-    "applied",
-    "applied_at",
-    "application_status_notes",
-    "raw_metadata",
-]
-
 # Authentication helper
 def _load_service_account_credentials(sa_json_path: str) -> Credentials:
     """ Load service account credentials for Google API
@@ -122,44 +107,8 @@ class SheetsClient:
         self._header_cache[sheet_name] = existing
         return ws
 
-    @staticmethod
-    def _job_to_row(job: JobPosting, created_at: datetime | None = None) -> list:
-        """Flatten a JobPosting into a row  matching HEADERS orders."""
-        created_at = created_at or datetime.now(timezone.utc)
-        created_iso = created_at.isoformat()
-
-        # Normalizing location into empty string in None.
-        location = job.location or (job.metadata.get("location") if job.metadata else "")
-        raw_metadata = json.dumps(job.metadata or {}, ensure_ascii=False)
-
-        # Read job application status, match percentage from matadata
-        metadata = job.metadata or {} 
-
-        match_percent = metadata.get("match_percent", "")
-        applied = metadata.get("applied", "")
-        applied_at = metadata.get("applied_at", "")
-        status_notes = (
-            metadata.get("application_status_notes")
-            or metadata.get("match_reasons")
-            or ""
-        )
-
-        # Match HEADERS:
-        return [
-            job.id,
-            job.provider,
-            job.title,
-            job.company,
-            location,
-            job.url,
-            job.easy_apply,
-            created_iso,
-            match_percent,          # match_percent (empty for now)
-            applied,          # applied
-            applied_at,          # applied_at
-            status_notes,          # application_status_notes
-            raw_metadata,
-        ]
+    # Row layout lives in storage.schema so local sinks write the same columns
+    _job_to_row = staticmethod(job_to_row)
     
     @property
     def default_sheet_name(self) -> str:
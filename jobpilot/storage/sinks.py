@@ -0,0 +1,429 @@
+from __future__ import annotations
+
+import csv, json, os, sqlite3
+from abc import ABC, abstractmethod
+from datetime import datetime, timezone
+from typing import Iterator, List
+
+from jobpilot.models.job import JobPosting
+from jobpilot.storage.schema import HEADERS, job_to_row, stringify_row
+from jobpilot.utils.paths import data_dir
+
+# First data row; row 1 is the header everywhere (Google Sheets style).
+FIRST_ROW = 2
+
+
+class JobSink(ABC):
+    """
+    Where JobRepo persists job rows.
+
+    Every sink speaks the Sheets row model: rows are lists of strings in
+    HEADERS order, addressed by a 1-based row index with the header on row 1.
+    Sinks open their backing resource lazily on first use, so building one
+    is free and a run that never writes never touches the network/disk.
+    """
+
+    name = "base"
+
+    def headers(self, provider: str) -> list[str]:
+        return list(HEADERS)
+
+    @abstractmethod
+    def iter_jobs(self, provider: str) -> Iterator[tuple[int, list[str]]]: ...
+
+    @abstractmethod
+    def save_jobs(self, provider: str, jobs: List[JobPosting]) -> dict[str, int]: ...
+
+    @abstractmethod
+    def update_fields(
+            self,
+            provider: str,
+            job_id: str,
+            fields: dict[str, str],
+            row_idx: int | None = None,
+    ) -> None: ...
+
+    def find_row_index(self, provider: str, job_id: str) -> int | None:
+        """Last row carrying job_id (appends never dedupe, so the newest wins)."""
+        last_match = None
+        for row_idx, row_values in self.iter_jobs(provider):
+            if row_values and row_values[0] == job_id:
+                last_match = row_idx
+        return last_match
+
+
+# ---------------------------------------------------------------------------
+# Google Sheets
+# ---------------------------------------------------------------------------
+class SheetsSink(JobSink):
+    """
+    SheetsClient behind the sink interface.
+
+    The client (credentials + spreadsheet open) is only created on first use.
+    """
+
+    name = "sheets"
+
+    def __init__(self, client=None, sa_json_path: str | None = None, spreadsheet_name: str | None = None) -> None:
+        self._client_instance = client
+        self._sa_json_path = sa_json_path
+        self._spreadsheet_name = spreadsheet_name
+
+    @property
+    def client(self):
+        if self._client_instance is None:
+            # Imported here so local-only runs don't need gspread/google-auth loaded
+            from jobpilot.storage.sheets import SheetsClient
+            self._client_instance = SheetsClient(self._sa_json_path, self._spreadsheet_name)
+        return self._client_instance
+
+    def _sheet_name(self, provider: str) -> str:
+        # return f"{provider.capitalize()} Jobs"
+        return self.client.default_sheet_name
+
+    def headers(self, provider: str) -> list[str]:
+        return self.client.headers_for_sheet(self._sheet_name(provider))
+
+    def iter_jobs(self, provider: str) -> Iterator[tuple[int, list[str]]]:
+        return self.client.iter_jobs(self._sheet_name(provider))
+
+    def save_jobs(self, provider: str, jobs: List[JobPosting]) -> dict[str, int]:
+        return self.client.append_jobs(self._sheet_name(provider), jobs)
+
+    def update_fields(self, provider, job_id, fields, row_idx=None) -> None:
+        if row_idx is None:
+            row_idx = self.find_row_index(provider, job_id)
+        if row_idx is None:
+            raise RuntimeError(f"Could not find job row in sheet for id={job_id}")
+        self.client.update_fields(self._sheet_name(provider), row_idx, fields)
+
+
+# ---------------------------------------------------------------------------
+# Local sinks
+# ---------------------------------------------------------------------------
+class _LocalSink(JobSink):
+    """
+    Shared bits of the file-backed sinks: base dir + per-provider file naming.
+    """
+
+    suffix = ""
+
+    def __init__(self, base_dir: str | None = None) -> None:
+        self._base_dir = base_dir
+
+    def _path(self, provider: str) -> str:
+        base = self._base_dir or data_dir()
+        os.makedirs(base, exist_ok=True)
+        return os.path.join(base, f"jobs-{provider}{self.suffix}")
+
+    @staticmethod
+    def _rows_for(jobs: List[JobPosting]) -> list[list[str]]:
+        created_at = datetime.now(timezone.utc)
+        return [stringify_row(job_to_row(job, created_at)) for job in jobs]
+
+
+class JsonlSink(_LocalSink):
+    """
+    Append-only event log, one file per provider.
+
+    Each line is either {"op": "append", "row": [...]} or
+    {"op": "update", "row_idx": n, "fields": {...}}. The current table is
+    rebuilt by replaying the log once, then kept in memory.
+    """
+
+    name = "jsonl"
+    suffix = ".jsonl"
+
+    def __init__(self, base_dir: str | None = None) -> None:
+        super().__init__(base_dir)
+        self._rows: dict[str, list[list[str]]] = {}
+
+    def _load(self, provider: str) -> list[list[str]]:
+        if provider in self._rows:
+            return self._rows[provider]
+
+        rows: list[list[str]] = []
+        path = self._path(provider)
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        event = json.loads(line)
+                    except json.JSONDecodeError:
+                        # Torn last line after a crash; everything before it is good
+                        continue
+                    if event.get("op") == "append":
+                        rows.append(list(event["row"]))
+                    elif event.get("op") == "update":
+                        pos = int(event["row_idx"]) - FIRST_ROW
+                        if 0 <= pos < len(rows):
+                            self._apply(rows[pos], event.get("fields") or {})
+
+        self._rows[provider] = rows
+        return rows
+
+    @staticmethod
+    def _apply(row: list[str], fields: dict[str, str]) -> None:
+        for key, value in fields.items():
+            if key in HEADERS:
+                row[HEADERS.index(key)] = "" if value is None else str(value)
+
+    def _write(self, provider: str, events: list[dict]) -> None:
+        with open(self._path(provider), "a", encoding="utf-8") as f:
+            for event in events:
+                f.write(json.dumps(event, ensure_ascii=False) + "\n")
+
+    def iter_jobs(self, provider):
+        for pos, row in enumerate(self._load(provider)):
+            yield pos + FIRST_ROW, list(row)
+
+    def save_jobs(self, provider, jobs):
+        if not jobs:
+            return {}
+        rows = self._load(provider)
+        new_rows = self._rows_for(jobs)
+        start_row = len(rows) + FIRST_ROW
+
+        self._write(provider, [{"op": "append", "row": row} for row in new_rows])
+        rows.extend(new_rows)
+        return {job.id: start_row + i for i, job in enumerate(jobs)}
+
+    def update_fields(self, provider, job_id, fields, row_idx=None):
+        rows = self._load(provider)
+        if row_idx is None:
+            row_idx = self.find_row_index(provider, job_id)
+        if row_idx is None or not (0 <= row_idx - FIRST_ROW < len(rows)):
+            raise RuntimeError(f"Could not find job row in {self._path(provider)} for id={job_id}")
+
+        self._write(provider, [{"op": "update", "row_idx": row_idx, "fields": fields}])
+        self._apply(rows[row_idx - FIRST_ROW], fields)
+
+
+class CsvSink(_LocalSink):
+    """
+    Plain CSV with the HEADERS row, one file per provider.
+
+    Appends are streamed; field updates rewrite the file (atomically via
+    os.replace), which is fine at the few-thousand-row scale we run at.
+    """
+
+    name = "csv"
+    suffix = ".csv"
+
+    def _read_all(self, provider: str) -> list[list[str]]:
+        path = self._path(provider)
+        if not os.path.exists(path):
+            return []
+        with open(path, "r", encoding="utf-8", newline="") as f:
+            rows = list(csv.reader(f))
+        return rows[1:]  # drop header
+
+    def iter_jobs(self, provider):
+        for pos, row in enumerate(self._read_all(provider)):
+            yield pos + FIRST_ROW, row
+
+    def save_jobs(self, provider, jobs):
+        if not jobs:
+            return {}
+        path = self._path(provider)
+        existing = len(self._read_all(provider))
+        is_new = not os.path.exists(path)
+
+        with open(path, "a", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f)
+            if is_new:
+                writer.writerow(HEADERS)
+            writer.writerows(self._rows_for(jobs))
+
+        start_row = existing + FIRST_ROW
+        return {job.id: start_row + i for i, job in enumerate(jobs)}
+
+    def update_fields(self, provider, job_id, fields, row_idx=None):
+        rows = self._read_all(provider)
+        if row_idx is None:
+            row_idx = self.find_row_index(provider, job_id)
+        if row_idx is None or not (0 <= row_idx - FIRST_ROW < len(rows)):
+            raise RuntimeError(f"Could not find job row in {self._path(provider)} for id={job_id}")
+
+        row = rows[row_idx - FIRST_ROW]
+        row.extend([""] * (len(HEADERS) - len(row)))
+        for key, value in fields.items():
+            if key in HEADERS:
+                row[HEADERS.index(key)] = "" if value is None else str(value)
+
+        path = self._path(provider)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(HEADERS)
+            writer.writerows(rows)
+        os.replace(tmp_path, path)
+
+
+class SqliteSink(_LocalSink):
+    """
+    Single SQLite database; `jobs` table with the HEADERS columns.
+
+    The row index handed out is the SQLite rowid, so it stays stable across
+    runs and update_fields is a primary-key update.
+    """
+
+    name = "sqlite"
+
+    def __init__(self, base_dir: str | None = None, db_path: str | None = None) -> None:
+        super().__init__(base_dir)
+        self._db_path = db_path
+        self._conn: sqlite3.Connection | None = None
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        if self._conn is None:
+            path = self._db_path or os.path.join(self._base_dir or data_dir(), "jobs.sqlite3")
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            self._conn = sqlite3.connect(path)
+            columns = ", ".join(f'"{h}" TEXT' for h in HEADERS)
+            self._conn.execute(f"CREATE TABLE IF NOT EXISTS jobs ({columns})")
+            self._conn.execute('CREATE INDEX IF NOT EXISTS jobs_provider_id ON jobs ("provider", "id")')
+            self._conn.commit()
+        return self._conn
+
+    def iter_jobs(self, provider):
+        columns = ", ".join(f'"{h}"' for h in HEADERS)
+        cursor = self.conn.execute(
+            f'SELECT rowid, {columns} FROM jobs WHERE "provider" = ? ORDER BY rowid',
+            (provider,),
+        )
+        for rowid, *values in cursor:
+            yield rowid, ["" if v is None else v for v in values]
+
+    def save_jobs(self, provider, jobs):
+        if not jobs:
+            return {}
+        columns = ", ".join(f'"{h}"' for h in HEADERS)
+        placeholders = ", ".join("?" for _ in HEADERS)
+        row_map: dict[str, int] = {}
+        with self.conn:
+            for job, row in zip(jobs, self._rows_for(jobs)):
+                cursor = self.conn.execute(f"INSERT INTO jobs ({columns}) VALUES ({placeholders})", row)
+                row_map[job.id] = cursor.lastrowid
+        return row_map
+
+    def find_row_index(self, provider, job_id):
+        found = self.conn.execute(
+            'SELECT MAX(rowid) FROM jobs WHERE "provider" = ? AND "id" = ?',
+            (provider, job_id),
+        ).fetchone()
+        return found[0] if found else None
+
+    def update_fields(self, provider, job_id, fields, row_idx=None):
+        if row_idx is None:
+            row_idx = self.find_row_index(provider, job_id)
+        if row_idx is None:
+            raise RuntimeError(f"Could not find job row in sqlite for id={job_id}")
+
+        fields = {k: ("" if v is None else str(v)) for k, v in fields.items() if k in HEADERS}
+        if not fields:
+            return
+        assignments = ", ".join(f'"{k}" = ?' for k in fields)
+        with self.conn:
+            self.conn.execute(f"UPDATE jobs SET {assignments} WHERE rowid = ?", (*fields.values(), row_idx))
+
+
+# ---------------------------------------------------------------------------
+# Fan-out
+# ---------------------------------------------------------------------------
+class FanOutSink(JobSink):
+    """
+    Writes go to every sink; reads come from the first (primary) one.
+
+    Row indexes handed back to callers are the primary's. Each secondary
+    keeps its own id -> row map from save_jobs so updates land on the right
+    row there too. A failing secondary is logged and skipped; a failing
+    primary raises like a single sink would.
+    """
+
+    name = "fanout"
+
+    def __init__(self, sinks: List[JobSink]) -> None:
+        if not sinks:
+            raise ValueError("FanOutSink needs at least one sink")
+        self.sinks = list(sinks)
+        self._row_maps: list[dict[str, int]] = [{} for _ in self.sinks]
+
+    @property
+    def primary(self) -> JobSink:
+        return self.sinks[0]
+
+    def headers(self, provider):
+        return self.primary.headers(provider)
+
+    def iter_jobs(self, provider):
+        return self.primary.iter_jobs(provider)
+
+    def find_row_index(self, provider, job_id):
+        return self.primary.find_row_index(provider, job_id)
+
+    def save_jobs(self, provider, jobs):
+        primary_map: dict[str, int] = {}
+        for i, sink in enumerate(self.sinks):
+            try:
+                row_map = sink.save_jobs(provider, jobs)
+            except Exception as e:
+                if i == 0:
+                    raise
+                print(f"[FanOutSink] save_jobs failed on {sink.name}: {e}")
+                continue
+            self._row_maps[i].update(row_map)
+            if i == 0:
+                primary_map = row_map
+        return primary_map
+
+    def update_fields(self, provider, job_id, fields, row_idx=None):
+        for i, sink in enumerate(self.sinks):
+            sink_row = row_idx if i == 0 else self._row_maps[i].get(job_id)
+            try:
+                sink.update_fields(provider, job_id, fields, row_idx=sink_row)
+            except Exception as e:
+                if i == 0:
+                    raise
+                print(f"[FanOutSink] update_fields failed on {sink.name}: {e}")
+
+
+SINK_TYPES = {
+    "sheets": SheetsSink,
+    "jsonl": JsonlSink,
+    "csv": CsvSink,
+    "sqlite": SqliteSink,
+}
+
+
+def build_sink(storage_cfg: dict | None = None) -> JobSink:
+    """
+    Build the configured sink(s) from the `storage:` config block:
+
+        storage:
+          sinks: ["sheets", "jsonl"]   # first one is primary (reads)
+          dir: ".jobpilot"             # local sinks' directory
+
+    JOBPILOT_SINKS (comma separated) overrides the list, e.g.
+    JOBPILOT_SINKS=jsonl for a dry run with no Google round trips.
+    """
+    storage_cfg = storage_cfg or {}
+    env_sinks = os.getenv("JOBPILOT_SINKS")
+    if env_sinks:
+        names = [n.strip() for n in env_sinks.split(",") if n.strip()]
+    else:
+        names = storage_cfg.get("sinks") or ["sheets"]
+
+    base_dir = storage_cfg.get("dir")
+    sinks: List[JobSink] = []
+    for name in names:
+        sink_cls = SINK_TYPES.get(name)
+        if sink_cls is None:
+            raise ValueError(f"Unknown storage sink: {name!r} (expected one of {sorted(SINK_TYPES)})")
+        sinks.append(sink_cls() if sink_cls is SheetsSink else sink_cls(base_dir=base_dir))
+
+    return sinks[0] if len(sinks) == 1 else FanOutSink(sinks)
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import json, math, os
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+
+# locator tuple -> constant name, filled by register_locators()
+_LOCATOR_NAMES: Dict[Tuple[str, str], str] = {}
+
+
+def register_locators(module) -> None:
+    """
+    Name every (By, selector) constant of a selectors module, so waits are
+    recorded under "EASY_APPLY_SUBMIT_BUTTON" rather than the raw selector.
+    """
+    for name, value in vars(module).items():
+        if name.isupper() and isinstance(value, tuple) and len(value) == 2 \
+                and all(isinstance(v, str) for v in value):
+            _LOCATOR_NAMES.setdefault(value, name)
+
+
+def locator_name(locator) -> str:
+    name = _LOCATOR_NAMES.get(tuple(locator))
+    if name is not None:
+        return name
+    by, selector = locator
+    return f"{by}={selector[:80]}"
+
+
+def percentile(values, q: float) -> float:
+    """Nearest-rank percentile (q in 0..100) of a non-empty sequence."""
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, math.ceil(q / 100.0 * len(ordered)) - 1))
+    return ordered[rank]
+
+
+class LatencyRecorder:
+    """
+    Observed latency of every named locator wait, kept on disk (JSON)
+    between runs, and the timeouts derived from it.
+
+    Per key: the last `window` successful wait times and a short history of
+    outcomes (timeouts included). timeout_for() is p99 x factor, clamped to
+    [min_timeout, max_timeout]; until min_samples waits were seen, or right
+    after a timeout, the caller's default/max is used instead.
+
+    A key is flagged as regressed when its recent p90 is well above the
+    baseline p90 (the older part of the window), or its recent timeout
+    rate is high.
+    """
+
+    def __init__(
+            self,
+            path: Optional[str] = None,
+            window: int = 200,
+            factor: float = 3.0,
+            min_timeout: float = 2.0,
+            max_timeout: float = 20.0,
+            min_samples: int = 20,
+            recent: int = 20,
+            regress_ratio: float = 2.0,
+            regress_min_delta: float = 0.5,
+    ) -> None:
+        self.path = path
+        self.window = int(window)
+        self.factor = float(factor)
+        self.min_timeout = float(min_timeout)
+        self.max_timeout = float(max_timeout)
+        self.min_samples = int(min_samples)
+        self.recent = int(recent)
+        self.regress_ratio = float(regress_ratio)
+        self.regress_min_delta = float(regress_min_delta)
+        self.samples: Dict[str, Deque[float]] = {}
+        self.outcomes: Dict[str, Deque[bool]] = {}     # True = found, False = timed out
+
+    @classmethod
+    def load(cls, path: str, **kwargs) -> "LatencyRecorder":
+        recorder = cls(path, **kwargs)
+        if os.path.exists(path):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                for key, entry in (data.get("keys") or {}).items():
+                    recorder.samples[key] = deque(entry.get("samples") or [], maxlen=recorder.window)
+                    recorder.outcomes[key] = deque(entry.get("outcomes") or [], maxlen=recorder.window)
+            except (OSError, ValueError, AttributeError) as e:
+                print(f"[Latency] Ignoring unreadable latency file {path}: {e}")
+        return recorder
+
+    def save(self) -> None:
+        if not self.path:
+            return
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        data = {"keys": {
+            key: {"samples": [round(s, 4) for s in self.samples.get(key, ())],
+                  "outcomes": list(self.outcomes.get(key, ()))}
+            for key in sorted(set(self.samples) | set(self.outcomes))
+        }}
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, self.path)
+
+    def record(self, key: str, seconds: float, ok: bool = True) -> None:
+        self.outcomes.setdefault(key, deque(maxlen=self.window)).append(bool(ok))
+        if ok:
+            self.samples.setdefault(key, deque(maxlen=self.window)).append(float(seconds))
+
+    def percentiles(self, key: str) -> Optional[Dict[str, float]]:
+        samples = self.samples.get(key)
+        if not samples:
+            return None
+        return {f"p{q}": round(percentile(samples, q), 3) for q in (50, 90, 99)}
+
+    def timeout_for(self, key: str, default: float) -> float:
+        """
+        Timeout for the next wait on `key`: p99 x factor, clamped.
+        """
+        outcomes = self.outcomes.get(key)
+        if outcomes and not outcomes[-1]:
+            # Timed out last time: don't tighten further until it recovers
+            return max(default, self.max_timeout)
+        samples = self.samples.get(key)
+        if not samples or len(samples) < self.min_samples:
+            return default
+        return min(self.max_timeout, max(self.min_timeout, percentile(samples, 99) * self.factor))
+
+    def regressions(self) -> List[Tuple[str, str]]:
+        """(key, reason) for every key whose recent waits got slower or flaky."""
+        flagged: List[Tuple[str, str]] = []
+        for key in sorted(set(self.samples) | set(self.outcomes)):
+            outcomes = list(self.outcomes.get(key, ()))[-self.recent:]
+            if len(outcomes) >= 5:
+                timeout_rate = outcomes.count(False) / len(outcomes)
+                if timeout_rate >= 0.2:
+                    flagged.append((key, f"{timeout_rate:.0%} of the last {len(outcomes)} waits timed out"))
+                    continue
+
+            samples = list(self.samples.get(key, ()))
+            if len(samples) < self.recent + self.min_samples:
+                continue
+            baseline = percentile(samples[:-self.recent], 90)
+            current = percentile(samples[-self.recent:], 90)
+            if current > baseline * self.regress_ratio and current - baseline > self.regress_min_delta:
+                flagged.append((key, f"p90 {baseline:.2f}s -> {current:.2f}s over the last {self.recent} waits"))
+        return flagged
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Percentiles per key, for the run log."""
+        return {key: self.percentiles(key) for key in sorted(self.samples) if self.samples[key]}
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import json, os, threading, time
+from collections import defaultdict
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Dict, Iterator, List, Tuple
+
+from jobpilot.utils.latency import percentile
+from jobpilot.utils.logger import get_logger
+
+Key = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+
+def _key(name: str, labels: dict) -> Key:
+    return name, tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def _label_text(labels: Tuple[Tuple[str, str], ...], extra: Tuple[Tuple[str, str], ...] = ()) -> str:
+    pairs = labels + extra
+    if not pairs:
+        return ""
+    escaped = (v.replace("\\", "\\\\").replace('"', '\\"').replace("\n", " ") for _, v in pairs)
+    return "{" + ",".join(f'{k}="{v}"' for (k, _), v in zip(pairs, escaped)) + "}"
+
+
+class Metrics:
+    """
+    Counters and timing histograms for one run (or one daemon tick).
+
+    inc("cards_scraped", 12, query="sdet @ Remote") counts;
+    with timer("description_fetch"): ... records seconds into a histogram
+    (failures too, plus a "<name>_errors" count). summary() is the JSON run
+    summary; write_prometheus() writes the node_exporter textfile format.
+    reset() starts the next run.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.started_at = datetime.now(timezone.utc)
+            self.counters: Dict[Key, float] = defaultdict(float)
+            self.histograms: Dict[Key, List[float]] = defaultdict(list)
+
+    def inc(self, name: str, value: float = 1, **labels) -> None:
+        with self._lock:
+            self.counters[_key(name, labels)] += value
+
+    def observe(self, name: str, seconds: float, **labels) -> None:
+        with self._lock:
+            self.histograms[_key(name, labels)].append(float(seconds))
+
+    @contextmanager
+    def timer(self, name: str, **labels) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        except BaseException:
+            self.inc(f"{name}_errors", **labels)
+            raise
+        finally:
+            self.observe(name, time.perf_counter() - started, **labels)
+
+    def total_s(self, name: str) -> float:
+        """Seconds recorded under `name`, all labels together."""
+        return sum(sum(v) for (n, _), v in self.histograms.items() if n == name)
+
+    def summary(self) -> dict:
+        def flat(key: Key) -> str:
+            return key[0] + _label_text(key[1])
+
+        with self._lock:
+            histograms = {
+                flat(key): {
+                    "n": len(values),
+                    "sum_s": round(sum(values), 3),
+                    "mean_s": round(sum(values) / len(values), 3),
+                    "p50_s": round(percentile(values, 50), 3),
+                    "p90_s": round(percentile(values, 90), 3),
+                    "max_s": round(max(values), 3),
+                }
+                for key, values in sorted(self.histograms.items()) if values
+            }
+            return {
+                "started_at": self.started_at.isoformat(),
+                "duration_s": round((datetime.now(timezone.utc) - self.started_at).total_seconds(), 1),
+                "counters": {flat(key): value for key, value in sorted(self.counters.items())},
+                "timings": histograms,
+            }
+
+    def prometheus_text(self, prefix: str = "jobpilot") -> str:
+        lines: List[str] = []
+        with self._lock:
+            counters = sorted(self.counters.items())
+            histograms = sorted((k, list(v)) for k, v in self.histograms.items() if v)
+
+        typed = set()
+        for (name, labels), value in counters:
+            metric = f"{prefix}_{name}_total"
+            if metric not in typed:
+                lines.append(f"# TYPE {metric} counter")
+                typed.add(metric)
+            lines.append(f"{metric}{_label_text(labels)} {value:g}")
+        for (name, labels), values in histograms:
+            metric = f"{prefix}_{name}_seconds"
+            if metric not in typed:
+                lines.append(f"# TYPE {metric} summary")
+                typed.add(metric)
+            for q in (0.5, 0.9, 0.99):
+                quantile = percentile(values, q * 100)
+                lines.append(f"{metric}{_label_text(labels, (('quantile', str(q)),))} {quantile:.6f}")
+            lines.append(f"{metric}_sum{_label_text(labels)} {sum(values):.6f}")
+            lines.append(f"{metric}_count{_label_text(labels)} {len(values)}")
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _atomic_write(path: str, text: str) -> None:
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+
+    def write_json(self, path: str) -> None:
+        self._atomic_write(path, json.dumps(self.summary(), indent=2))
+
+    def write_prometheus(self, path: str) -> None:
+        # Atomic, so the textfile collector never reads a half-written file
+        self._atomic_write(path, self.prometheus_text())
+
+    def log_summary(self, logger=None) -> None:
+        """One line per timing (slowest total first) through the jobpilot logger."""
+        logger = logger or get_logger("jobpilot.metrics")
+        summary = self.summary()
+        logger.info("Run took %.1fs; counters: %s", summary["duration_s"], summary["counters"])
+        for name, stats in sorted(summary["timings"].items(), key=lambda kv: -kv[1]["sum_s"]):
+            logger.info(
+                "%-40s n=%-4d total=%7.2fs mean=%6.3fs p90=%6.3fs max=%6.3fs",
+                name, stats["n"], stats["sum_s"], stats["mean_s"], stats["p90_s"], stats["max_s"],
+            )
+
+
+# Process-wide registry the pipeline stages record into
+metrics = Metrics()
@@ -0,0 +1,14 @@
+import os
+
+DEFAULT_DATA_DIR = ".jobpilot"
+
+def data_dir(*parts: str) -> str:
+    """
+    Local state directory (local sinks, caches, indexes).
+
+    Defaults to ./.jobpilot and can be moved with JOBPILOT_DATA_DIR.
+    The base directory is created on first use; `parts` are joined onto it.
+    """
+    base = os.getenv("JOBPILOT_DATA_DIR", DEFAULT_DATA_DIR)
+    os.makedirs(base, exist_ok=True)
+    return os.path.join(base, *parts)
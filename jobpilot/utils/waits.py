@@ -1,5 +1,292 @@
+from __future__ import annotations
+
+import os, time
+
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
+# Locator strategies the in-page script can resolve; others use WebDriverWait
+_JS_STRATEGIES = {
+    By.CSS_SELECTOR: "css",
+    By.XPATH: "xpath",
+    By.ID: "id",
+    By.NAME: "name",
+    By.CLASS_NAME: "class",
+    By.TAG_NAME: "tag",
+}
+
+# Shared by the element scripts below: find() resolves one locator (null on
+# a bad selector), matches() applies the present/visible/clickable state.
+_DOM_JS = r"""
+function find(kind, selector) {
+  try {
+    switch (kind) {
+      case "css": return document.querySelector(selector);
+      case "xpath": return document.evaluate(selector, document, null,
+          XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+      case "id": return document.getElementById(selector);
+      case "name": return document.getElementsByName(selector)[0] || null;
+      case "class": return document.getElementsByClassName(selector)[0] || null;
+      case "tag": return document.getElementsByTagName(selector)[0] || null;
+    }
+  } catch (e) {}
+  return null;
+}
+function visible(el) {
+  if (!el.isConnected) return false;
+  const style = window.getComputedStyle(el);
+  if (style.visibility === "hidden" || style.display === "none" || style.opacity === "0") return false;
+  return el.getClientRects().length > 0;
+}
+function matches(el, state) {
+  if (state === "present") return true;
+  if (!visible(el)) return false;
+  return state !== "clickable" || !(el.disabled || el.getAttribute("aria-disabled") === "true");
+}
+"""
+
+# Checks ready() once, then re-checks on every DOM mutation (plus a slow
+# timer for layout-only changes) and calls done() with its first non-null
+# result, or null after timeoutMs.
+_WATCH_JS = r"""
+let finished = false, observer = null, timer = null, poll = null;
+function finish(value) {
+  if (finished) return;
+  finished = true;
+  if (observer) observer.disconnect();
+  clearTimeout(timer);
+  clearInterval(poll);
+  done(value);
+}
+const now = ready();
+if (now) { finish(now); return; }
+observer = new MutationObserver(() => { const hit = ready(); if (hit) finish(hit); });
+observer.observe(document.documentElement || document, {
+  childList: true, subtree: true, attributes: true, characterData: true,
+});
+poll = setInterval(() => { const hit = ready(); if (hit) finish(hit); }, 100);
+timer = setTimeout(() => finish(null), timeoutMs);
+"""
+
+# arguments: kind, selector, state, timeout_ms, done callback. Calls back
+# with the element, or null on timeout.
+_ELEMENT_WAIT_JS = _DOM_JS + r"""
+const [kind, selector, state, timeoutMs, done] = arguments;
+function ready() {
+  const el = find(kind, selector);
+  return el && matches(el, state) ? el : null;
+}
+""" + _WATCH_JS
+
+# arguments: fragment, timeout_ms, done. SPA route changes (pushState,
+# popstate, hashchange); a full navigation unloads the script instead.
+_URL_WAIT_JS = r"""
+const [fragment, timeoutMs, done] = arguments;
+let finished = false, poll = null, timer = null;
+function check() {
+  if (!finished && window.location.href.includes(fragment)) finish(true);
+}
+function finish(value) {
+  finished = true;
+  clearInterval(poll);
+  clearTimeout(timer);
+  window.removeEventListener("popstate", check);
+  window.removeEventListener("hashchange", check);
+  done(value);
+}
+check();
+if (finished) return;
+window.addEventListener("popstate", check);
+window.addEventListener("hashchange", check);
+poll = setInterval(check, 25);
+timer = setTimeout(() => finish(false), timeoutMs);
+"""
+
+# arguments: checks ([kind, selector, state] each), timeout_ms, done. Like
+# _ELEMENT_WAIT_JS for several alternatives at once: calls back with
+# [index, element] of the first check that is ready, or null on timeout.
+_ANY_WAIT_JS = _DOM_JS + r"""
+const [checks, timeoutMs, done] = arguments;
+function ready() {
+  for (let i = 0; i < checks.length; i++) {
+    const [kind, selector, state] = checks[i];
+    const el = find(kind, selector);
+    if (el && matches(el, state)) return [i, el];
+  }
+  return null;
+}
+""" + _WATCH_JS
+
+# arguments: checks ([kind, selector, state] each). One synchronous pass:
+# true/false per check, so several page states are told apart in a single
+# round trip.
+_PROBE_JS = _DOM_JS + r"""
+const [checks] = arguments;
+return checks.map(([kind, selector, state]) => {
+  const el = find(kind, selector);
+  return !!el && matches(el, state);
+});
+"""
+
+_EC_FOR_STATE = {
+    "present": EC.presence_of_element_located,
+    "visible": EC.visibility_of_element_located,
+    "clickable": EC.element_to_be_clickable,
+}
+
+
+def event_waits_enabled(driver) -> bool:
+    """
+    Whether pages on this driver use the event-driven waits: the driver's
+    `jobpilot_event_waits` flag (build_driver(event_waits=...)), else the
+    JOBPILOT_EVENT_WAITS env var.
+    """
+    flag = getattr(driver, "jobpilot_event_waits", None)
+    if flag is None:
+        return os.getenv("JOBPILOT_EVENT_WAITS", "").strip().lower() in ("1", "true", "yes")
+    return bool(flag)
+
+
+def _ensure_script_timeout(driver, timeout: float) -> None:
+    """
+    The async script must be allowed to outlive our own timeout; raise the
+    driver's script timeout only when needed (it's one more round trip).
+    """
+    current = getattr(driver, "_jobpilot_script_timeout", None)
+    if current is None or current < timeout + 1:
+        driver.set_script_timeout(timeout + 1)
+        driver._jobpilot_script_timeout = timeout + 1
+
+
+def wait_for(driver, locator, state: str = "visible", timeout: float = 20):
+    """
+    Element for `locator` once it is present / visible / clickable.
+
+    One execute_async_script call: the page resolves it the moment a DOM
+    mutation makes the element ready, instead of WebDriverWait's 0.5s
+    polling (a round trip per poll). If the page navigates away mid-wait
+    (the script is unloaded) or the strategy isn't supported in-page, the
+    rest of the timeout falls back to WebDriverWait. Raises TimeoutException.
+    """
+    if state not in _EC_FOR_STATE:
+        raise ValueError(f"Unknown wait state: {state!r} (expected present, visible or clickable)")
+
+    by, selector = locator
+    deadline = time.monotonic() + timeout
+    kind = _JS_STRATEGIES.get(by)
+    if kind is not None:
+        try:
+            _ensure_script_timeout(driver, timeout)
+            element = driver.execute_async_script(
+                _ELEMENT_WAIT_JS, kind, selector, state, int(timeout * 1000)
+            )
+            if element is not None:
+                return element
+            raise TimeoutException(f"{state} wait timed out after {timeout}s: {locator}")
+        except TimeoutException:
+            raise
+        except WebDriverException:
+            # Navigation or script error: finish with the polling wait
+            pass
+
+    remaining = max(0.0, deadline - time.monotonic())
+    return WebDriverWait(driver, remaining).until(_EC_FOR_STATE[state](locator))
+
+
+def _poll_any(driver, waits, timeout: float):
+    """WebDriverWait over all alternatives on each 0.2s poll."""
+    conditions = [_EC_FOR_STATE[state](locator) for locator, state in waits]
+
+    def first_ready(driver):
+        for i, condition in enumerate(conditions):
+            try:
+                element = condition(driver)
+            except WebDriverException:
+                continue
+            if element:
+                return i, element
+        return False
+
+    return WebDriverWait(driver, timeout, poll_frequency=0.2).until(first_ready)
+
+
+def wait_any(driver, waits, timeout: float = 20, event_driven: bool = True):
+    """
+    (index, element) for whichever (locator, state) in `waits` is ready
+    first. Event-driven: one execute_async_script call that re-checks all
+    alternatives on each DOM mutation; the polling wait covers strategies
+    the page can't resolve, navigations mid-wait, and event_driven=False.
+    Raises TimeoutException.
+    """
+    waits = list(waits)
+    for _, state in waits:
+        if state not in _EC_FOR_STATE:
+            raise ValueError(f"Unknown wait state: {state!r} (expected present, visible or clickable)")
+
+    deadline = time.monotonic() + timeout
+    kinds = [_JS_STRATEGIES.get(locator[0]) for locator, _ in waits]
+    if event_driven and None not in kinds:
+        checks = [[kind, locator[1], state] for kind, (locator, state) in zip(kinds, waits)]
+        try:
+            _ensure_script_timeout(driver, timeout)
+            hit = driver.execute_async_script(_ANY_WAIT_JS, checks, int(timeout * 1000))
+            if hit:
+                return int(hit[0]), hit[1]
+            raise TimeoutException(f"None of {len(waits)} alternatives ready after {timeout}s: {waits}")
+        except TimeoutException:
+            raise
+        except WebDriverException:
+            pass
+
+    remaining = max(0.0, deadline - time.monotonic())
+    return _poll_any(driver, waits, remaining)
+
+
+def probe(driver, checks) -> list:
+    """
+    [True/False] for each (locator, state) in `checks`, evaluated together
+    in one execute_script call. Locator strategies the page can't resolve
+    (link text etc.) are checked one by one with the expected conditions.
+    """
+    checks = list(checks)
+    in_page = [(i, _JS_STRATEGIES.get(loc[0]), loc[1], state) for i, (loc, state) in enumerate(checks)]
+    results = [False] * len(checks)
+    scripted = [c for c in in_page if c[1] is not None]
+    if scripted:
+        flags = driver.execute_script(_PROBE_JS, [[kind, sel, state] for _, kind, sel, state in scripted])
+        for (i, *_), flag in zip(scripted, flags or []):
+            results[i] = bool(flag)
+    for i, kind, _, state in in_page:
+        if kind is None:
+            try:
+                results[i] = bool(_EC_FOR_STATE[state](checks[i][0])(driver))
+            except WebDriverException:
+                results[i] = False
+    return results
+
+
+def wait_url_contains(driver, fragment: str, timeout: float = 20) -> bool:
+    """
+    Event-driven EC.url_contains: True once the URL contains `fragment`,
+    TimeoutException otherwise. Full page loads fall back to WebDriverWait.
+    """
+    deadline = time.monotonic() + timeout
+    try:
+        _ensure_script_timeout(driver, timeout)
+        if driver.execute_async_script(_URL_WAIT_JS, fragment, int(timeout * 1000)):
+            return True
+        raise TimeoutException(f"URL did not contain {fragment!r} after {timeout}s")
+    except TimeoutException:
+        raise
+    except WebDriverException:
+        pass
+    remaining = max(0.0, deadline - time.monotonic())
+    return WebDriverWait(driver, remaining).until(EC.url_contains(fragment))
+
+
 def wait_visible(driver, locator, timeout=20):
+    if event_waits_enabled(driver):
+        return wait_for(driver, locator, "visible", timeout)
     return WebDriverWait(driver, timeout).until(EC.visibility_of_element_located(locator))
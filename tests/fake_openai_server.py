@@ -0,0 +1,126 @@
+"""
+Minimal OpenAI-compatible chat completions server for tests and local runs.
+
+    python tests/fake_openai_server.py --port 8099 --latency 0.5
+    OPENAI_BASE_URL=http://127.0.0.1:8099/v1 OPENAI_API_KEY=fake ...
+"""
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+def default_responder(body: dict) -> str:
+    return json.dumps({"match_percent": 75.0, "recommended": True, "reasons": "fake model"})
+
+
+class FakeOpenAIServer:
+    """
+    Serves POST /v1/chat/completions on a background thread.
+
+    - latency: seconds to sleep before answering each request
+    - rate_limit_first: answer the first N requests with HTTP 429
+    - responder(request_json) -> assistant message content
+    Tracks request count and peak concurrency for assertions.
+    """
+
+    def __init__(self, latency: float = 0.0, rate_limit_first: int = 0, responder=None, port: int = 0) -> None:
+        self.latency = latency
+        self.rate_limit_first = rate_limit_first
+        self.responder = responder or default_responder
+        self.requests = 0
+        self.rate_limited = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.bodies: list[dict] = []
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", port), self._handler_class())
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def start(self) -> "FakeOpenAIServer":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):  # keep pytest output clean
+                pass
+
+            def _send(self, status: int, payload: dict) -> None:
+                data = json.dumps(payload).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                body = json.loads(self.rfile.read(length) or b"{}")
+
+                with server._lock:
+                    server.requests += 1
+                    server.bodies.append(body)
+                    limited = server.rate_limited < server.rate_limit_first
+                    if limited:
+                        server.rate_limited += 1
+                    server.in_flight += 1
+                    server.max_in_flight = max(server.max_in_flight, server.in_flight)
+                try:
+                    time.sleep(server.latency)
+                    if limited:
+                        self._send(429, {"error": {"message": "Rate limit reached", "type": "rate_limit_error"}})
+                        return
+                    content = server.responder(body)
+                    self._send(200, {
+                        "id": f"chatcmpl-{server.requests}",
+                        "object": "chat.completion",
+                        "created": int(time.time()),
+                        "model": body.get("model", "fake"),
+                        "choices": [{
+                            "index": 0,
+                            "message": {"role": "assistant", "content": content},
+                            "finish_reason": "stop",
+                        }],
+                        "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0},
+                    })
+                finally:
+                    with server._lock:
+                        server.in_flight -= 1
+
+        return Handler
+
+
+if __name__ == "__main__":
+    p = argparse.ArgumentParser()
+    p.add_argument("--port", type=int, default=8099)
+    p.add_argument("--latency", type=float, default=0.5)
+    p.add_argument("--rate-limit-first", type=int, default=0)
+    args = p.parse_args()
+
+    srv = FakeOpenAIServer(latency=args.latency, rate_limit_first=args.rate_limit_first, port=args.port)
+    print(f"Fake OpenAI server on {srv.base_url} (latency={args.latency}s)")
+    srv.start()
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        srv.stop()
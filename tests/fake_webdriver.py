@@ -0,0 +1,41 @@
+"""
+A WebDriver stand-in for tests: like Selenium, every driver and element
+call goes through driver.execute().
+"""
+
+
+class FakeElement:
+    def __init__(self, parent):
+        self.parent = parent
+
+    @property
+    def text(self):
+        return self.parent.execute("getElementText", {"id": "e1"})
+
+    def get_attribute(self, name):
+        return self.parent.execute_script("/* getAttribute */return (function(){}).apply(null, arguments);", self, name)
+
+
+class FakeDriver:
+    def __init__(self):
+        self.sent = []
+
+    def execute(self, command, params=None):
+        self.sent.append(command)
+        if command == "findElements":
+            return [FakeElement(self), FakeElement(self)]
+        if command == "findElement":
+            return FakeElement(self)
+        return "value"
+
+    def find_element(self, by, value):
+        return self.execute("findElement", {"using": by, "value": value})
+
+    def find_elements(self, by, value):
+        return self.execute("findElements", {"using": by, "value": value})
+
+    def execute_script(self, script, *args):
+        return self.execute("executeScript", {"script": script, "args": list(args)})
+
+    def get(self, url):
+        self.execute("get", {"url": url})
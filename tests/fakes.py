@@ -0,0 +1,79 @@
+"""
+Shared test helpers: a JobPosting factory and a provider that fakes the
+Easy Apply steps (imported like fake_webdriver / fake_openai_server).
+"""
+
+from jobpilot.models.job import ApplyResult, JobPosting
+
+
+def make_job(job_id: str, **fields) -> JobPosting:
+    """A dice posting with test defaults; keyword arguments override fields."""
+    values = dict(
+        id=job_id, title="SDET", company="Acme", location="", url=f"https://x/{job_id}",
+        provider="dice", easy_apply=True, metadata={},
+    )
+    values.update(fields)
+    return JobPosting(**values)
+
+
+class FakeSession:
+    def __init__(self, job):
+        self.job = job
+        self.prechecked = False
+
+
+class FakeApplyProvider:
+    """
+    The provider's Easy Apply steps, recorded in `calls` as (step, job id, ...).
+    Jobs in `applied` show "Applied" on the precheck; `broken` maps a job id
+    to the step that raises for it ("open", "step1", "step2", "submit").
+    """
+
+    def __init__(self, applied=(), broken=None):
+        self.applied = set(applied)
+        self.broken = dict(broken or {})
+        self.calls = []
+        self.open_tabs = 0
+        self.max_open = 0
+
+    def _step(self, step, job, *extra):
+        self.calls.append((step, job.id) + extra)
+        if self.broken.get(job.id) == step:
+            raise RuntimeError(f"{step} failed")
+
+    def open_apply_tab(self, job):
+        self._step("open", job)
+        self.open_tabs += 1
+        self.max_open = max(self.max_open, self.open_tabs)
+        return FakeSession(job)
+
+    def precheck_apply(self, session):
+        if not session.prechecked:
+            self.calls.append(("precheck", session.job.id))
+            session.prechecked = True
+        if session.job.id in self.applied:
+            return ApplyResult(status="SKIPPED", app_id=None, notes="Job already applied on Dice.")
+        return None
+
+    def open_step1(self, session):
+        self._step("step1", session.job)
+
+    def open_step2(self, session, resume_path=None):
+        self._step("step2", session.job, resume_path)
+
+    def click_submit(self, session):
+        self._step("submit", session.job)
+        self.applied.add(session.job.id)
+
+    def submit_apply(self, session, resume_path=None):
+        self.open_step1(session)
+        self.open_step2(session, resume_path)
+        self.click_submit(session)
+
+    def confirm_apply(self, session):
+        self.calls.append(("confirm", session.job.id))
+        return ApplyResult(status="APPLIED", app_id=None, notes="Applied via Easy Apply.")
+
+    def close_apply_tab(self, session):
+        self.open_tabs -= 1
+        self.calls.append(("close", session.job.id))
@@ -0,0 +1,60 @@
+from fakes import FakeApplyProvider, make_job
+
+from jobpilot.orchestrator.apply_pipeline import ApplyPipeline
+
+
+def test_next_job_is_prechecked_before_current_confirms():
+    provider = FakeApplyProvider(applied={"b"}, broken={"c": "submit"})
+    pipeline = ApplyPipeline(provider, depth=2)
+    seen = []
+    results = pipeline.run(
+        [make_job("a"), make_job("b"), make_job("c"), make_job("d")],
+        resume_for=lambda j: f"/r/{j.id}.pdf",
+        on_result=lambda j, r: seen.append((j.id, r.status)),
+    )
+
+    assert seen == [("a", "APPLIED"), ("b", "SKIPPED"), ("c", "ERROR"), ("d", "APPLIED")]
+    assert [r for _, r in results][2].notes == "Exception during Easy apply: submit failed"
+    calls = provider.calls
+    # b's page was loading and got checked while a was waiting on confirmation
+    assert calls.index(("open", "b")) < calls.index(("step2", "a", "/r/a.pdf"))
+    assert calls.index(("submit", "a")) < calls.index(("precheck", "b")) < calls.index(("confirm", "a"))
+    assert provider.max_open == 2 and provider.open_tabs == 0
+    summary = pipeline.summary()
+    assert summary["total"]["n"] == 4 and summary["confirm"]["n"] == 2
+
+
+def test_depth_one_is_sequential_and_skip_hook_wins():
+    provider = FakeApplyProvider(applied={"b"}, broken={"c": "submit"})
+    pipeline = ApplyPipeline(provider, depth=1)
+    steps = []
+    seen = pipeline.run(
+        [make_job("a"), make_job("d")],
+        before_apply=lambda j: "dup" if j.id == "d" else None,
+        on_step=lambda j, step: steps.append((j.id, step)),
+    )
+
+    assert [(j.id, r.status, r.notes) for j, r in seen][1] == ("d", "SKIPPED", "dup")
+    assert provider.max_open == 1
+    assert provider.calls == [
+        ("open", "a"), ("precheck", "a"), ("step1", "a"), ("step2", "a", None), ("submit", "a"),
+        ("confirm", "a"), ("close", "a"),
+        ("open", "d"), ("close", "d"),
+    ]
+    assert steps == [("a", "open"), ("a", "step1"), ("a", "step2"), ("a", "submit"), ("d", "open")]
+
+
+def test_stop_leaves_the_rest_unapplied_and_closes_tabs_opened_ahead():
+    provider = FakeApplyProvider(applied={"b"}, broken={"c": "submit"})
+    pipeline = ApplyPipeline(provider, depth=2)
+    turns = []
+
+    def stop():
+        turns.append(len(turns))
+        return "budget reached" if len(turns) > 1 else None
+
+    results = pipeline.run([make_job("a"), make_job("d"), make_job("e")], stop=stop)
+
+    assert [(j.id, r.status) for j, r in results] == [("a", "APPLIED")]
+    assert provider.open_tabs == 0
+    assert not any(c[0] == "submit" and c[1] != "a" for c in provider.calls)
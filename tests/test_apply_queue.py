@@ -0,0 +1,86 @@
+import pytest
+
+from fakes import FakeApplyProvider, make_job
+
+from jobpilot.models.job import ApplyResult
+from jobpilot.orchestrator.apply_queue import (
+    ApplyQueue, InvalidTransition, applied_value, drain,
+    QUEUED, OPENED, STEP1, STEP2, SUBMITTED, CONFIRMED, FAILED, SKIPPED,
+)
+
+
+def test_enqueue_is_idempotent_and_transitions_are_checked(tmp_path):
+    queue = ApplyQueue(str(tmp_path / "q.sqlite3"))
+    assert queue.enqueue(make_job("a"), resume_path="/r/a.pdf", row_idx=5)
+    assert not queue.enqueue(make_job("a"))
+    key = ApplyQueue.key(make_job("a"))
+
+    queue.transition(key, OPENED)
+    with pytest.raises(InvalidTransition):
+        queue.transition(key, SUBMITTED)
+    queue.transition(key, STEP1)
+    queue.transition(key, STEP2)
+    assert queue.state(key) == STEP2
+
+    assert key not in [i.key for i in queue.pending()]   # not offered while in flight
+
+
+def test_drain_walks_states_and_skips_applied_jobs(tmp_path):
+    queue = ApplyQueue(str(tmp_path / "q.sqlite3"))
+    for i in ("a", "b"):
+        queue.enqueue(make_job(i), resume_path=f"/r/{i}.pdf")
+    provider = FakeApplyProvider(applied={"b"}, broken={"c": "step2"})
+    seen = []
+
+    counts = drain(queue, provider, on_result=lambda item, r: seen.append((item.job.id, applied_value(r))))
+
+    assert counts == {CONFIRMED: 2}
+    assert seen == [("a", "Yes"), ("b", "Yes")]
+    assert queue.history("dice:a") == [QUEUED, OPENED, STEP1, STEP2, SUBMITTED, CONFIRMED]
+    assert queue.history("dice:b") == [QUEUED, OPENED, CONFIRMED]
+    assert ("step2", "a", "/r/a.pdf") in provider.calls
+    assert ("close", "b") in provider.calls
+
+
+def test_failures_retry_until_max_attempts(tmp_path):
+    queue = ApplyQueue(str(tmp_path / "q.sqlite3"), max_attempts=2)
+    queue.enqueue(make_job("c"))
+    provider = FakeApplyProvider(broken={"c": "step2"})
+
+    drain(queue, provider)
+    assert queue.state("dice:c") == QUEUED
+    drain(queue, provider)
+    assert queue.state("dice:c") == FAILED
+    assert drain(queue, provider) == {FAILED: 1}   # nothing left to try
+    assert [c for c in provider.calls if c[0] == "close"] == [("close", "c")] * 2
+
+
+def test_recover_requeues_interrupted_work_without_double_applying(tmp_path):
+    path = str(tmp_path / "q.sqlite3")
+    queue = ApplyQueue(path, lease_s=0)
+    queue.enqueue(make_job("a"))
+    for state in (OPENED, STEP1, STEP2, SUBMITTED):
+        queue.transition("dice:a", state)
+    queue.close()
+
+    # Crashed after submitting: the restarted worker finds the job applied
+    queue = ApplyQueue(path)
+    assert queue.recover() == 1
+    assert queue.state("dice:a") == QUEUED
+    provider = FakeApplyProvider(applied={"a"})
+    assert drain(queue, provider) == {CONFIRMED: 1}
+    assert not any(c[0] == "submit" for c in provider.calls)
+
+
+def test_pipeline_results_settle_queue_entries(tmp_path):
+    queue = ApplyQueue(str(tmp_path / "q.sqlite3"))
+    for i in ("a", "b", "c"):
+        queue.enqueue(make_job(i))
+    queue.record_result("dice:a", ApplyResult(status="APPLIED", app_id=None, notes="ok"))
+    unconfirmed = ApplyResult(status="ERROR", app_id=None, notes="Submitted, but confirmation was not detected.")
+    queue.record_result("dice:b", unconfirmed)
+    queue.record_result("dice:c", ApplyResult(status="SKIPPED", app_id=None, notes="No Easy Apply button"))
+
+    assert queue.counts() == {CONFIRMED: 1, QUEUED: 1, SKIPPED: 1}
+    assert applied_value(unconfirmed) == ""
+    assert [i.key for i in queue.pending()] == ["dice:b"]
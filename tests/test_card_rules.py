@@ -0,0 +1,38 @@
+from jobpilot.models.job import JobPosting
+from jobpilot.services.rules import CardRules
+
+
+def card(title: str, company: str = "Acme", easy_apply: bool = True) -> JobPosting:
+    return JobPosting(id=title, title=title, company=company, location="", url="u",
+                      provider="dice", easy_apply=easy_apply, metadata={})
+
+
+def test_rules_reject_in_one_pass():
+    rules = CardRules.from_config({
+        "title_include": ["sdet", r"\bqa\b", "test"],
+        "title_exclude": [r"\b(principal|director)\b", r"\bintern\b"],
+        "company_block": ["CyberCoders", "jobot( inc)?"],
+        "easy_apply_only": True,
+    })
+    cards = [
+        card("Senior SDET"),
+        card("Principal QA Engineer"),
+        card("Frontend Developer"),
+        card("QA Analyst", company="JOBOT Inc"),
+        card("QA Analyst", company="Jobot Staffing Partners"),
+        card("Test Engineer", easy_apply=False),
+    ]
+    kept, rejected = rules.split(cards)
+
+    assert [j.title for j in kept] == ["Senior SDET", "QA Analyst"]
+    assert kept[1].company == "Jobot Staffing Partners"   # block list matches whole names only
+    assert CardRules.summarize(rejected) == {
+        "title_exclude": 1, "title_include": 1, "company_block": 1, "easy_apply_only": 1,
+    }
+    assert rejected[0][2] == "title matches excluded 'Principal'"
+
+
+def test_no_rules_means_no_filter_stage():
+    assert CardRules.from_config(None) is None
+    assert CardRules.from_config({"enabled": True, "title_include": [], "company_block": []}) is None
+    assert CardRules.from_config({"enabled": False, "title_exclude": ["x"]}) is None
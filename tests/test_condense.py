@@ -0,0 +1,82 @@
+from jobpilot.services.condense import BoilerplateLibrary, Condenser
+from jobpilot.services.matcher import JobMatcher
+from jobpilot.models.job import JobPosting
+
+# Dice flattens descriptions to one line, so no paragraph breaks here
+FLAT = (
+    "We are a leading global provider of fintech software. Our team moves fast. "
+    "Responsibilities: Build test automation in Python. Own the CI pipelines. "
+    "Requirements: 5+ years of Selenium WebDriver. Strong Python and pytest. Strong Python and pytest. "
+    "Benefits: Medical, dental, 401(k). Unlimited PTO and a gym stipend. "
+    "Equal Opportunity Employer: We consider all applicants without regard to race, color, religion, sex."
+)
+
+
+def library() -> BoilerplateLibrary:
+    return BoilerplateLibrary.load("configs/boilerplate.yaml")
+
+
+def test_flat_text_is_split_at_inline_headings():
+    sections = library().split_sections(FLAT)
+    assert [(s.heading, s.kind) for s in sections] == [
+        ("", "intro"),
+        ("Responsibilities", "priority"),
+        ("Requirements", "priority"),
+        ("Benefits", "drop"),
+        ("Equal Opportunity Employer", "drop"),
+    ]
+    assert sections[2].sentences[0] == "5+ years of Selenium WebDriver."
+
+
+def test_boilerplate_and_duplicates_are_dropped():
+    result = Condenser(library(), token_budget=1000).condense(FLAT)
+
+    assert "Strong Python and pytest." in result.text
+    assert result.text.count("Strong Python and pytest.") == 1
+    assert "401(k)" not in result.text and "race, color" not in result.text
+    assert "leading global provider" not in result.text
+    assert result.duplicates_dropped == 1
+    assert result.tokens_after < result.tokens_before
+
+
+def test_tight_budget_keeps_requirements_over_intro():
+    result = Condenser(library(), token_budget=30).condense(FLAT)
+
+    assert "Selenium WebDriver" in result.text
+    assert "Our team moves fast" not in result.text
+    assert result.budget_dropped > 0
+    # Output stays in document order
+    assert result.text.index("Responsibilities") < result.text.index("Requirements")
+
+
+def test_multiline_headings_and_stats():
+    text = "About us\nWe make widgets.\n\nQualifications\nKubernetes and Go.\n"
+    condenser = Condenser(library(), token_budget=1000)
+    result = condenser.condense(text)
+
+    assert result.text == "Qualifications: Kubernetes and Go."
+    assert condenser.stats["docs"] == 1
+    assert condenser.stats["tokens_before"] == result.tokens_before
+
+
+def test_matcher_prompt_uses_condensed_text():
+    job = JobPosting(id="1", title="SDET", company="Acme", location="", url="u",
+                     provider="dice", easy_apply=True, metadata={})
+    matcher = JobMatcher("python selenium", use_llm=False, condenser=Condenser(library()))
+    prompt = matcher._build_llm_messages(job, FLAT)[1]["content"]
+
+    assert "Selenium WebDriver" in prompt and "401(k)" not in prompt
+    # Condensing rules are part of the cache key
+    plain = JobMatcher("python selenium", use_llm=False)
+    assert matcher._llm_cache_key(FLAT) != plain._llm_cache_key(FLAT)
+
+
+def test_benefit_phrases_do_not_drop_domain_requirements():
+    text = (
+        "Requirements: Experience testing dental practice management software. "
+        "Full dental insurance from day one."
+    )
+    result = Condenser(library(), token_budget=1000).condense(text)
+
+    assert "dental practice management" in result.text
+    assert "dental insurance" not in result.text
@@ -0,0 +1,87 @@
+import random
+from datetime import datetime
+
+import pytest
+
+from jobpilot.orchestrator.daemon import JobPilotDaemon, parse_quiet_hours, quiet_seconds_left
+
+
+class FakeRunner:
+    def __init__(self, daemon_cfg, fail_ticks=()):
+        self.cfg = {"daemon": daemon_cfg, "dice": {"max_results": 50, "date_posted": "last_7_days"}}
+        self.calls = []
+        self.fail_ticks = set(fail_ticks)
+        self.connects = 0
+        self.closes = 0
+        self.on_cycle = None
+
+    def connect(self):
+        self.connects += 1
+        provider = object()
+
+        def close():
+            self.closes += 1
+        return provider, close
+
+    def run_cycle(self, provider, max_results, date_posted=None, stop=None):
+        self.calls.append((provider, max_results, date_posted))
+        if self.on_cycle is not None:
+            self.on_cycle(stop)
+        if len(self.calls) in self.fail_ticks:
+            raise RuntimeError("browser went away")
+        return []
+
+
+def daemon_for(runner, now=datetime(2026, 3, 2, 12, 0)):
+    daemon = JobPilotDaemon(runner, rng=random.Random(1), clock=lambda: now)
+    daemon.install_signal_handlers = lambda: None
+    return daemon
+
+
+def test_ticks_reuse_the_driver_and_narrow_to_the_newest_window():
+    runner = FakeRunner({"interval_min": 0, "incremental_date_posted": "today"})
+    assert daemon_for(runner).run(max_ticks=3) == 3
+
+    assert [c[2] for c in runner.calls] == ["last_7_days", "today", "today"]
+    assert len({id(c[0]) for c in runner.calls}) == 1 and runner.calls[0][1] == 50
+    assert (runner.connects, runner.closes) == (1, 1)
+
+
+def test_failed_tick_reconnects_and_keeps_the_full_sweep_pending():
+    runner = FakeRunner({"interval_min": 0}, fail_ticks={1})
+    daemon_for(runner).run(max_ticks=3)
+    assert [c[2] for c in runner.calls] == ["last_7_days", "last_7_days", "today"]
+    assert (runner.connects, runner.closes) == (2, 2)
+
+
+def test_stop_request_finishes_the_tick_in_flight():
+    runner = FakeRunner({"interval_min": 0})
+    daemon = daemon_for(runner)
+    seen = []
+
+    def on_cycle(stop):
+        seen.append(stop())
+        daemon.request_stop("received SIGTERM")
+        seen.append(stop())
+    runner.on_cycle = on_cycle
+
+    assert daemon.run() == 1
+    assert seen == [None, "received SIGTERM"]
+    assert runner.closes == 1
+
+
+def test_jitter_stays_within_bounds():
+    daemon = daemon_for(FakeRunner({"interval_min": 10, "jitter_pct": 20}))
+    delays = [daemon.next_delay() for _ in range(200)]
+    assert 480 <= min(delays) < 520 and 680 < max(delays) <= 720
+
+
+@pytest.mark.parametrize("now, left_min", [
+    (datetime(2026, 3, 2, 23, 30), 450),   # wraps past midnight
+    (datetime(2026, 3, 2, 6, 59), 1),
+    (datetime(2026, 3, 2, 7, 0), 0),
+    (datetime(2026, 3, 2, 12, 0), 0),
+])
+def test_quiet_hours(now, left_min):
+    assert quiet_seconds_left(parse_quiet_hours("23:00-07:00"), now) == left_min * 60
+    assert quiet_seconds_left(parse_quiet_hours(None), now) == 0
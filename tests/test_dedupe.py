@@ -0,0 +1,65 @@
+from functools import partial
+
+from fakes import make_job
+
+from jobpilot.services.dedupe import DuplicateIndex, MinHasher, estimate_jaccard, shingles
+
+job = partial(make_job, title="Senior SDET")
+
+DESC = (
+    "We are hiring a Senior SDET to build Python and Selenium test automation for our payments "
+    "platform. You will own CI pipelines in Jenkins, write pytest suites for REST APIs, mentor "
+    "junior QA engineers and work closely with product owners in two week sprints. Requirements: "
+    "five plus years of automation experience, strong Python, Selenium WebDriver, SQL and Docker."
+)
+# Same role reposted by a recruiter: a line added and a typo fixed
+REPOST = DESC.replace("two week sprints", "two-week sprints") + " Contact Jane at Acme Staffing."
+OTHER = (
+    "Registered nurse for intensive care night shifts. BLS and ACLS certification required, "
+    "two years of ICU experience, strong charting and patient communication skills."
+)
+
+
+def test_minhash_estimates_jaccard():
+    hasher = MinHasher(num_perm=128)
+    a, b = shingles(DESC), shingles(REPOST)
+    true_jaccard = len(a & b) / len(a | b)
+    estimate = estimate_jaccard(hasher.signature(a), hasher.signature(b))
+    assert abs(estimate - true_jaccard) < 0.15
+    assert estimate_jaccard(hasher.signature(a), hasher.signature(shingles(OTHER))) < 0.1
+
+
+def test_plan_clusters_reposts_within_and_across_runs(tmp_path):
+    path = str(tmp_path / "dedupe.sqlite3")
+    index = DuplicateIndex(path)
+    jobs = [job("a"), job("b"), job("c", title="ICU Nurse", company="Hospital")]
+    matches = index.plan(jobs, [DESC, REPOST, OTHER])
+
+    assert matches[0] is None and matches[2] is None
+    assert matches[1].key == "dice:a" and matches[1].batch_index == 0
+    assert matches[1].similarity >= 0.8
+
+    index.record_score(jobs[0], 82.0, True, "good fit")
+    index.record_applied(jobs[0], "Yes")
+    # The repost joined the cluster, so it counts as applied too
+    assert index.cluster_applied(jobs[1]) == "Yes"
+    index.close()
+
+    # Next run: another copy reuses the stored decision
+    index = DuplicateIndex(path)
+    (match,) = index.plan([job("d")], [REPOST + " Apply today."])
+    assert match.cluster == "dice:a" and match.has_decision and match.applied == "Yes"
+    result = DuplicateIndex.reuse_result(job("d"), match)
+    assert result.job_id == "d" and result.match_percent == 82.0
+    assert "DUPLICATE of dice:b" in result.reasons  # nearest copy; decision from the cluster
+
+
+def test_card_match_needs_a_scored_posting(tmp_path):
+    index = DuplicateIndex(str(tmp_path / "dedupe.sqlite3"))
+    first = job("a")
+    index.plan([first], [DESC])
+    assert index.find_card(job("z", title="senior  SDET", company="ACME")) is None
+
+    index.record_score(first, 70.0, True, "ok")
+    match = index.find_card(job("z", title="senior  SDET", company="ACME"))
+    assert match is not None and match.key == "dice:a" and match.similarity == 1.0
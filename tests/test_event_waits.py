@@ -0,0 +1,91 @@
+import pytest
+from selenium.common.exceptions import JavascriptException, TimeoutException
+from selenium.webdriver.common.by import By
+
+from jobpilot.utils.waits import event_waits_enabled, wait_any, wait_for
+
+LOCATOR = (By.CSS_SELECTOR, "#target")
+
+
+class FakeElement:
+    def is_displayed(self):
+        return True
+
+    def is_enabled(self):
+        return True
+
+
+class FakeDriver:
+    """Answers the async wait script from `script_result` (an exception is raised)."""
+
+    def __init__(self, script_result, dom_has_target=True):
+        self.script_result = script_result
+        self.dom_has_target = dom_has_target
+        self.script_calls = []
+        self.script_timeouts = []
+
+    def set_script_timeout(self, seconds):
+        self.script_timeouts.append(seconds)
+
+    def execute_async_script(self, script, *args):
+        self.script_calls.append(args)
+        if isinstance(self.script_result, Exception):
+            raise self.script_result
+        return self.script_result
+
+    def find_element(self, by, value):
+        from selenium.common.exceptions import NoSuchElementException
+        if not self.dom_has_target:
+            raise NoSuchElementException(value)
+        return FakeElement()
+
+
+def test_one_script_call_resolves_the_wait():
+    element = FakeElement()
+    driver = FakeDriver(element)
+    assert wait_for(driver, LOCATOR, "visible", timeout=5) is element
+    assert wait_for(driver, LOCATOR, "clickable", timeout=5) is element
+    assert driver.script_calls[0] == ("css", "#target", "visible", 5000)
+    assert driver.script_timeouts == [6]   # raised once, reused afterwards
+
+
+def test_timeout_and_fallbacks():
+    with pytest.raises(TimeoutException):
+        wait_for(FakeDriver(None), LOCATOR, "present", timeout=1)
+
+    # Script unloaded by a navigation: the rest of the wait polls
+    driver = FakeDriver(JavascriptException("document unloaded while waiting for result"))
+    assert isinstance(wait_for(driver, LOCATOR, "present", timeout=1), FakeElement)
+
+    # Strategies the page script doesn't handle go straight to WebDriverWait
+    driver = FakeDriver(None)
+    assert isinstance(wait_for(driver, (By.LINK_TEXT, "Apply"), "present", timeout=1), FakeElement)
+    assert driver.script_calls == []
+
+
+def test_any_of_alternatives_resolve_in_one_script_call():
+    element = FakeElement()
+    driver = FakeDriver([1, element])
+    waits = [((By.CSS_SELECTOR, "#next"), "clickable"), ((By.XPATH, "//form"), "present")]
+    assert wait_any(driver, waits, timeout=5) == (1, element)
+    assert driver.script_calls == [([["css", "#next", "clickable"], ["xpath", "//form", "present"]], 5000)]
+
+    with pytest.raises(TimeoutException):
+        wait_any(FakeDriver(None), waits, timeout=1)
+
+    # Polling when event waits are off, or after a navigation unloads the script
+    driver = FakeDriver(JavascriptException("document unloaded while waiting for result"))
+    assert wait_any(driver, waits, timeout=1)[0] == 0
+    driver = FakeDriver(None)
+    assert wait_any(driver, waits, timeout=1, event_driven=False)[0] == 0
+    assert driver.script_calls == []
+
+
+def test_opt_in_flag(monkeypatch):
+    monkeypatch.delenv("JOBPILOT_EVENT_WAITS", raising=False)
+    driver = FakeDriver(None)
+    assert not event_waits_enabled(driver)
+    monkeypatch.setenv("JOBPILOT_EVENT_WAITS", "1")
+    assert event_waits_enabled(driver)
+    driver.jobpilot_event_waits = False
+    assert not event_waits_enabled(driver)
@@ -0,0 +1,110 @@
+import pytest
+from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException
+from selenium.webdriver.support.ui import WebDriverWait
+
+from jobpilot.providers.dice import selectors as S
+from jobpilot.providers.dice.pages.easy_apply_form_page import (
+    EasyApplyFormPage, STATE_ALREADY_APPLIED, STATE_CONFIRMED, STATE_QUESTIONS,
+    STATE_STEP1, STATE_STEP2, STATE_SUBMITTED,
+)
+from jobpilot.utils.waits import _PROBE_JS
+
+# What each screen shows (selector -> visible?)
+SCREENS = {
+    "step1": {S.EASY_APPLY_STEP1_CONTAINER[1]: True, S.EASY_APPLY_STEP1_NEXT_BUTTON[1]: True},
+    "questions": {S.EASY_APPLY_STEP1_NEXT_BUTTON[1]: True},
+    "stuck_questions": {S.EASY_APPLY_STEP1_NEXT_BUTTON[1]: True},
+    "step2": {S.EASY_APPLY_SUBMIT_BUTTON[1]: True},
+    "done": {S.EASY_APPLY_CONFIRMATION_CONTAINER[1]: True, S.EASY_APPLY_SUBMITTED_HEADER[1]: True},
+    "applied": {S.JOB_DESCRIPTION_APPLIED_BUTTON[1]: True},
+}
+
+
+class FakeElement:
+    def __init__(self, driver, selector):
+        self.driver, self.selector, self.generation = driver, selector, driver.generation
+
+    def is_displayed(self):
+        return True
+
+    def is_enabled(self):
+        if self.generation != self.driver.generation:
+            raise StaleElementReferenceException("gone")
+        return True
+
+    def click(self):
+        self.driver.clicks.append(self.driver.screen)
+        self.driver.advance()
+
+
+class FakeDriver:
+    """Walks through `flow` (screen names); every click on the current screen moves on."""
+
+    def __init__(self, flow):
+        self.flow = list(flow)
+        self.screen = self.flow.pop(0)
+        self.generation = 0
+        self.probes = 0
+        self.clicks = []
+
+    def advance(self):
+        if self.screen == "stuck_questions":
+            return   # validation error: nothing changes
+        self.screen = self.flow.pop(0)
+        self.generation += 1
+
+    def execute_script(self, script, *args):
+        if script == _PROBE_JS:
+            self.probes += 1
+            shown = SCREENS[self.screen]
+            return [selector in shown and (state == "present" or shown[selector]) for _, selector, state in args[0]]
+        return None   # scrollIntoView
+
+    def find_element(self, by, selector):
+        if selector in SCREENS[self.screen]:
+            return FakeElement(self, selector)
+        raise NoSuchElementException(selector)
+
+
+def page_for(driver) -> EasyApplyFormPage:
+    page = EasyApplyFormPage(driver)
+    page.wait = WebDriverWait(driver, 0.5, poll_frequency=0.05)
+    page.POLL_S = 0.01
+    page.LEAVE_TIMEOUT_S = 0.3
+    return page
+
+
+@pytest.mark.parametrize("screen, state", [
+    ("step1", STATE_STEP1), ("questions", STATE_QUESTIONS), ("step2", STATE_STEP2),
+    ("done", STATE_CONFIRMED), ("applied", STATE_ALREADY_APPLIED),
+])
+def test_probe_classifies_each_screen_in_one_call(screen, state):
+    driver = FakeDriver([screen])
+    assert page_for(driver).probe_state() == state
+    assert driver.probes == 1
+
+
+def test_drive_handles_extra_and_skipped_steps():
+    # Screening questions between step 1 and review
+    driver = FakeDriver(["step1", "questions", "questions", "step2", "done"])
+    page = page_for(driver)
+    assert page.drive(until=STATE_STEP2) == STATE_STEP2
+    assert driver.clicks == ["step1", "questions", "questions"]
+    assert page.drive() == STATE_SUBMITTED
+    assert page.wait_submission_confirmation(timeout=1)
+
+    # Dice skipped straight to review
+    driver = FakeDriver(["step2", "done"])
+    assert page_for(driver).drive() == STATE_SUBMITTED
+    assert driver.clicks == ["step2"]
+
+
+def test_drive_stops_on_already_applied_and_on_a_stuck_step():
+    assert page_for(FakeDriver(["applied"])).drive() == STATE_ALREADY_APPLIED
+
+    driver = FakeDriver(["step1", "stuck_questions"])
+    page = page_for(driver)
+    with pytest.raises(RuntimeError, match="did not move past 'questions'"):
+        page.drive()
+    # Polled for LEAVE_TIMEOUT_S after the click, not the 20s default
+    assert driver.clicks == ["step1", "stuck_questions"] and driver.probes < 60
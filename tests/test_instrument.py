@@ -0,0 +1,44 @@
+from fake_webdriver import FakeDriver
+
+from jobpilot.browser import instrument as instrument_module
+from jobpilot.browser.instrument import instrument
+from jobpilot.providers.dice.pages.base_page import BasePage
+
+
+class CardsPage(BasePage):
+    URL = "https://example.com/jobs"
+
+    def _safe_text(self, element):
+        return element.text
+
+    def titles(self):
+        cards = self.driver.find_elements("css selector", ".card")
+        return [self._safe_text(card) + card.get_attribute("href") for card in cards]
+
+    def load(self):
+        # BasePage.open does the driver.get; it is charged to this method
+        return self.open()
+
+
+def test_commands_are_attributed_to_page_object_methods(monkeypatch):
+    # The fake stands in for Selenium, so its frames are plumbing too
+    monkeypatch.setattr(instrument_module, "_PLUMBING", instrument_module._PLUMBING + ("fake_webdriver",))
+    driver = FakeDriver()
+    recorder = instrument(driver)
+    assert instrument(driver) is recorder and driver.jobpilot_commands is recorder
+
+    page = CardsPage(driver)
+    page.load()
+    assert page.titles() == ["valuevalue", "valuevalue"]
+
+    sites = {entry["site"]: entry for entry in recorder.call_sites()}
+    assert sites["CardsPage._safe_text"]["by_command"] == {"getElementText": 2}
+    assert sites["CardsPage.titles"]["by_command"] == {"findElements": 1, "getAttribute": 2}
+    assert sites["CardsPage.load"]["by_command"] == {"get": 1}
+    assert recorder.total()[0] == len(driver.sent) == 6
+
+    report = recorder.report(top=2)
+    assert report.startswith("[WebDriver] 6 commands") and len(report.splitlines()) == 3
+
+    recorder.reset()
+    assert recorder.total() == (0, 0.0)
@@ -0,0 +1,78 @@
+import time
+
+import pytest
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from selenium.webdriver.common.by import By
+
+from jobpilot.providers.dice.pages.base_page import BasePage
+from jobpilot.providers.dice.selectors import EASY_APPLY_STEP1_CONTAINER, EASY_APPLY_STEP1_NEXT_BUTTON
+from jobpilot.utils.latency import LatencyRecorder, locator_name
+
+
+def test_timeouts_follow_observed_p99_and_persist(tmp_path):
+    path = str(tmp_path / "latency.json")
+    recorder = LatencyRecorder(path, factor=3.0, min_timeout=2.0, max_timeout=20.0, min_samples=20)
+    assert recorder.timeout_for("visible:X", 20) == 20          # no data yet
+    for i in range(100):
+        recorder.record("visible:X", 0.5 + i / 100)              # 0.5s .. 1.49s
+        recorder.record("present:fast", 0.05)
+    assert recorder.percentiles("visible:X")["p99"] == 1.48
+    assert recorder.timeout_for("visible:X", 20) == pytest.approx(4.44)
+    assert recorder.timeout_for("present:fast", 20) == 2.0     # clamped up to min
+    recorder.save()
+
+    reloaded = LatencyRecorder.load(path, min_samples=20)
+    assert reloaded.timeout_for("visible:X", 20) == pytest.approx(4.44)
+    reloaded.record("visible:X", 4.44, ok=False)
+    assert reloaded.timeout_for("visible:X", 20) == 20          # backs off after a timeout
+
+
+def test_regressions_flag_slow_and_flaky_selectors():
+    recorder = LatencyRecorder(min_samples=20, recent=20)
+    for _ in range(60):
+        recorder.record("visible:STEADY", 0.3)
+        recorder.record("visible:SLOWER", 0.3)
+    for _ in range(20):
+        recorder.record("visible:STEADY", 0.31)
+        recorder.record("visible:SLOWER", 1.5)
+    for ok in [True] * 6 + [False] * 4:
+        recorder.record("clickable:FLAKY", 0.2, ok=ok)
+
+    flagged = dict(recorder.regressions())
+    assert set(flagged) == {"visible:SLOWER", "clickable:FLAKY"}
+    assert flagged["visible:SLOWER"] == "p90 0.30s -> 1.50s over the last 20 waits"
+
+
+class FakeDriver:
+    """Only the step 1 container is on the page."""
+
+    def __init__(self, recorder):
+        self.jobpilot_latency = recorder
+
+    def find_element(self, by, value):
+        if (by, value) == EASY_APPLY_STEP1_CONTAINER:
+            return object()
+        raise NoSuchElementException(value)
+
+
+def test_fallback_waits_run_together():
+    recorder = LatencyRecorder()
+    page = BasePage(FakeDriver(recorder))
+    started = time.perf_counter()
+    index, _ = page.any_of(
+        (EASY_APPLY_STEP1_NEXT_BUTTON, "clickable"),
+        (EASY_APPLY_STEP1_CONTAINER, "present"),
+    )
+    assert index == 1 and time.perf_counter() - started < 1.0
+    assert locator_name(EASY_APPLY_STEP1_CONTAINER) == "EASY_APPLY_STEP1_CONTAINER"
+    assert list(recorder.samples) == ["present:EASY_APPLY_STEP1_CONTAINER"]
+
+    # Learned timeout for a wait that never succeeds: fails fast, recorded as a timeout
+    key = "visible:css selector=#missing"
+    for _ in range(20):
+        recorder.record(key, 0.01)
+    started = time.perf_counter()
+    with pytest.raises(TimeoutException):
+        page.visible((By.CSS_SELECTOR, "#missing"))
+    assert time.perf_counter() - started < 5
+    assert recorder.outcomes[key][-1] is False
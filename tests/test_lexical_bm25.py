@@ -0,0 +1,38 @@
+from jobpilot.models.job import JobPosting
+from jobpilot.services.lexical import CorpusIndex
+from jobpilot.services.matcher import JobMatcher
+
+JOB = JobPosting(id="j1", title="SDET", company="Acme", location="", url="",
+                 provider="dice", easy_apply=True, metadata={})
+
+BOILERPLATE = "the team and the company offer benefits to the people we hire"
+
+
+def test_corpus_index_persists_and_counts_each_description_once(tmp_path):
+    path = str(tmp_path / "corpus.json")
+    index = CorpusIndex.load(path)
+    assert index.add("Python and Selenium")
+    assert not index.add("  python AND selenium ")  # same normalized text
+    index.save()
+
+    reloaded = CorpusIndex.load(path)
+    assert reloaded.n_docs == 1
+    assert reloaded.df["python"] == 1
+    assert not reloaded.add("Python and Selenium")
+
+
+def test_bm25_strategy_weights_rare_terms_over_boilerplate():
+    index = CorpusIndex()
+    for i in range(50):
+        index.add(f"{BOILERPLATE} posting {i} java spring")
+
+    # One resume shares only the boilerplate, the other only the rare skills
+    boilerplate_resume = JobMatcher(BOILERPLATE, use_llm=False, cheap_strategy="bm25", corpus_index=index)
+    skills_resume = JobMatcher("python selenium pytest", use_llm=False, cheap_strategy="bm25", corpus_index=index)
+
+    description = f"{BOILERPLATE} python selenium pytest"
+    assert (
+        skills_resume.score_cheap(JOB, description).match_percent
+        > boilerplate_resume.score_cheap(JOB, description).match_percent
+    )
+    assert index.n_docs == 51  # scoring observed the new posting once
@@ -0,0 +1,89 @@
+import asyncio
+import time
+
+import pytest
+
+from jobpilot.models.job import JobPosting
+from jobpilot.services.llm_async import AsyncLLMScorer, score_llm_concurrently
+from jobpilot.services.matcher import JobMatcher
+
+from fake_openai_server import FakeOpenAIServer
+
+pytest.importorskip("openai")
+
+
+def make_jobs(n: int) -> list[JobPosting]:
+    return [
+        JobPosting(id=f"j{i}", title="SDET", company="Acme", location="", url=f"https://x/{i}",
+                   provider="dice", easy_apply=True, metadata={})
+        for i in range(n)
+    ]
+
+
+@pytest.fixture
+def matcher(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "fake-key")
+    return JobMatcher(resume_text="python selenium pytest", use_llm=True)
+
+
+def test_concurrent_scoring_is_bounded_and_overlaps(matcher):
+    jobs = make_jobs(8)
+    with FakeOpenAIServer(latency=0.3) as server:
+        finished = []
+        started = time.perf_counter()
+        results = score_llm_concurrently(
+            matcher, jobs, ["python selenium"] * len(jobs),
+            on_result=lambda i, r: finished.append(i),
+            concurrency=4, base_url=server.base_url,
+        )
+        elapsed = time.perf_counter() - started
+
+    assert [r.job_id for r in results] == [j.id for j in jobs]
+    assert all(r.match_percent == 75.0 for r in results)
+    assert sorted(finished) == list(range(len(jobs)))
+    assert server.max_in_flight <= 4
+    # 8 calls x 0.3s serially would be 2.4s; two waves of 4 is ~0.6s
+    assert elapsed < 1.8
+
+
+def test_rate_limited_requests_are_retried(matcher):
+    jobs = make_jobs(3)
+    with FakeOpenAIServer(rate_limit_first=2) as server:
+        results = score_llm_concurrently(
+            matcher, jobs, ["python"] * len(jobs),
+            concurrency=2, base_url=server.base_url, max_attempts=4,
+        )
+
+    assert server.rate_limited == 2
+    assert all("FALLBACK" not in r.reasons for r in results)
+
+
+def test_timeouts_fall_back_to_naive(matcher):
+    with FakeOpenAIServer(latency=1.0) as server:
+        results = score_llm_concurrently(
+            matcher, make_jobs(1), ["python selenium"],
+            concurrency=2, base_url=server.base_url, timeout=0.1, max_attempts=1,
+        )
+
+    assert "FALLBACK" in results[0].reasons
+
+
+def test_failed_call_releases_jobs_waiting_on_the_same_description(matcher):
+    scorer = AsyncLLMScorer(matcher, client=object())
+
+    async def store_down(*args):
+        await asyncio.sleep(0.01)
+        raise OSError("score cache is read-only")
+    scorer._score_uncached = store_down
+
+    async def score_twice():
+        semaphore = asyncio.Semaphore(2)
+        jobs = make_jobs(2)
+        owner = asyncio.create_task(scorer.score_one(jobs[0], "python selenium", semaphore))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(scorer.score_one(jobs[1], "python selenium", semaphore))
+        return await asyncio.wait_for(asyncio.gather(owner, waiter, return_exceptions=True), timeout=2)
+
+    results = asyncio.run(score_twice())
+    assert [type(r) for r in results] == [OSError, OSError]
+    assert scorer.deduped == 1 and scorer._inflight == {}
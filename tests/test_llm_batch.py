@@ -0,0 +1,123 @@
+import json
+import re
+
+import pytest
+
+from jobpilot.models.job import JobPosting
+from jobpilot.services import llm_batch
+from jobpilot.services.llm_batch import BatchLLMScorer, parse_batch_response
+from jobpilot.services.matcher import JobMatcher
+
+from fake_openai_server import FakeOpenAIServer
+
+pytest.importorskip("openai")
+
+
+def make_jobs(n: int) -> list[JobPosting]:
+    return [
+        JobPosting(id=f"j{i}", title="SDET", company="Acme", location="", url=f"https://x/{i}",
+                   provider="dice", easy_apply=True, metadata={})
+        for i in range(n)
+    ]
+
+
+def batch_keys(body: dict) -> list[str]:
+    return re.findall(r"^\[(J\d+)\]$", body["messages"][-1]["content"], flags=re.M)
+
+
+def answer(keys) -> str:
+    return "```json\n" + json.dumps([
+        {"job_key": k, "match_percent": 80, "recommended": True, "reasons": f"batch {k}"}
+        for k in keys
+    ]) + "\n```"
+
+
+def make_matcher(monkeypatch, server) -> JobMatcher:
+    monkeypatch.setenv("OPENAI_API_KEY", "fake-key")
+    monkeypatch.setenv("OPENAI_BASE_URL", server.base_url)
+    return JobMatcher(resume_text="python selenium pytest", use_llm=True)
+
+
+def test_parse_batch_response_is_tolerant():
+    raw = 'Sure! [{"job_key": "J1", "match_percent": 70}, {"job_key": "J2", "match_percent": "n/a"}, 5] done'
+    assert list(parse_batch_response(raw)) == ["J1"]
+    assert parse_batch_response("not json at all") == {}
+
+
+def test_jobs_share_one_request(monkeypatch):
+    with FakeOpenAIServer(responder=lambda body: answer(batch_keys(body))) as server:
+        matcher = make_matcher(monkeypatch, server)
+        results = BatchLLMScorer(matcher, max_batch_size=8).score_all(make_jobs(5), ["python selenium"] * 5)
+
+    assert server.requests == 1
+    assert [r.job_id for r in results] == [f"j{i}" for i in range(5)]
+    assert all(r.match_percent == 80.0 for r in results)
+    # The resume is sent once, not once per job
+    assert server.bodies[0]["messages"][-1]["content"].count("python selenium pytest") == 1
+
+
+def test_only_missing_jobs_are_retried(monkeypatch):
+    def responder(body):
+        keys = batch_keys(body)
+        # First answer drops the last job
+        return answer(keys[:-1] if len(keys) == 4 else keys)
+
+    with FakeOpenAIServer(responder=responder) as server:
+        matcher = make_matcher(monkeypatch, server)
+        scorer = BatchLLMScorer(matcher, max_batch_size=4)
+        descs = [f"python selenium role {i}" for i in range(4)]
+        results = scorer.score_all(make_jobs(4), descs)
+
+    assert server.requests == 2
+    assert len(batch_keys(server.bodies[1])) == 1
+    assert "role 3" in server.bodies[1]["messages"][-1]["content"]
+    assert scorer.retried == 1
+    assert all("FALLBACK" not in r.reasons for r in results)
+
+
+def test_batches_split_on_token_budget(monkeypatch):
+    with FakeOpenAIServer(responder=lambda body: answer(batch_keys(body))) as server:
+        matcher = make_matcher(monkeypatch, server)
+        scorer = BatchLLMScorer(matcher, token_budget=2000, max_batch_size=50)
+        descs = ["python selenium " * 150] * 6
+        batches = scorer.pack(list(zip(make_jobs(6), descs)), scorer.max_batch_size)
+        results = scorer.score_all(make_jobs(6), descs)
+
+    assert 1 < len(batches) < 6
+    assert server.requests == len(batches)
+    assert all(r.match_percent == 80.0 for r in results)
+
+
+def test_top_score_many_batch_mode(monkeypatch):
+    with FakeOpenAIServer(responder=lambda body: answer(batch_keys(body))) as server:
+        matcher = make_matcher(monkeypatch, server)
+        results = matcher.top_score_many(make_jobs(3), ["java"] * 3, llm_mode="batch")
+
+    assert server.requests == 1
+    assert all(r.reasons.startswith("batch J") for r in results)
+
+
+def test_bad_key_stops_batching_without_single_retries(monkeypatch):
+    class BadKey(Exception):
+        pass
+
+    class RejectingClient:
+        def __init__(self):
+            self.calls = 0
+            self.chat = self
+            self.completions = self
+
+        def create(self, **kwargs):
+            self.calls += 1
+            raise BadKey("Incorrect API key provided")
+
+    # Stands in for openai.AuthenticationError, whose constructor varies by SDK version
+    monkeypatch.setattr(llm_batch, "_NON_RETRYABLE", (BadKey,))
+    monkeypatch.setenv("OPENAI_API_KEY", "bad-key")
+    matcher = JobMatcher(resume_text="python selenium pytest", use_llm=True)
+    client = RejectingClient()
+    scorer = BatchLLMScorer(matcher, max_batch_size=2, client=client)
+    results = scorer.score_all(make_jobs(5), [f"python role {i}" for i in range(5)])
+
+    assert client.calls == 1 and scorer.single_fallbacks == 0
+    assert all("FALLBACK: LLM scoring failed: Incorrect API key" in r.reasons for r in results)
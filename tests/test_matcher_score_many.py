@@ -0,0 +1,23 @@
+from fakes import make_job
+
+from jobpilot.services.matcher import JobMatcher
+
+
+def test_score_many_matches_per_job_naive_scores():
+    matcher = JobMatcher(resume_text="Python Selenium pytest SQL API testing automation", use_llm=False)
+    descriptions = [
+        "We need python and selenium automation, python again",
+        "Java Spring Kubernetes",
+        "",
+        "   ",
+        "SQL api TESTING pytest python selenium automation",
+    ]
+    jobs = [make_job(f"j{i}") for i in range(len(descriptions))]
+
+    batch = matcher.score_many(jobs, descriptions)
+    single = [matcher._score_naive(job, desc) for job, desc in zip(jobs, descriptions)]
+
+    assert [r.match_percent for r in batch] == [r.match_percent for r in single]
+    assert [r.reasons for r in batch] == [r.reasons for r in single]
+    assert batch[-1].match_percent == 100.0
+    assert batch[-1].recommended
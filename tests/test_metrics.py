@@ -0,0 +1,91 @@
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from fakes import make_job
+
+from jobpilot.orchestrator.runner import JobPilotRunner
+from jobpilot.storage.repo import JobRepo
+from jobpilot.storage.sinks import JsonlSink
+from jobpilot.utils.metrics import Metrics, metrics
+
+
+def test_timers_and_counters_summarize_per_label():
+    m = Metrics()
+    for seconds in (0.1, 0.2, 0.3):
+        m.observe("search_query", seconds, query="sdet @ Remote")
+    m.inc("cards_scraped", 20, query="sdet @ Remote")
+    m.inc("cards_scraped", 5, query="sdet @ Remote")
+    with pytest.raises(RuntimeError):
+        with m.timer("login"):
+            raise RuntimeError("bad password")
+
+    summary = m.summary()
+    stats = summary["timings"]['search_query{query="sdet @ Remote"}']
+    assert stats["n"] == 3 and stats["sum_s"] == 0.6 and stats["max_s"] == 0.3 and stats["p50_s"] == 0.2
+    assert summary["counters"]['cards_scraped{query="sdet @ Remote"}'] == 25
+    # failed stages are timed and counted
+    assert summary["timings"]["login"]["n"] == 1 and summary["counters"]["login_errors"] == 1
+    assert m.total_s("search_query") == pytest.approx(0.6)
+
+    m.reset()
+    assert m.summary()["timings"] == {} and m.summary()["counters"] == {}
+
+
+def test_prometheus_textfile_and_json_summary(tmp_path):
+    m = Metrics()
+    m.observe("apply_step", 2.0, step="submit")
+    m.observe("apply_step", 4.0, step="submit")
+    m.inc("apply_results", status="APPLIED")
+    m.inc("cards_scraped", 3, query='say "hi"')
+
+    prom_path = tmp_path / "textfile" / "jobpilot.prom"
+    m.write_prometheus(str(prom_path))
+    lines = prom_path.read_text().splitlines()
+    assert "# TYPE jobpilot_apply_step_seconds summary" in lines
+    assert 'jobpilot_apply_step_seconds{step="submit",quantile="0.5"} 2.000000' in lines
+    assert 'jobpilot_apply_step_seconds_sum{step="submit"} 6.000000' in lines
+    assert 'jobpilot_apply_step_seconds_count{step="submit"} 2' in lines
+    assert 'jobpilot_apply_results_total{status="APPLIED"} 1' in lines
+    assert 'jobpilot_cards_scraped_total{query="say \\"hi\\""} 3' in lines
+    assert not (tmp_path / "textfile" / "jobpilot.prom.tmp").exists()
+
+    json_path = tmp_path / "last_run.json"
+    m.write_json(str(json_path))
+    assert json.loads(json_path.read_text())["timings"]['apply_step{step="submit"}']["mean_s"] == 3.0
+
+
+def test_repo_records_sink_read_append_and_update(tmp_path):
+    metrics.reset()
+    repo = JobRepo(sink=JsonlSink(base_dir=str(tmp_path)))
+    job = make_job("a1")
+    row_map = repo.save_jobs("dice", [job])
+    repo.get_existing_jobs_id("dice")
+    repo.update_job_status(job, applied="Yes", row_idx=row_map["a1"])
+
+    timings = metrics.summary()["timings"]
+    for stage in ("sink_append", "sink_read", "sink_update"):
+        assert timings[f'{stage}{{sink="JsonlSink"}}']["n"] == 1
+    assert metrics.summary()["counters"]["jobs_saved"] == 1
+    metrics.reset()
+
+
+def test_run_summaries_are_capped_at_keep_runs(tmp_path, monkeypatch):
+    monkeypatch.setenv("JOBPILOT_DATA_DIR", str(tmp_path))
+    runner = JobPilotRunner.__new__(JobPilotRunner)
+    start = datetime(2026, 3, 2, 12, 0, tzinfo=timezone.utc)
+
+    runner.cfg = {"metrics": {}}
+    runner._report_metrics()
+    assert sorted(p.name for p in (tmp_path / "metrics").iterdir()) == ["last_run.json"]
+
+    runner.cfg = {"metrics": {"keep_runs": 2}}
+    for tick in range(4):
+        metrics.reset()
+        metrics.started_at = start + timedelta(minutes=30 * tick)
+        runner._report_metrics()
+    assert sorted(p.name for p in (tmp_path / "metrics").iterdir()) == [
+        "last_run.json", "run-20260302T130000Z.json", "run-20260302T133000Z.json",
+    ]
+    metrics.reset()
@@ -0,0 +1,46 @@
+from functools import partial
+
+from fakes import make_job
+
+from jobpilot.services.matcher import JobMatcher
+from jobpilot.services.multi_profile import MultiProfileMatcher
+
+QA = "Python Selenium pytest test automation regression QA"
+BACKEND = "Python Django PostgreSQL REST APIs Celery Redis"
+
+job = partial(make_job, title="Engineer", url="")
+
+
+def test_score_many_matches_per_profile_naive_scores():
+    multi = MultiProfileMatcher({
+        "qa": JobMatcher(QA, use_llm=False),
+        "backend": JobMatcher(BACKEND, use_llm=False),
+    })
+    descs = ["selenium pytest automation in python", "django rest apis, postgresql and redis", "", "cobol"]
+    jobs = [job(str(i)) for i in range(len(descs))]
+
+    cheap = multi.cheap_scores(jobs, descs)
+    for name, matcher in multi.matchers.items():
+        single = [matcher._score_naive(j, d) for j, d in zip(jobs, descs)]
+        assert [r.match_percent for r in cheap[name]] == [r.match_percent for r in single]
+        assert [r.reasons for r in cheap[name]] == [r.reasons for r in single]
+
+
+def test_best_profile_wins_per_job():
+    multi = MultiProfileMatcher({
+        "qa": JobMatcher(QA, use_llm=False),
+        "backend": JobMatcher(BACKEND, use_llm=False),
+    })
+    matches = multi.top_score_many(
+        [job("a"), job("b"), job("c")],
+        ["selenium pytest automation python", "django postgresql celery redis python", "cobol"],
+    )
+
+    assert [m.profile for m in matches] == ["qa", "backend", "qa"]   # tie -> first profile
+    assert matches[0].result.reasons.startswith("[profile qa] ")
+    assert set(matches[1].scores) == {"qa", "backend"}
+    assert matches[1].scores["backend"] > matches[1].scores["qa"]
+    assert matches[2].scores_text() == "qa=0.0; backend=0.0"
+    # The LLM tier runs once per job, for its best cheap profile only
+    assert multi.stats["llm_scored"] == 3
+    assert multi.matchers["qa"].stats["llm_scored"] == 2 and multi.matchers["backend"].stats["llm_scored"] == 1
@@ -0,0 +1,76 @@
+import json
+
+from fakes import make_job
+
+from jobpilot.models.job import JobPosting
+from jobpilot.services.refresh import (
+    CHANGED, UNCHANGED, BASELINED, UNAVAILABLE,
+    ChurnReport, DescriptionStore, FetchResult, check_descriptions, description_hash, extract_ld_description,
+)
+from jobpilot.storage.schema import job_to_row, row_to_job, stringify_row
+
+
+def job(i: str, keyword: str = "sdet") -> JobPosting:
+    return make_job(i, location="Remote", metadata={"search_keyword": keyword, "search_location": "Remote"})
+
+
+def page(description: str) -> str:
+    ld = {"@context": "https://schema.org", "@graph": [
+        {"@type": "Organization", "name": "Acme"},
+        {"@type": "JobPosting", "title": "SDET", "description": description},
+    ]}
+    return f'<html><head><script type="application/ld+json">{json.dumps(ld)}</script></head></html>'
+
+
+class FakeFetcher:
+    def __init__(self, pages):
+        self.pages = pages
+        self.calls = []
+
+    def fetch(self, url, etag=None, last_modified=None):
+        self.calls.append((url, etag))
+        body = self.pages.get(url)
+        if body is None:
+            return FetchResult(text=None, error="HTTP 404")
+        if etag == f"v{hash(body)}":
+            return FetchResult(text=None, not_modified=True, etag=etag)
+        return FetchResult(text=extract_ld_description(body), etag=f"v{hash(body)}")
+
+
+def test_ld_description_and_hash_normalization():
+    text = extract_ld_description(page("<p>Python &amp; Selenium</p><ul><li>pytest</li></ul>"))
+    assert text == "Python & Selenium pytest"
+    assert extract_ld_description("<html>no structured data</html>") is None
+    assert description_hash("Python  &  SELENIUM") == description_hash("python & selenium")
+
+
+def test_only_edited_postings_come_back_for_rescoring(tmp_path):
+    store = DescriptionStore(str(tmp_path / "descriptions.sqlite3"))
+    jobs = [job("a"), job("b"), job("c", keyword="python"), job("gone", keyword="python")]
+    fetcher = FakeFetcher({
+        "https://x/a": page("Selenium and pytest"),
+        "https://x/b": page("Playwright"),
+        "https://x/c": page("Django"),
+    })
+
+    first = ChurnReport()
+    outcomes = [o for _, o, _ in check_descriptions(jobs, store, fetcher, report=first)]
+    assert outcomes == [BASELINED, BASELINED, BASELINED, UNAVAILABLE]
+
+    fetcher.pages["https://x/b"] = page("Playwright and TypeScript")   # employer edit
+    report = ChurnReport()
+    checked = check_descriptions(jobs, store, fetcher, report=report)
+
+    assert [(j.id, o) for j, o, _ in checked] == [
+        ("a", UNCHANGED), ("b", CHANGED), ("c", UNCHANGED), ("gone", UNAVAILABLE),
+    ]
+    assert checked[1][2] == "Playwright and TypeScript" and checked[0][2] is None
+    assert fetcher.calls[-4][1] is not None   # second pass sends the stored ETag
+    assert [(q, churn) for q, _, churn in report.rows()] == [("sdet @ Remote", 0.5), ("python @ Remote", 0.0)]
+    assert report.total() == {CHANGED: 1, UNCHANGED: 2, BASELINED: 0, UNAVAILABLE: 1}
+
+
+def test_saved_rows_round_trip_to_jobs():
+    original = job("a")
+    restored = row_to_job(stringify_row(job_to_row(original)))
+    assert restored == original
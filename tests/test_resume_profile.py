@@ -0,0 +1,64 @@
+import os
+
+from jobpilot.models.job import JobPosting
+from jobpilot.services.condense import BoilerplateLibrary, Condenser
+from jobpilot.services.matcher import JobMatcher
+from jobpilot.services.resume_profile import ResumeProfileStore, compile_profile
+
+RESUME = """Jane Doe
+SDET
+
+Summary
+Test automation engineer, 7 years.
+
+Technical Skills
+Languages: Python, Java, TypeScript
+Tools: Selenium / Playwright | pytest; Jenkins
+
+Experience
+Acme Corp - built UI test frameworks in Python.
+"""
+
+JOB = JobPosting(id="1", title="SDET", company="Acme", location="", url="u",
+                 provider="dice", easy_apply=True, metadata={})
+
+
+def test_compile_profile_terms():
+    profile = compile_profile(RESUME)
+
+    assert "python," in profile.split_terms and "python" in profile.word_terms
+    assert profile.split_terms == sorted(set(profile.split_terms))
+
+
+def test_store_rebuilds_only_when_the_file_changes(tmp_path):
+    resume_path = tmp_path / "resume.txt"
+    resume_path.write_text(RESUME, encoding="utf-8")
+    cache_path = str(tmp_path / "profile.json")
+
+    store = ResumeProfileStore(cache_path)
+    first = store.get(str(resume_path))
+    assert store.compiles == 1
+
+    # Fresh store (next run) reads the JSON instead of recompiling
+    store = ResumeProfileStore(cache_path)
+    assert store.get(str(resume_path)) == first
+    # Touch without edits: mtime moves, hash matches
+    os.utime(resume_path, (1, 1))
+    assert store.get(str(resume_path)).sha == first.sha
+    assert store.compiles == 0
+
+    resume_path.write_text(RESUME + "Kubernetes\n", encoding="utf-8")
+    assert "kubernetes" in store.get(str(resume_path)).word_terms
+    assert store.compiles == 1
+
+
+def test_matcher_from_profile_scores_like_raw_text():
+    condenser = Condenser(BoilerplateLibrary())
+    profile = compile_profile(RESUME, condenser=condenser)
+    from_profile = JobMatcher.from_profile(profile, use_llm=False, condenser=condenser)
+    from_text = JobMatcher(RESUME, use_llm=False, condenser=condenser)
+
+    desc = "We need Python, Selenium and pytest experience"
+    assert from_profile.score_cheap(JOB, desc) == from_text.score_cheap(JOB, desc)
+    assert from_profile._llm_cache_key(desc) == from_text._llm_cache_key(desc)
+    assert from_profile.llm_resume() == profile.llm_summary
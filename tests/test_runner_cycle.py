@@ -0,0 +1,143 @@
+import pytest
+
+from fakes import FakeApplyProvider, make_job
+
+from jobpilot.orchestrator.apply_queue import CONFIRMED, QUEUED, ApplyQueue
+from jobpilot.orchestrator.runner import JobPilotRunner, ScoringSetup
+from jobpilot.services.matcher import JobMatchResult
+from jobpilot.services.multi_profile import ProfileMatch
+from jobpilot.services.refresh import CHANGED, DescriptionStore
+from jobpilot.storage.repo import JobRepo
+from jobpilot.storage.sinks import JsonlSink
+
+
+class FakeTabs:
+    def summary(self):
+        return {}
+
+
+class SearchProvider(FakeApplyProvider):
+    """Finds `ids` on search; every description is a good match."""
+    NAME = "dice"
+
+    def __init__(self, ids, **kwargs):
+        super().__init__(**kwargs)
+        self.ids = ids
+        self.tabs = FakeTabs()
+
+    def search(self, max_results=10, date_posted=None):
+        return [make_job(i) for i in self.ids]
+
+    def get_job_description(self, job):
+        return f"python selenium role {job.id}"
+
+
+class FakeMatcher:
+    names = ["default"]
+
+    def __init__(self):
+        self.stats = dict(llm_scored=0, llm_skipped=0, cascade_reject=0, cascade_accept=0, prefilter_reject=0)
+
+    def top_score_many(self, jobs, descriptions, **kwargs):
+        return [
+            ProfileMatch(result=JobMatchResult(job.id, job.provider, 90.0, True, "fit"), profile="default")
+            for job in jobs
+        ]
+
+
+@pytest.fixture
+def runner(tmp_path, monkeypatch):
+    monkeypatch.setenv("JOBPILOT_DATA_DIR", str(tmp_path))
+    runner = JobPilotRunner.__new__(JobPilotRunner)
+    runner.cfg = {
+        "matching": {"dedupe": {"enabled": False}, "semantic": {"enabled": False}},
+        "apply": {"pipeline_depth": 2, "pace_s": 0},
+        "metrics": {"enabled": False},
+    }
+    runner.provider_name = "dice"
+    runner.repo = JobRepo(sink=JsonlSink(base_dir=str(tmp_path / "sinks")))
+    runner.card_rules = None
+    monkeypatch.setattr(runner, "_build_scoring", lambda match_cfg: ScoringSetup(
+        matcher=FakeMatcher(), variants={"default": {}}, profiles={},
+        corpus_index=None, score_cache=None, condenser=None,
+    ))
+    return runner
+
+
+def test_stop_request_ends_the_apply_stage_after_the_job_in_flight(runner):
+    provider = SearchProvider(["a", "b", "c"])
+    stop_reason = []
+    confirm = provider.confirm_apply
+
+    def confirm_then_signal(session):
+        stop_reason.append("received SIGTERM")
+        return confirm(session)
+    provider.confirm_apply = confirm_then_signal
+
+    jobs = runner.run_cycle(provider, stop=lambda: stop_reason[0] if stop_reason else None)
+
+    assert len(jobs) == 3
+    (submitted,) = [c[1] for c in provider.calls if c[0] == "submit"]
+    assert provider.open_tabs == 0
+    queue = runner._apply_queue({})
+    assert queue.counts() == {CONFIRMED: 1, QUEUED: 2}
+    assert queue.state(f"dice:{submitted}") == CONFIRMED
+    # Same states as the apply worker's drain()
+    assert queue.history(f"dice:{submitted}") == ["queued", "opened", "step1", "step2", "submitted", "confirmed"]
+    # The tab opened ahead was closed at the stop; the job is back in line
+    ahead = [c[1] for c in provider.calls if c[0] == "open" and c[1] != submitted]
+    assert [queue.history(f"dice:{i}") for i in ahead] == [["queued", "opened", "queued"]]
+    queue.close()
+
+
+def test_stores_are_closed_when_the_cycle_fails(runner, monkeypatch):
+    closed = []
+    for store in (ApplyQueue, DescriptionStore):
+        close = store.close
+        monkeypatch.setattr(store, "close", lambda self, close=close: closed.append(type(self)) or close(self))
+
+    def sheet_down(*args, **kwargs):
+        raise RuntimeError("sheet quota exceeded")
+    monkeypatch.setattr(runner, "_record_apply_result", sheet_down)
+
+    with pytest.raises(RuntimeError, match="sheet quota"):
+        runner.run_cycle(SearchProvider(["a"]))
+    assert sorted(c.__name__ for c in closed) == ["ApplyQueue", "DescriptionStore"]
+
+
+def test_runner_uses_the_config_it_is_given(tmp_path, monkeypatch):
+    # main.py loads --profile/--search itself; the runner must not reload the defaults
+    monkeypatch.setattr("jobpilot.orchestrator.runner.load_configs", lambda *a: pytest.fail("reloaded configs"))
+    cfg = {"storage": {"sinks": ["jsonl"], "dir": str(tmp_path)}, "profile": {"name": "custom"}}
+
+    runner = JobPilotRunner(provider_name="dice", cfg=cfg)
+
+    assert runner.cfg is cfg
+    assert isinstance(runner.repo.sink, JsonlSink)
+
+
+def test_refresh_closes_its_stores_when_rescoring_fails(runner, monkeypatch):
+    closed = []
+    close = DescriptionStore.close
+    monkeypatch.setattr(DescriptionStore, "close", lambda self: closed.append("descriptions") or close(self))
+
+    class Cache:
+        def close(self):
+            closed.append("score_cache")
+
+    class BrokenMatcher(FakeMatcher):
+        def top_score_many(self, jobs, descriptions, **kwargs):
+            raise RuntimeError("LLM quota exceeded")
+
+    job = make_job("a")
+    monkeypatch.setattr(runner.repo, "iter_saved_jobs", lambda provider: [(2, job)])
+    monkeypatch.setattr("jobpilot.orchestrator.runner.check_descriptions",
+                        lambda jobs, *a, **kw: [(job, CHANGED, "python role, edited")])
+    monkeypatch.setattr(runner, "_build_scoring", lambda match_cfg: ScoringSetup(
+        matcher=BrokenMatcher(), variants={"default": {}}, profiles={},
+        corpus_index=None, score_cache=Cache(), condenser=None,
+    ))
+
+    with pytest.raises(RuntimeError, match="LLM quota"):
+        runner.refresh()
+    assert sorted(closed) == ["descriptions", "score_cache"]
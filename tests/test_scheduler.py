@@ -0,0 +1,102 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from jobpilot.models.job import JobPosting
+from jobpilot.orchestrator import scheduler as scheduler_mod
+from jobpilot.orchestrator.apply_queue import QueueItem
+from jobpilot.orchestrator.scheduler import ApplyScheduler
+from jobpilot.providers.dice.pages.results_page import posted_at
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    c = Clock()
+    monkeypatch.setattr(scheduler_mod.time, "monotonic", c)
+    return c
+
+
+def item(i: str, priority: float, created_at: float, posted: str = "") -> QueueItem:
+    job = JobPosting(id=i, title="SDET", company="Acme", location="", url=f"https://x/{i}",
+                     provider="dice", easy_apply=True, metadata={"posted_at": posted} if posted else {})
+    return QueueItem(key=f"dice:{i}", job=job, state="queued", attempts=0,
+                     priority=priority, created_at=created_at)
+
+
+def test_rank_puts_best_matches_first_then_newest():
+    items = [item("old80", 80, 1), item("new80", 80, 5), item("top", 95, 0), item("low", 40, 9)]
+    assert [i.job.id for i in ApplyScheduler.rank(items)] == ["top", "new80", "old80", "low"]
+
+
+def test_rank_breaks_ties_on_posting_date_not_enqueue_time():
+    now = datetime(2026, 3, 2, 12, 0, tzinfo=timezone.utc)
+    items = [
+        item("fresh", 80, created_at=1, posted=posted_at("Easy Apply  Today", now)),
+        item("stale", 80, created_at=9, posted=posted_at("Posted 12 days ago", now)),
+        item("unknown", 80, created_at=5),
+        item("week", 80, created_at=3, posted=posted_at("1 week ago | Remote", now)),
+    ]
+    assert [i.job.id for i in ApplyScheduler.rank(items)] == ["fresh", "week", "stale", "unknown"]
+    assert posted_at("Yesterday", now) == "2026-03-01T12:00+00:00"
+
+    # The semantic layer's similarity comes before the posting date
+    items[1].job.metadata["semantic_score"] = 41.5
+    assert [i.job.id for i in ApplyScheduler.rank(items)][0] == "stale"
+    assert posted_at("Senior SDET, Remote") == ""
+
+
+def test_budget_counts_applications_only(clock):
+    s = ApplyScheduler(max_applications=2)
+    for applied in (True, False, True):
+        assert s.admit() is None
+        s.observe(applied=applied)
+    assert s.admit() == "budget of 2 applications reached"
+    assert s.summary()["attempted"] == 3
+
+
+def test_deadline_uses_the_learned_apply_time(clock, tmp_path):
+    path = str(tmp_path / "sched.json")
+    s = ApplyScheduler(deadline_s=300, estimate_s=30, alpha=0.5, path=path)
+    s.start()
+    assert s.admit() is None
+    clock.now += 90                     # one apply took 90s
+    s.observe(applied=True)
+    assert s.estimate_s == pytest.approx(60)
+    assert s.admit() is None            # 210s left
+    clock.now += 170
+    s.observe(applied=True)             # estimate -> 115s, 40s left
+    assert s.admit().startswith("deadline: 40s left")
+    s.save()
+
+    # The next run starts from the learned estimate
+    assert ApplyScheduler(path=path).estimate_s == pytest.approx(115)
+    assert "eta 3.8 min" in ApplyScheduler(path=path).plan_text(2)
+
+
+def test_deadline_counts_from_the_start_of_the_apply_stage(clock):
+    s = ApplyScheduler(deadline_s=600, estimate_s=30)
+    clock.now += 900                    # login, search and scoring
+    s.start()
+    assert s.admit() is None
+    assert "10.0 min to deadline" in s.plan_text(1)
+
+
+def test_skips_do_not_shrink_the_apply_estimate(clock):
+    s = ApplyScheduler(estimate_s=60, alpha=0.5)
+    s.start()
+    assert s.admit() is None
+    clock.now += 0.2                    # duplicate skipped without opening a tab
+    s.observe(applied=False, timed=False)
+    assert s.estimate_s == pytest.approx(60)
+    clock.now += 80                     # the next job went through the steps
+    s.observe(applied=True)
+    assert s.estimate_s == pytest.approx(70)
+    assert s.summary()["attempted"] == 2
@@ -0,0 +1,49 @@
+import pytest
+
+from fakes import make_job
+
+from jobpilot.services.llm_async import score_llm_concurrently
+from jobpilot.services.matcher import JobMatcher
+from jobpilot.services.score_cache import ScoreCache, cache_key
+
+from fake_openai_server import FakeOpenAIServer
+
+pytest.importorskip("openai")
+
+
+def test_cache_key_ignores_whitespace_and_case_but_not_model():
+    a = cache_key("m1", "1", "resume-sha", "Python  Selenium\n")
+    assert a == cache_key("m1", "1", "resume-sha", "python selenium")
+    assert a != cache_key("m2", "1", "resume-sha", "python selenium")
+    assert a != cache_key("m1", "2", "resume-sha", "python selenium")
+
+
+def test_lru_eviction_and_stats(tmp_path):
+    cache = ScoreCache(str(tmp_path / "cache.sqlite3"), max_entries=2)
+    result = JobMatcher("python", use_llm=False)._score_naive(make_job("a"), "python")
+    cache.put("k1", result)
+    cache.put("k2", result)
+    assert cache.get("k1", make_job("a")) is not None  # k1 now most recent
+    cache.put("k3", result)
+
+    assert cache.get("k2", make_job("b")) is None
+    assert cache.get("k3", make_job("c")).job_id == "c"
+    assert cache.stats() == {"hits": 2, "misses": 1, "hit_rate": 0.667, "evictions": 1, "size": 2}
+
+
+def test_reposted_job_scores_from_cache_across_runs(tmp_path, monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "fake-key")
+    path = str(tmp_path / "cache.sqlite3")
+
+    with FakeOpenAIServer() as server:
+        monkeypatch.setenv("OPENAI_BASE_URL", server.base_url)
+        # Same text under two URLs in one batch: one model call
+        first = JobMatcher("python selenium", score_cache=ScoreCache(path))
+        score_llm_concurrently(first, [make_job("a"), make_job("b")], ["Python QA role"] * 2, concurrency=2)
+        assert server.requests == 1
+
+        # "Rerun after a crash": new matcher, same cache file, sync path
+        second = JobMatcher("python selenium", score_cache=ScoreCache(path))
+        result = second._score_with_llm(make_job("c"), "python   QA role")
+        assert server.requests == 1
+        assert result.job_id == "c" and result.reasons.endswith("[cached]")
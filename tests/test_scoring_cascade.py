@@ -0,0 +1,39 @@
+import pytest
+
+from fakes import make_job
+
+from jobpilot.services.matcher import JobMatcher
+
+
+def test_cascade_only_sends_ambiguous_jobs_to_llm(monkeypatch):
+    matcher = JobMatcher(
+        "python selenium pytest sql",
+        use_llm=False,
+        cascade={"reject_below": 20, "accept_above": 80},
+    )
+    llm_calls = []
+
+    def fake_llm(job, description):
+        llm_calls.append(job.id)
+        return matcher._score_naive(job, description)
+
+    monkeypatch.setattr(matcher, "_score_with_llm", fake_llm)
+
+    descriptions = {
+        "reject": "nursing patient care",                  # 0%
+        "ambiguous": "python and sql wanted",              # 50%
+        "accept": "python selenium pytest sql",            # 100%
+    }
+    jobs = [make_job(job_id) for job_id in descriptions]
+    results = matcher.top_score_many(jobs, list(descriptions.values()))
+
+    assert llm_calls == ["ambiguous"]
+    assert [r.recommended for r in results] == [False, False, True]
+    assert "LLM skipped" in results[0].reasons and "LLM skipped" in results[2].reasons
+    assert matcher.stats["llm_skipped"] == 2
+    assert matcher.stats["llm_scored"] == 1
+
+
+def test_cascade_bands_must_be_ordered():
+    with pytest.raises(ValueError):
+        JobMatcher("python", use_llm=False, cascade={"reject_below": 50, "accept_above": 40})
@@ -0,0 +1,63 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from jobpilot.services.semantic_index import HashedEmbedder, SemanticIndex, rank
+
+POSTINGS = {
+    "dice:qa1": "Senior SDET: Python test automation with Selenium and pytest, CI/CD in Jenkins",
+    "dice:qa2": "QA automation engineer, Selenium WebDriver and Python, automated regression suites",
+    "dice:fe1": "Frontend developer: React, TypeScript, CSS, design systems and accessibility",
+    "dice:nurse": "Registered nurse for ICU night shifts, BLS and ACLS certification required",
+}
+
+
+def test_embeddings_are_normalised_and_deterministic():
+    embedder = HashedEmbedder(dim=256)
+    matrix = embedder.embed_many(list(POSTINGS.values()) + [""])
+
+    assert matrix.shape == (5, 256) and matrix.dtype == np.float32
+    assert np.allclose(np.linalg.norm(matrix[:4], axis=1), 1.0, atol=1e-5)
+    assert not matrix[4].any()
+    assert np.array_equal(embedder.embed(POSTINGS["dice:qa1"]), matrix[0])
+
+
+def test_rank_puts_related_postings_first():
+    embedder = HashedEmbedder()
+    keys = list(POSTINGS)
+    scores, order = rank(embedder.embed_many(list(POSTINGS.values())),
+                         embedder.embed("Automation tester: Selenium, pytest, Python"))
+
+    assert {keys[order[0]], keys[order[1]]} == {"dice:qa1", "dice:qa2"}
+    # Unrelated postings land near zero (hash collisions only)
+    assert scores[order[1]] > 0.25 and max(scores[order[2]], scores[order[3]]) < 0.15
+
+
+def test_index_persists_and_finds_similar(tmp_path):
+    embedder = HashedEmbedder(dim=128)
+    index = SemanticIndex(str(tmp_path), embedder)
+    keys = list(POSTINGS)
+    index.add_many(keys, embedder.embed_many(list(POSTINGS.values())), [{"title": k} for k in keys])
+    index.flush()
+
+    reopened = SemanticIndex(str(tmp_path), HashedEmbedder(dim=128))
+    assert len(reopened) == 4
+    neighbours = reopened.similar_to("dice:qa1", k=2)
+    assert [key for key, _, _ in neighbours][0] == "dice:qa2"
+    assert "dice:qa1" not in [key for key, _, _ in neighbours]
+    assert neighbours[0][2]["title"] == "dice:qa2"
+
+    # Growing past the initial capacity keeps existing rows intact
+    before = reopened.vector("dice:nurse")
+    extra = [f"dice:x{i}" for i in range(300)]
+    reopened.add_many(extra, embedder.embed_many([f"posting number {i}" for i in range(300)]))
+    assert len(reopened) == 304
+    assert np.array_equal(reopened.vector("dice:nurse"), before)
+
+
+def test_changed_embedder_starts_fresh(tmp_path):
+    index = SemanticIndex(str(tmp_path), HashedEmbedder(dim=64))
+    index.add("dice:qa1", POSTINGS["dice:qa1"])
+    index.flush()
+
+    assert len(SemanticIndex(str(tmp_path), HashedEmbedder(dim=128))) == 0
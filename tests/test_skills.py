@@ -0,0 +1,74 @@
+import pytest
+
+from jobpilot.models.job import JobPosting
+from jobpilot.services.matcher import JobMatcher
+from jobpilot.services.skills import DEFAULT_SKILLS_PATH, AhoCorasick, SkillExtractor
+
+SKILLS = {
+    "python": ["python", "python3"],
+    "java": [],
+    "javascript": ["javascript", "js"],
+    "test automation": ["test automation", "automated testing", "qa automation"],
+    "ci/cd": ["ci/cd", "continuous integration"],
+    "c++": ["c++", "cpp"],
+    "kubernetes": ["kubernetes", "k8s"],
+}
+
+JOB = JobPosting(id="1", title="SDET", company="Acme", location="", url="u",
+                 provider="dice", easy_apply=True, metadata={})
+
+
+def test_overlapping_patterns_all_reported():
+    ac = AhoCorasick([("he", 0), ("she", 1), ("hers", 2), ("his", 3)])
+    found = sorted((s, e, p) for s, e, p in ac.iter_matches("ushers his"))
+    # "she"/"he" end inside "ushers" (no word boundary); "his" stands alone
+    assert found == [(7, 10, 3)]
+    # Nested word-bounded patterns are all reported
+    ac = AhoCorasick([("test", 0), ("test automation", 1), ("automation", 2)])
+    assert sorted(ac.iter_matches("test automation")) == [(0, 4, 0), (0, 15, 1), (5, 15, 2)]
+
+
+def test_extracts_synonyms_multiword_and_punctuation():
+    extractor = SkillExtractor(SKILLS)
+    text = "Automated   Testing in Python3 and C++; CI/CD via continuous integration on K8s. JavaScript a plus."
+    assert extractor.extract(text) == {"test automation", "python", "c++", "ci/cd", "kubernetes", "javascript"}
+    # Word boundaries: "java" doesn't fire inside "javascript"
+    assert "java" not in extractor.extract("javascript")
+
+
+def test_skills_strategy_and_prefilter():
+    extractor = SkillExtractor(SKILLS)
+    matcher = JobMatcher(
+        "Python test automation with k8s",
+        use_llm=False,
+        cheap_strategy="skills",
+        skill_extractor=extractor,
+        skill_prefilter_min=1,
+    )
+
+    result = matcher.score_cheap(JOB, "Python, Java and Kubernetes")
+    assert result.match_percent == pytest.approx(66.7)
+
+    rejected = matcher.top_score(JOB, "Java and C++ only")
+    assert not rejected.recommended and "PREFILTER" in rejected.reasons
+    assert matcher.stats["prefilter_reject"] == 1
+    # Nothing recognisable: not rejected by the pre-filter
+    assert "PREFILTER" not in matcher.top_score(JOB, "Great team, remote").reasons
+
+
+def test_skills_strategy_needs_an_extractor():
+    with pytest.raises(ValueError):
+        JobMatcher("python", use_llm=False, cheap_strategy="skills")
+
+
+def test_ordinary_english_is_not_a_skill():
+    extractor = SkillExtractor.load(DEFAULT_SKILLS_PATH)
+    prose = (
+        "We go above and beyond, without further ado. Ready to react quickly. "
+        "Spring 2025 start; you will spring into action."
+    )
+    assert extractor.extract(prose) == frozenset()
+    # The canonical name is an id once synonyms are listed
+    assert extractor.extract("Golang, ReactJS and Spring Boot; VSTS pipelines") == {
+        "go", "react", "spring", "azure devops",
+    }
@@ -0,0 +1,49 @@
+import pytest
+
+from fakes import make_job
+
+from jobpilot.storage.repo import JobRepo
+from jobpilot.storage.sinks import CsvSink, FanOutSink, JsonlSink, SqliteSink, build_sink
+
+
+@pytest.mark.parametrize("sink_cls", [JsonlSink, CsvSink, SqliteSink])
+def test_local_sink_round_trip_survives_reopen(tmp_path, sink_cls):
+    repo = JobRepo(sink=sink_cls(base_dir=str(tmp_path)))
+    row_map = repo.save_jobs("dice", [make_job("a1"), make_job("b2")])
+    assert set(row_map) == {"a1", "b2"}
+
+    repo.update_job_status(make_job("b2"), match_percent=81.0, applied="Yes", row_idx=row_map["b2"])
+    # lookup by id when the caller has no row index
+    repo.update_job_status(make_job("a1"), notes="match below threshold")
+
+    reopened = JobRepo(sink=sink_cls(base_dir=str(tmp_path)))
+    existing = reopened.get_existing_jobs_id("dice")
+    assert set(existing) == {"a1", "b2"}
+    assert reopened.was_already_applied("dice", "b2")
+    assert not reopened.was_already_applied("dice", "a1")
+
+    _, a1_row = existing["a1"]
+    assert a1_row[reopened.sink.headers("dice").index("application_status_notes")] == "match below threshold"
+
+
+def test_fanout_writes_everywhere_and_reads_primary(tmp_path):
+    primary = JsonlSink(base_dir=str(tmp_path / "primary"))
+    secondary = SqliteSink(base_dir=str(tmp_path / "secondary"))
+    # Secondary already holds a row, so its row indexes differ from the primary's
+    secondary.save_jobs("dice", [make_job("old")])
+
+    repo = JobRepo(sink=FanOutSink([primary, secondary]))
+    row_map = repo.save_jobs("dice", [make_job("new")])
+    repo.update_job_status(make_job("new"), applied="Yes", row_idx=row_map["new"])
+
+    assert set(repo.get_existing_jobs_id("dice")) == {"new"}
+    assert JobRepo(sink=secondary).was_already_applied("dice", "new")
+
+
+def test_build_sink_env_override(tmp_path, monkeypatch):
+    monkeypatch.setenv("JOBPILOT_SINKS", "jsonl,csv")
+    sink = build_sink({"sinks": ["sheets"], "dir": str(tmp_path)})
+    assert isinstance(sink, FanOutSink)
+    assert [s.name for s in sink.sinks] == ["jsonl", "csv"]
+    # Nothing is created until the first write
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,115 @@
+from selenium.common.exceptions import NoSuchWindowException, WebDriverException
+
+from jobpilot.browser.tabs import TabManager
+
+
+class FakeSwitch:
+    def __init__(self, driver):
+        self.driver = driver
+
+    def window(self, handle):
+        self.driver.switch_calls += 1
+        if handle not in self.driver.urls:
+            raise NoSuchWindowException(handle)
+        self.driver.current_window_handle = handle
+
+
+class FakeDriver:
+    """Windows are handle -> url; window.open and location.href are interpreted."""
+
+    def __init__(self):
+        self.urls = {"home": "https://www.dice.com/jobs"}
+        self.current_window_handle = "home"
+        self.switch_to = FakeSwitch(self)
+        self.switch_calls = 0
+        self.opened = 0
+        self.crashed = set()
+
+    @property
+    def window_handles(self):
+        return list(self.urls)
+
+    @property
+    def current_url(self):
+        return self.urls[self.current_window_handle]
+
+    def execute_script(self, script, *args):
+        if self.current_window_handle in self.crashed:
+            raise WebDriverException("tab crashed")
+        if script.startswith("window.open"):
+            self.opened += 1
+            self.urls[f"tab{self.opened}"] = args[0]
+        elif "location.href" in script:
+            self.urls[self.current_window_handle] = args[0]
+
+    def get(self, url):
+        self.urls[self.current_window_handle] = url
+
+    def close(self):
+        del self.urls[self.current_window_handle]
+
+
+def test_apply_tabs_are_reused_in_place():
+    driver = FakeDriver()
+    tabs = TabManager(driver)
+
+    a = tabs.load("apply", "https://x/a")
+    b = tabs.load("apply", "https://x/b")   # a still busy: second tab
+    assert a != b and driver.opened == 2
+    tabs.release(a)
+    c = tabs.load("apply", "https://x/c")
+    assert c == a and driver.urls[a] == "https://x/c"
+    tabs.wait_navigated(c)                  # already left https://x/a
+
+    tabs.release(b)
+    tabs.release(c)
+    for job in "defg":
+        h = tabs.load("apply", f"https://x/{job}")
+        tabs.release(h)
+    summary = tabs.summary()
+    assert summary["created"] == 2 and summary["reused"] == 5 and summary["closed"] == 0
+    assert driver.opened == 2
+
+
+def test_focus_skips_redundant_switches():
+    driver = FakeDriver()
+    tabs = TabManager(driver)
+    h = tabs.load("describe", "https://x/a", background=False)
+    assert driver.current_window_handle == h and driver.urls[h] == "https://x/a"
+    calls = driver.switch_calls
+    for _ in range(3):
+        tabs.focus(h)
+    assert driver.switch_calls == calls
+    tabs.release(h)
+    assert tabs.load("describe", "https://x/b", background=False) == h
+    assert driver.switch_calls == calls
+
+
+def test_broken_tabs_are_replaced():
+    driver = FakeDriver()
+    tabs = TabManager(driver)
+    a = tabs.load("apply", "https://x/a")
+    tabs.release(a)
+    b = tabs.load("apply", "https://x/b")
+    tabs.release(b)
+
+    driver.crashed.add(a)
+    c = tabs.load("apply", "https://x/c")
+    assert c != a and a not in driver.urls and driver.urls[c] == "https://x/c"
+    tabs.release(c)
+
+    del driver.urls[c]                      # closed by hand
+    d = tabs.load("apply", "https://x/d")
+    assert d not in (a, c)
+    assert tabs.summary()["recovered"] == 2
+
+
+def test_without_reuse_each_job_gets_a_fresh_tab():
+    driver = FakeDriver()
+    tabs = TabManager(driver, reuse=False)
+    for job in "abc":
+        h = tabs.load("apply", f"https://x/{job}")
+        tabs.release(h)
+    assert driver.window_handles == ["home"]
+    assert driver.current_window_handle == "home"
+    assert tabs.summary()["created"] == 3 and tabs.summary()["closed"] == 3